@@ -0,0 +1,160 @@
+"""Micro-batching of small, independent LLM tasks.
+
+Short prompts such as keyword extraction or title generation are dominated by
+round-trip and per-request overhead. When several arrive within a short window
+(e.g. a user uploaded several job descriptions and the pipeline runs for each),
+a `MicroBatcher` merges the pending tasks of one kind into a single prompt that
+asks for an indexed JSON response, then fans each result back out to its
+caller. Items missing from the batched response, or failing validation, are
+retried as individual calls; a lone task skips batching entirely.
+
+A batch is shared by callers with different request deadlines, so it runs in
+a fresh context (outside any deadline) and each caller waits for its own
+result only until its own deadline.
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+from app import deadline
+from app.config import settings
+from app.llm import complete_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_batching_stats: dict[str, dict[str, int]] = {}
+
+
+class MicroBatcher(Generic[T]):
+    """Groups tasks of one kind submitted within `window` seconds into one LLM call.
+
+    Args:
+        name: Task kind, used for metrics and logs.
+        build_prompt: Builds `(system_prompt, prompt)` for a list of items. The
+            prompt must ask for `{"results": [{"index": i, ...}, ...]}`.
+        parse_result: Turns one entry of `results` into the task's return
+            value; raises (e.g. `ValueError`, `ValidationError`) if invalid.
+        single: Runs one item on its own (used for lone items and fallbacks).
+        max_tokens_per_item: Output tokens reserved per batched item.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        build_prompt: Callable[[list[Any]], tuple[str, str]],
+        parse_result: Callable[[dict[str, Any]], T],
+        single: Callable[[Any], Awaitable[T]],
+        max_tokens_per_item: int,
+        window: float | None = None,
+        max_size: int | None = None,
+    ):
+        self.name = name
+        self._build_prompt = build_prompt
+        self._parse_result = parse_result
+        self._single = single
+        self.max_tokens_per_item = max_tokens_per_item
+        self.window = window if window is not None else settings.llm_batch_window_ms / 1000
+        self.max_size = max_size if max_size is not None else settings.llm_batch_max_size
+        self._pending: dict[Any, list[tuple[Any, asyncio.Future]]] = {}
+
+    async def submit(self, item: Any, key: Any = None) -> T:
+        """Queue `item` (batched only with items of the same `key`) and await its result."""
+        if not settings.llm_batching_enabled or self.max_size < 2:
+            return await self._single(item)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            asyncio.create_task(self._flush_after(key, batch), context=contextvars.Context())
+        batch.append((item, future))
+        if len(batch) >= self.max_size:
+            self._pending.pop(key, None)
+            asyncio.create_task(self._run(batch), context=contextvars.Context())
+        try:
+            # Cancels `future` on timeout, so the batch skips this caller's item.
+            return await asyncio.wait_for(future, deadline.remaining())
+        except TimeoutError as e:
+            if not future.cancelled():
+                raise
+            raise deadline.DeadlineExceededError("Request deadline exceeded") from e
+
+    async def _flush_after(self, key: Any, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        await asyncio.sleep(self.window)
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+            await self._run(batch)
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        stats = _batching_stats.setdefault(
+            self.name, {"batches": 0, "batched_items": 0, "single_calls": 0, "fallbacks": 0}
+        )
+        stats[stat] += amount
+
+    async def _run_single(self, item: Any, future: asyncio.Future) -> None:
+        self._count("single_calls")
+        try:
+            result = await self._single(item)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        if len(batch) == 1:
+            await self._run_single(*batch[0])
+            return
+
+        self._count("batches")
+        self._count("batched_items", len(batch))
+        items = [item for item, _ in batch]
+        system_prompt, prompt = self._build_prompt(items)
+        try:
+            response = await complete_json(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=self.max_tokens_per_item * len(items) + 256,
+                retries=0,
+            )
+            entries = response.get("results") if isinstance(response, dict) else None
+            by_index = {
+                entry.get("index"): entry for entry in entries or [] if isinstance(entry, dict)
+            }
+        except Exception as e:
+            logger.warning("Batched %s call failed, running items individually: %s", self.name, e)
+            by_index = {}
+
+        fallbacks: list[Awaitable[None]] = []
+        for index, (item, future) in enumerate(batch):
+            if future.done():  # caller went away
+                continue
+            entry = by_index.get(index)
+            try:
+                if entry is None:
+                    raise ValueError("missing from batched response")
+                future.set_result(self._parse_result(entry))
+            except Exception as e:
+                logger.info("Batched %s item %d invalid (%s); retrying alone", self.name, index, e)
+                self._count("fallbacks")
+                fallbacks.append(self._run_single(item, future))
+        if fallbacks:
+            await asyncio.gather(*fallbacks)
+
+
+def get_batching_stats() -> dict[str, dict[str, Any]]:
+    """Per task kind: batches sent, average batch size, single calls and fallbacks."""
+    return {
+        name: {
+            **stats,
+            "avg_batch_size": (
+                round(stats["batched_items"] / stats["batches"], 2) if stats["batches"] else 0.0
+            ),
+        }
+        for name, stats in _batching_stats.items()
+    }
@@ -0,0 +1,167 @@
+"""Per-provider/model circuit breaker for LLM calls.
+
+While a provider is down every request would otherwise sit through the full
+retry loop and timeouts. The breaker tracks recent outcomes per
+``provider:model`` and opens when the error or timeout rate crosses a
+threshold; while open, calls fail fast with ``CircuitOpenError`` (or are
+routed to a fallback model by the LLM layer). After a cooldown a single trial
+call is let through (half-open) to decide whether to close again.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(
+            f"LLM provider {key} is temporarily unavailable after repeated failures. "
+            f"Please try again in {max(1, round(retry_after))} seconds."
+        )
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by error and timeout rates."""
+
+    def __init__(
+        self,
+        key: str,
+        window: float | None = None,
+        min_calls: int | None = None,
+        error_rate: float | None = None,
+        timeout_rate: float | None = None,
+        cooldown: float | None = None,
+    ):
+        self.key = key
+        self.window = window if window is not None else settings.llm_breaker_window
+        self.min_calls = min_calls if min_calls is not None else settings.llm_breaker_min_calls
+        self.error_rate = error_rate if error_rate is not None else settings.llm_breaker_error_rate
+        self.timeout_rate = (
+            timeout_rate if timeout_rate is not None else settings.llm_breaker_timeout_rate
+        )
+        self.cooldown = cooldown if cooldown is not None else settings.llm_breaker_cooldown
+        self.state = CLOSED
+        self._outcomes: deque[tuple[float, str]] = deque()
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._times_opened = 0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit allows a trial call."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return whether a call may proceed, moving open -> half-open after cooldown."""
+        with self._lock:
+            if self.state == OPEN and self.retry_after() == 0.0:
+                self.state = HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._trial_in_flight = False
+        self._times_opened += 1
+        logger.warning("Circuit opened for %s", self.key)
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                logger.info("Circuit closed for %s", self.key)
+                self.state = CLOSED
+                self._outcomes.clear()
+                self._trial_in_flight = False
+            self._outcomes.append((now, "ok"))
+            self._prune(now)
+
+    def record_failure(self, timeout: bool = False) -> None:
+        """Record a failed call; `timeout` marks deadline failures separately."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                self._open(now)
+                return
+            self._outcomes.append((now, "timeout" if timeout else "error"))
+            self._prune(now)
+            if self.state != CLOSED or len(self._outcomes) < self.min_calls:
+                return
+            total = len(self._outcomes)
+            timeouts = sum(1 for _, outcome in self._outcomes if outcome == "timeout")
+            errors = sum(1 for _, outcome in self._outcomes if outcome != "ok")
+            if errors / total >= self.error_rate or timeouts / total >= self.timeout_rate:
+                self._open(now)
+
+    def release_trial(self) -> None:
+        """Free the half-open trial slot of a call that ended without an outcome.
+
+        A cancelled trial call (or one given up before it was sent) says
+        nothing about the provider; the next call becomes the trial instead.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._trial_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current state and windowed counters."""
+        with self._lock:
+            self._prune(time.monotonic())
+            outcomes = [outcome for _, outcome in self._outcomes]
+            return {
+                "state": self.state,
+                "calls": len(outcomes),
+                "errors": sum(1 for o in outcomes if o == "error"),
+                "timeouts": sum(1 for o in outcomes if o == "timeout"),
+                "retry_after": round(self.retry_after(), 1),
+                "times_opened": self._times_opened,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(provider: str, model: str) -> CircuitBreaker:
+    """Return the breaker for a provider/model pair, creating it on first use."""
+    key = f"{provider}:{model}"
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(key)
+        return breaker
+
+
+def get_circuit_states() -> dict[str, dict[str, Any]]:
+    """Snapshot of every breaker seen so far, keyed by ``provider:model``."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.key: breaker.snapshot() for breaker in breakers}
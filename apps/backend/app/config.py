@@ -1,12 +1,14 @@
 """Application configuration using pydantic-settings."""
 
 import json
+import logging
 from pathlib import Path
 from typing import Any, Literal
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
 
 # Path to config file for API key persistence
 CONFIG_FILE_PATH = Path(__file__).parent.parent / "data" / "config.json"
@@ -121,11 +123,16 @@ class Settings(BaseSettings):
 
     # LLM Configuration
     llm_provider: Literal[
-        "openai", "anthropic", "openrouter", "gemini", "deepseek", "ollama"
+        "openai", "anthropic", "openrouter", "gemini", "deepseek", "ollama", "mock"
     ] = "openai"
     llm_model: str = "gpt-5-nano-2025-08-07"
     llm_api_key: str = ""
     llm_api_base: str | None = None  # For Ollama or custom endpoints
+    llm_api_keys: list[str] = []  # Extra keys for LLM_PROVIDER (JSON list); see key pool
+
+    # API key pool (used when a provider has two or more keys)
+    llm_key_selection: Literal["least_loaded", "round_robin"] = "least_loaded"
+    llm_key_cooldown: float = 60.0  # Seconds a rate-limited key is skipped (no Retry-After)
 
     @field_validator("llm_provider", mode="before")
     @classmethod
@@ -135,6 +142,101 @@ class Settings(BaseSettings):
             return "openai"
         return v
 
+    # LLM health probing (background prober feeding /health endpoints)
+    llm_health_probe_enabled: bool = True
+    llm_health_interval: float = 300.0  # Seconds between probes when healthy
+    llm_health_jitter: float = 0.1  # +/- fraction of the interval
+    llm_health_max_backoff: float = 1800.0  # Max seconds between probes when failing
+
+    # LLM HTTP connection pool (one long-lived client per provider)
+    llm_http_max_connections: int = 20
+    llm_http_max_keepalive: int = 10
+    llm_http_keepalive_expiry: float = 120.0  # Seconds an idle connection stays open
+    llm_http2: bool = False  # Requires the optional `h2` package
+
+    # Send Pydantic-derived JSON Schemas as `json_schema` response formats
+    llm_structured_outputs: bool = True
+
+    # Token budgets: max_tokens sized from the expected output, inputs truncated
+    # only when the prompt would overflow the model's context window
+    llm_output_token_ratio: float = 1.5  # Output tokens per token of the content rewritten
+    llm_translated_output_token_ratio: float = 2.5  # ...when writing in another language
+    llm_output_token_headroom: int = 512
+    llm_min_output_tokens: int = 2048
+    llm_context_safety_margin: int = 512  # Context tokens left unused
+    llm_default_context_window: int = 8192  # For models LiteLLM has no data for
+
+    # Micro-batching of small LLM tasks (keywords, titles) arriving together
+    llm_batching_enabled: bool = True
+    llm_batch_window_ms: float = 50.0  # How long the first task waits for others
+    llm_batch_max_size: int = 8  # Tasks per batched prompt
+
+    # LLM circuit breaker (per provider/model, over a sliding window of calls)
+    llm_breaker_enabled: bool = True
+    llm_breaker_window: float = 60.0  # Seconds of call history considered
+    llm_breaker_min_calls: int = 5  # Calls in the window before the breaker can trip
+    llm_breaker_error_rate: float = 0.5  # Trip when this fraction of calls fail
+    llm_breaker_timeout_rate: float = 0.3  # ...or this fraction time out
+    llm_breaker_cooldown: float = 30.0  # Seconds open before a half-open trial call
+    llm_fallback_model: str | None = None  # Same-provider model used while open
+
+    # LLM retries (exponential backoff with full jitter, capped by a retry budget)
+    llm_retry_base_delay: float = 0.5  # Seconds; doubles per attempt
+    llm_retry_max_delay: float = 20.0  # Seconds; also caps honoured Retry-After
+    llm_retry_budget_ratio: float = 0.2  # Retries allowed per call in the window
+    llm_retry_budget_min: int = 3  # Retries always allowed per window
+    llm_retry_budget_window: float = 60.0  # Seconds
+
+    # Adaptive LLM timeouts from observed latency (p99 x safety factor, clamped)
+    llm_adaptive_timeouts: bool = True
+    llm_latency_window: int = 200  # Recent calls kept per model/operation
+    llm_latency_min_samples: int = 20  # Static timeouts are used until this many
+    llm_timeout_safety_factor: float = 3.0
+    llm_timeout_floor: float = 10.0  # Seconds
+    llm_timeout_ceiling: float = 600.0  # Seconds
+
+    # Ollama (LLM_PROVIDER=ollama) is called natively; see app/ollama.py
+    ollama_keep_alive: str = "30m"  # Duration or seconds the model stays loaded (-1 = forever)
+    ollama_num_ctx_min: int = 4096  # Smallest context window requested
+    ollama_num_ctx_step: int = 4096  # num_ctx is rounded up to a multiple of this
+    ollama_num_ctx_max: int = 32768
+    ollama_max_concurrency: int = 1  # Concurrent calls per loaded model
+    ollama_cold_load_threshold: float = 0.5  # Seconds of load_duration counted as a cold load
+
+    # Mock LLM provider (LLM_PROVIDER=mock) for load tests and offline development
+    mock_llm_latency_ms: float = 300.0  # Median base latency per call
+    mock_llm_latency_sigma: float = 0.5  # Lognormal spread of the base latency
+    mock_llm_tokens_per_second: float = 200.0  # Output token rate (0 = instant)
+    mock_llm_error_rate: float = 0.0  # Fraction of calls failing with a 503-style error
+    mock_llm_timeout_rate: float = 0.0  # Fraction of calls hanging until their timeout
+    mock_llm_seed: int = 0
+
+    # Background tasks (POST /resumes/improve/async etc.; see app/tasks.py)
+    task_workers: int = 2  # Tasks run concurrently; the rest wait in the queue
+    task_queue_max: int = 100  # Waiting tasks before submissions are rejected (503)
+    task_ttl_seconds: int = 86400  # Finished tasks (and their results) are kept this long
+
+    # Tailoring previews are stored server-side until confirmed or expired
+    preview_ttl_seconds: int = 3600
+    # Jobs tailored concurrently by POST /resumes/{id}/improve/batch
+    improve_batch_concurrency: int = 4
+    # Improve resumes section by section in concurrent calls (see improver.py)
+    improve_by_section: bool = False
+    # Stage outputs of a failed tailoring run are kept so a retry resumes (0 = off)
+    checkpoint_ttl_seconds: int = 86400
+    # Deadline for /improve and /improve/preview (0 = none); the X-Request-Deadline
+    # header overrides it per request. See app/deadline.py.
+    request_deadline_seconds: float = 0.0
+    deadline_min_call_seconds: float = 15.0  # Assumed LLM call time until latency is observed
+    # Preview results are reused for identical tailoring inputs (0 = off)
+    tailoring_cache_ttl_seconds: int = 7 * 86400
+    # Extract job keywords and the title in the background on job upload (app/prefetch.py)
+    job_prefetch_enabled: bool = True
+
+    # Import litellm/markitdown/playwright in a background thread after startup
+    # (they are otherwise imported on first use)
+    warm_imports: bool = True
+
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
@@ -170,3 +272,16 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
+
+
+def get_content_language() -> str:
+    """Get the content language from the stored config, defaulting to "en"."""
+    config_path = settings.config_path
+    try:
+        if config_path.exists():
+            config = json.loads(config_path.read_text())
+            # Use content_language, fall back to legacy 'language' field, then default to 'en'
+            return config.get("content_language", config.get("language", "en"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Failed to read content language from config: %s", e)
+    return "en"
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -47,6 +47,26 @@ class Database:
         """Improvement results table."""
         return self.db.table("improvements")
 
+    @property
+    def previews(self) -> Table:
+        """Tailoring previews awaiting confirmation."""
+        return self.db.table("previews")
+
+    @property
+    def tasks(self) -> Table:
+        """Background tasks table."""
+        return self.db.table("tasks")
+
+    @property
+    def checkpoints(self) -> Table:
+        """Pipeline stage outputs, keyed by a hash of their inputs."""
+        return self.db.table("checkpoints")
+
+    @property
+    def tailoring_cache(self) -> Table:
+        """Tailoring preview results, keyed by a hash of their inputs."""
+        return self.db.table("tailoring_cache")
+
     def close(self) -> None:
         """Close database connection."""
         if self._db is not None:
@@ -66,10 +86,16 @@ class Database:
         cover_letter: str | None = None,
         outreach_message: str | None = None,
         title: str | None = None,
+        parent_sections: dict[str, str] | None = None,
+        tailored_sections: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Create a new resume entry.
 
         processing_status: "pending", "processing", "ready", "failed"
+        parent_sections: section digests of the parent a tailored resume was
+        tailored from (see `section_digests`)
+        tailored_sections: section digests of the tailored content as written,
+        to tell the user's later edits apart from it
         """
         resume_id = str(uuid4())
         now = datetime.now(timezone.utc).isoformat()
@@ -86,6 +112,8 @@ class Database:
             "cover_letter": cover_letter,
             "outreach_message": outreach_message,
             "title": title,
+            "parent_sections": parent_sections,
+            "tailored_sections": tailored_sections,
             "created_at": now,
             "updated_at": now,
         }
@@ -162,12 +190,17 @@ class Database:
         if not result:
             raise ValueError(f"Resume disappeared after update: {resume_id}")
 
+        if result.get("is_master") and updates.keys() & {"content", "processed_data"}:
+            self.invalidate_tailoring_cache()
+
         return result
 
     def delete_resume(self, resume_id: str) -> bool:
         """Delete resume by ID."""
         Resume = Query()
         removed = self.resumes.remove(Resume.resume_id == resume_id)
+        if any(resume.get("is_master") for resume in removed):
+            self.invalidate_tailoring_cache()
         return len(removed) > 0
 
     def list_resumes(self) -> list[dict[str, Any]]:
@@ -193,6 +226,7 @@ class Database:
         updated = self.resumes.update(
             {"is_master": True}, Resume.resume_id == resume_id
         )
+        self.invalidate_tailoring_cache()
         return len(updated) > 0
 
     # Job operations
@@ -231,6 +265,7 @@ class Database:
         tailored_resume_id: str,
         job_id: str,
         improvements: list[dict[str, Any]],
+        prompt_id: str | None = None,
     ) -> dict[str, Any]:
         """Create an improvement result entry."""
         request_id = str(uuid4())
@@ -242,6 +277,7 @@ class Database:
             "tailored_resume_id": tailored_resume_id,
             "job_id": job_id,
             "improvements": improvements,
+            "prompt_id": prompt_id,
             "created_at": now,
         }
         self.improvements.insert(doc)
@@ -261,6 +297,190 @@ class Database:
         )
         return result[0] if result else None
 
+    # Preview operations
+    def create_preview(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Store a tailoring preview that expires after PREVIEW_TTL_SECONDS.
+
+        Expired previews are purged on each insert.
+        """
+        preview_id = str(uuid4())
+        now = datetime.now(timezone.utc)
+
+        doc = {
+            **data,
+            "preview_id": preview_id,
+            "created_at": now.isoformat(),
+            "expires_at": (now + timedelta(seconds=settings.preview_ttl_seconds)).isoformat(),
+        }
+        self.purge_expired_previews()
+        self.previews.insert(doc)
+        return doc
+
+    def get_preview(self, preview_id: str) -> dict[str, Any] | None:
+        """Get an unexpired preview by ID."""
+        Preview = Query()
+        result = self.previews.search(Preview.preview_id == preview_id)
+        if not result:
+            return None
+        if result[0]["expires_at"] <= datetime.now(timezone.utc).isoformat():
+            return None
+        return result[0]
+
+    def delete_preview(self, preview_id: str) -> bool:
+        """Delete preview by ID."""
+        Preview = Query()
+        removed = self.previews.remove(Preview.preview_id == preview_id)
+        return len(removed) > 0
+
+    def purge_expired_previews(self) -> int:
+        """Delete expired previews; returns how many were removed."""
+        Preview = Query()
+        now = datetime.now(timezone.utc).isoformat()
+        return len(self.previews.remove(Preview.expires_at <= now))
+
+    # Checkpoint operations
+    def get_checkpoint(self, key: str) -> dict[str, Any] | None:
+        """Get an unexpired stage checkpoint by its content key."""
+        Checkpoint = Query()
+        result = self.checkpoints.search(Checkpoint.key == key)
+        if not result:
+            return None
+        if result[0]["expires_at"] <= datetime.now(timezone.utc).isoformat():
+            return None
+        return result[0]
+
+    def save_checkpoint(self, key: str, stage: str, value: Any) -> None:
+        """Store a stage's output for CHECKPOINT_TTL_SECONDS.
+
+        Expired checkpoints are purged on each insert.
+        """
+        Checkpoint = Query()
+        now = datetime.now(timezone.utc)
+        self.purge_expired_checkpoints()
+        self.checkpoints.upsert(
+            {
+                "key": key,
+                "stage": stage,
+                "value": value,
+                "created_at": now.isoformat(),
+                "expires_at": (
+                    now + timedelta(seconds=settings.checkpoint_ttl_seconds)
+                ).isoformat(),
+            },
+            Checkpoint.key == key,
+        )
+
+    def delete_checkpoints(self, keys: list[str]) -> int:
+        """Delete checkpoints by key; returns how many were removed."""
+        Checkpoint = Query()
+        return len(self.checkpoints.remove(Checkpoint.key.one_of(keys)))
+
+    def purge_expired_checkpoints(self) -> int:
+        """Delete expired checkpoints; returns how many were removed."""
+        Checkpoint = Query()
+        now = datetime.now(timezone.utc).isoformat()
+        return len(self.checkpoints.remove(Checkpoint.expires_at <= now))
+
+    # Tailoring cache operations
+    def get_cached_tailoring(self, key: str) -> dict[str, Any] | None:
+        """Get an unexpired cached tailoring result by its content key."""
+        Entry = Query()
+        result = self.tailoring_cache.search(Entry.key == key)
+        if not result:
+            return None
+        if result[0]["expires_at"] <= datetime.now(timezone.utc).isoformat():
+            return None
+        return result[0]
+
+    def save_cached_tailoring(self, key: str, preview: dict[str, Any], data: dict[str, Any]) -> None:
+        """Store a tailoring result for TAILORING_CACHE_TTL_SECONDS.
+
+        `preview` holds the stored preview fields and `data` the response
+        payload. Expired entries are purged on each insert.
+        """
+        Entry = Query()
+        now = datetime.now(timezone.utc)
+        self.purge_expired_tailoring_cache()
+        self.tailoring_cache.upsert(
+            {
+                "key": key,
+                "preview": preview,
+                "data": data,
+                "created_at": now.isoformat(),
+                "expires_at": (
+                    now + timedelta(seconds=settings.tailoring_cache_ttl_seconds)
+                ).isoformat(),
+            },
+            Entry.key == key,
+        )
+
+    def purge_expired_tailoring_cache(self) -> int:
+        """Delete expired cache entries; returns how many were removed."""
+        Entry = Query()
+        now = datetime.now(timezone.utc).isoformat()
+        return len(self.tailoring_cache.remove(Entry.expires_at <= now))
+
+    def invalidate_tailoring_cache(self) -> None:
+        """Drop every cached tailoring result (they all depend on the master resume)."""
+        self.tailoring_cache.truncate()
+
+    # Task operations
+    def create_task(self, kind: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Create a queued background task.
+
+        status: "queued", "running", "succeeded", "failed"
+        Tasks finished more than TASK_TTL_SECONDS ago are purged on each insert.
+        """
+        task_id = str(uuid4())
+        now = datetime.now(timezone.utc).isoformat()
+
+        doc = {
+            "task_id": task_id,
+            "kind": kind,
+            "payload": payload,
+            "status": "queued",
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "updated_at": now,
+        }
+        self.purge_finished_tasks()
+        self.tasks.insert(doc)
+        return doc
+
+    def purge_finished_tasks(self) -> int:
+        """Delete tasks that finished over TASK_TTL_SECONDS ago; returns how many."""
+        Task = Query()
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(seconds=settings.task_ttl_seconds)
+        ).isoformat()
+        return len(
+            self.tasks.remove(Task.finished_at.test(lambda value: bool(value) and value <= cutoff))
+        )
+
+    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        """Get task by ID."""
+        Task = Query()
+        result = self.tasks.search(Task.task_id == task_id)
+        return result[0] if result else None
+
+    def update_task(self, task_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
+        """Update a task by ID."""
+        Task = Query()
+        updates["updated_at"] = datetime.now(timezone.utc).isoformat()
+        updated = self.tasks.update(updates, Task.task_id == task_id)
+        if not updated:
+            return None
+        return self.get_task(task_id)
+
+    def list_tasks(self, statuses: tuple[str, ...]) -> list[dict[str, Any]]:
+        """List tasks whose status is one of `statuses`, oldest first."""
+        Task = Query()
+        tasks = self.tasks.search(Task.status.one_of(list(statuses)))
+        return sorted(tasks, key=lambda task: task.get("created_at", ""))
+
     # Stats
     def get_stats(self) -> dict[str, Any]:
         """Get database statistics."""
@@ -268,6 +488,7 @@ class Database:
             "total_resumes": len(self.resumes),
             "total_jobs": len(self.jobs),
             "total_improvements": len(self.improvements),
+            "total_tasks": len(self.tasks),
             "has_master_resume": self.get_master_resume() is not None,
         }
 
@@ -277,6 +498,10 @@ class Database:
         self.resumes.truncate()
         self.jobs.truncate()
         self.improvements.truncate()
+        self.previews.truncate()
+        self.tasks.truncate()
+        self.checkpoints.truncate()
+        self.tailoring_cache.truncate()
 
         # Clear uploads directory
         uploads_dir = settings.data_dir / "uploads"
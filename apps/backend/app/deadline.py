@@ -0,0 +1,84 @@
+"""Request-level deadlines for multi-call LLM pipelines.
+
+Each LLM call has its own timeout and retries, so a tailoring request that
+chains keyword extraction, the improvement call, refinement passes and
+auxiliary messages has no bound on its total time. An endpoint can open a
+`deadline_scope`; the deadline is held in a context variable, so it follows
+the request into every stage task and LLM call it starts:
+
+- LLM calls are cut off when the deadline passes (their timeout is capped to
+  the time left), and retries whose backoff would overrun it are not made.
+- Optional passes check `allows()` before starting and are dropped when too
+  little time is left; `drop()` records them so the response can say which
+  passes were skipped.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+_dropped: ContextVar[list[str] | None] = ContextVar("deadline_dropped", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """The request deadline passed before an LLM call could finish."""
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """Run the body with a deadline `seconds` from now.
+
+    No deadline is set when `seconds` is None or not positive. A nested scope
+    can only shorten the enclosing deadline.
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    deadline_token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    dropped_token = _dropped.set([])
+    try:
+        yield
+    finally:
+        _dropped.reset(dropped_token)
+        _deadline.reset(deadline_token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check() -> None:
+    """Raise `DeadlineExceededError` if the current deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError("Request deadline exceeded")
+
+
+def allows(seconds: float) -> bool:
+    """Whether at least `seconds` are left (always true without a deadline)."""
+    left = remaining()
+    return left is None or left >= seconds
+
+
+def drop(label: str) -> None:
+    """Record that the pass `label` was skipped to meet the deadline."""
+    dropped = _dropped.get()
+    if dropped is not None and label not in dropped:
+        logger.info("Dropping %s to meet the request deadline", label)
+        dropped.append(label)
+
+
+def dropped_passes() -> list[str]:
+    """Passes dropped in the current deadline scope, in the order they were dropped."""
+    return list(_dropped.get() or [])
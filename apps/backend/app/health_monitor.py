@@ -0,0 +1,121 @@
+"""Background LLM health probing with a cached result.
+
+Health endpoints used to make a real completion call on every request. The
+monitor probes the provider on a configurable interval (with jitter, and with
+exponential backoff while the provider is failing) and serves the last result
+from memory, so liveness/readiness checks cost no tokens and no I/O.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.llm import check_llm_health
+
+logger = logging.getLogger(__name__)
+
+HealthProbe = Callable[[], Awaitable[dict[str, Any]]]
+
+
+class LLMHealthMonitor:
+    """Periodically probes LLM health and caches the latest result."""
+
+    def __init__(
+        self,
+        probe: HealthProbe | None = None,
+        interval: float | None = None,
+        jitter: float | None = None,
+        max_backoff: float | None = None,
+    ):
+        self._probe = probe or check_llm_health
+        self.interval = interval if interval is not None else settings.llm_health_interval
+        self.jitter = jitter if jitter is not None else settings.llm_health_jitter
+        self.max_backoff = (
+            max_backoff if max_backoff is not None else settings.llm_health_max_backoff
+        )
+        self._status: dict[str, Any] | None = None
+        self._checked_at: float | None = None
+        self._consecutive_failures = 0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def status(self) -> dict[str, Any] | None:
+        """Last probe result, or None if no probe has completed yet."""
+        return self._status
+
+    def next_delay(self) -> float:
+        """Seconds until the next probe: interval with jitter, backed off on failures."""
+        delay = self.interval
+        if self._consecutive_failures:
+            delay = min(
+                self.interval * (2 ** self._consecutive_failures), self.max_backoff
+            )
+        spread = delay * self.jitter
+        return max(1.0, delay + random.uniform(-spread, spread))
+
+    def record(self, status: dict[str, Any]) -> None:
+        """Store a health result (from the prober or any other health check)."""
+        self._status = status
+        self._checked_at = time.time()
+        if status.get("healthy"):
+            self._consecutive_failures = 0
+        else:
+            self._consecutive_failures += 1
+
+    async def refresh(self) -> dict[str, Any]:
+        """Run a probe now and cache the result."""
+        async with self._lock:
+            try:
+                status = await self._probe()
+            except Exception:
+                logger.exception("LLM health probe raised an exception")
+                status = {"healthy": False, "error_code": "health_check_failed"}
+            self.record(status)
+            return status
+
+    async def get_status(self) -> dict[str, Any]:
+        """Return the cached status, probing once if nothing is cached yet."""
+        if self._status is None:
+            return await self.refresh()
+        return self._status
+
+    def snapshot(self) -> dict[str, Any]:
+        """Cached status plus probe metadata, without doing any I/O."""
+        return {
+            **(self._status or {"healthy": False, "error_code": "not_checked"}),
+            "checked_at": self._checked_at,
+            "age_seconds": (
+                round(time.time() - self._checked_at, 1) if self._checked_at else None
+            ),
+            "consecutive_failures": self._consecutive_failures,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.next_delay())
+
+    def start(self) -> None:
+        """Start background probing (no-op if disabled or already running)."""
+        if not settings.llm_health_probe_enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background probing."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Global monitor instance
+health_monitor = LLMHealthMonitor()
@@ -0,0 +1,150 @@
+"""Pools of API keys per provider, with load spreading and rate-limit cooldown.
+
+A single key caps throughput at that key's RPM/TPM limits, and one 429 stalls
+every user. When several keys are configured for a provider (``LLM_API_KEYS``
+or ``api_key_pool`` in config.json), each LLM call takes a key from the pool:
+the least-loaded one (fewest in-flight calls) or the next one round-robin.
+A key that gets rate limited is cooled down for the provider's ``Retry-After``
+(or ``LLM_KEY_COOLDOWN``) and skipped until then; the LLM layer immediately
+retries the call on another key.
+"""
+
+import threading
+import time
+from typing import Any
+
+from app.config import settings
+
+
+def key_id(key: str) -> str:
+    """Non-secret identifier for a key in logs and metrics."""
+    return f"...{key[-4:]}" if len(key) > 8 else "*" * len(key)
+
+
+class KeyPool:
+    """API keys for one provider and their load, usage and cooldown state."""
+
+    def __init__(self, provider: str, keys: list[str], strategy: str | None = None):
+        self.provider = provider
+        self.strategy = strategy or settings.llm_key_selection
+        self._keys: list[str] = []
+        self._state: dict[str, dict[str, Any]] = {}
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self.set_keys(keys)
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._keys)
+
+    def set_keys(self, keys: list[str]) -> None:
+        """Replace the pool's keys, keeping state for keys that remain."""
+        with self._lock:
+            self._keys = list(dict.fromkeys(k for k in keys if k))
+            self._state = {
+                key: self._state.get(key)
+                or {
+                    "in_flight": 0,
+                    "requests": 0,
+                    "errors": 0,
+                    "rate_limited": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "cooldown_until": 0.0,
+                }
+                for key in self._keys
+            }
+            self._cursor %= max(1, len(self._keys))
+
+    def acquire(self, exclude: set[str] | None = None) -> str | None:
+        """Take a key for one call (release it with `release`).
+
+        Keys in `exclude` or cooling down are skipped; if every key is cooling
+        down, the one that becomes available first is used. Returns None if
+        the pool has no keys left to try.
+        """
+        with self._lock:
+            candidates = [k for k in self._keys if not exclude or k not in exclude]
+            if not candidates:
+                return None
+            now = time.monotonic()
+            ready = [k for k in candidates if self._state[k]["cooldown_until"] <= now]
+            if not ready:
+                key = min(candidates, key=lambda k: self._state[k]["cooldown_until"])
+            else:
+                # Rotate the starting point so ties are spread round-robin.
+                start = self._cursor % len(self._keys)
+                order = self._keys[start:] + self._keys[:start]
+                ready = [k for k in order if k in ready]
+                if self.strategy == "least_loaded":
+                    key = min(ready, key=lambda k: self._state[k]["in_flight"])
+                else:
+                    key = ready[0]
+                self._cursor = self._keys.index(key) + 1
+            state = self._state[key]
+            state["in_flight"] += 1
+            state["requests"] += 1
+            return key
+
+    def release(
+        self,
+        key: str,
+        usage: Any = None,
+        error: bool = False,
+        cooldown: float | None = None,
+    ) -> None:
+        """Return a key after a call, recording token usage or failure.
+
+        A `cooldown` (seconds) marks the key as rate limited until then.
+        """
+        with self._lock:
+            state = self._state.get(key)
+            if state is None:  # removed from the pool while in flight
+                return
+            state["in_flight"] = max(0, state["in_flight"] - 1)
+            if error:
+                state["errors"] += 1
+            if cooldown is not None:
+                state["rate_limited"] += 1
+                state["cooldown_until"] = time.monotonic() + cooldown
+            if usage is not None:
+                state["prompt_tokens"] += getattr(usage, "prompt_tokens", None) or 0
+                state["completion_tokens"] += getattr(usage, "completion_tokens", None) or 0
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "strategy": self.strategy,
+                "keys": {
+                    key_id(key): {
+                        **{k: v for k, v in state.items() if k != "cooldown_until"},
+                        "cooling_down_for": round(max(0.0, state["cooldown_until"] - now), 1),
+                    }
+                    for key, state in self._state.items()
+                },
+            }
+
+
+_pools: dict[str, KeyPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_key_pool(provider: str, keys: list[str]) -> KeyPool | None:
+    """Return the provider's pool synced to `keys`, or None for fewer than two keys."""
+    if len(set(k for k in keys if k)) < 2:
+        return None
+    with _pools_lock:
+        pool = _pools.get(provider)
+        if pool is None:
+            pool = _pools[provider] = KeyPool(provider, keys)
+        elif pool.keys != list(dict.fromkeys(k for k in keys if k)):
+            pool.set_keys(keys)
+        return pool
+
+
+def get_key_pool_stats() -> dict[str, dict[str, Any]]:
+    """Per-key in-flight calls, requests, rate limits and token usage by provider."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.provider: pool.snapshot() for pool in pools}
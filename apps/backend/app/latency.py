@@ -0,0 +1,166 @@
+"""Rolling LLM latency histograms and the adaptive timeouts derived from them.
+
+Static timeouts (``LLM_TIMEOUT_*`` x provider factor) are minutes long for
+models that answer in seconds and too short for slow local models. Once enough
+calls have been observed for a model/operation pair, the deadline becomes
+``p99 x safety factor`` clamped to a floor and ceiling.
+
+- Histograms are kept per ``max_tokens`` size class (see `latency_operation`),
+  so many small keyword/title calls don't set the deadline of a resume rewrite
+  that writes thousands of tokens.
+- Only calls that completed are sampled; a timed-out or cancelled call says
+  only that it took at least its deadline. A timeout under an adaptive
+  deadline instead suspends that deadline (back to the static timeout) until
+  enough new calls have completed.
+"""
+
+import math
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+from app.config import settings
+
+# Upper bounds (seconds) of the histogram buckets reported in metrics
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300, 600)
+
+# Upper bounds of the max_tokens size classes calls are grouped by
+MAX_TOKENS_CLASSES = (512, 2048, 8192)
+
+
+def latency_operation(operation: str, max_tokens: int | None) -> str:
+    """Histogram key for a call: the operation plus its max_tokens size class."""
+    if not max_tokens:
+        return operation
+    bound = next((b for b in MAX_TOKENS_CLASSES if max_tokens <= b), None)
+    return f"{operation}:{bound}" if bound is not None else f"{operation}:large"
+
+
+class LatencyHistogram:
+    """Latencies of the most recent calls, with quantiles and bucket counts."""
+
+    def __init__(self, size: int):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    @property
+    def samples(self) -> list[float]:
+        return list(self._samples)
+
+    def quantile(self, q: float) -> float | None:
+        """Nearest-rank quantile of the window, or None if empty."""
+        return _nearest_rank(self._samples, q)
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets = {f"le_{bound}": 0 for bound in LATENCY_BUCKETS}
+        buckets["le_inf"] = 0
+        for sample in self._samples:
+            bound = next((b for b in LATENCY_BUCKETS if sample <= b), None)
+            buckets[f"le_{bound}" if bound is not None else "le_inf"] += 1
+        return {
+            "count": len(self._samples),
+            "p50": _round(self.quantile(0.5)),
+            "p90": _round(self.quantile(0.9)),
+            "p99": _round(self.quantile(0.99)),
+            "buckets": buckets,
+        }
+
+
+def _nearest_rank(samples: Iterable[float], q: float) -> float | None:
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+class LatencyTracker:
+    """Per model/operation latency histograms and the timeouts chosen from them."""
+
+    def __init__(self):
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._chosen: dict[str, dict[str, Any]] = {}
+        # Completed calls still needed before a suspended deadline is used again
+        self._suspended: dict[str, int] = {}
+
+    def record(self, model: str, operation: str, seconds: float) -> None:
+        """Record the latency of a completed call."""
+        key = f"{model}:{operation}"
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram(settings.llm_latency_window)
+        histogram.record(seconds)
+        if key in self._suspended:
+            self._suspended[key] -= 1
+            if self._suspended[key] <= 0:
+                del self._suspended[key]
+
+    def record_timeout(self, model: str, operation: str) -> None:
+        """Note a call that hit its timeout; an adaptive deadline is suspended."""
+        key = f"{model}:{operation}"
+        if self._chosen.get(key, {}).get("source") == "adaptive":
+            self._suspended[key] = settings.llm_latency_min_samples
+
+    def deadline(self, model: str, operation: str) -> int | None:
+        """Adaptive timeout for a call, or None until enough samples exist."""
+        if not settings.llm_adaptive_timeouts:
+            return None
+        key = f"{model}:{operation}"
+        histogram = self._histograms.get(key)
+        if (
+            histogram is None
+            or len(histogram) < settings.llm_latency_min_samples
+            or key in self._suspended
+        ):
+            return None
+        p99 = histogram.quantile(0.99) or 0.0
+        timeout = p99 * settings.llm_timeout_safety_factor
+        timeout = min(max(timeout, settings.llm_timeout_floor), settings.llm_timeout_ceiling)
+        return math.ceil(timeout)
+
+    def quantile(self, model: str, operation: str, q: float) -> float | None:
+        """Observed latency quantile for a model/operation, or None without samples.
+
+        `operation` without a size class covers calls of every size.
+        """
+        prefix = f"{model}:{operation}"
+        samples = [
+            sample
+            for key, histogram in self._histograms.items()
+            if key == prefix or key.startswith(prefix + ":")
+            for sample in histogram.samples
+        ]
+        return _nearest_rank(samples, q)
+
+    def note_timeout(self, model: str, operation: str, timeout: int, source: str) -> None:
+        """Remember the timeout last used for a model/operation (for tuning)."""
+        self._chosen[f"{model}:{operation}"] = {"timeout": timeout, "source": source}
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        keys = set(self._histograms) | set(self._chosen)
+        result: dict[str, dict[str, Any]] = {}
+        for key in sorted(keys):
+            histogram = self._histograms.get(key)
+            result[key] = {
+                **(histogram.snapshot() if histogram else {"count": 0}),
+                **self._chosen.get(key, {}),
+            }
+        return result
+
+
+# Global tracker instance
+latency_tracker = LatencyTracker()
+
+
+def get_latency_stats() -> dict[str, dict[str, Any]]:
+    """Latency percentiles, histogram buckets and chosen timeout per model/operation."""
+    return latency_tracker.snapshot()
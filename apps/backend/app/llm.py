@@ -1,14 +1,35 @@
 """LiteLLM wrapper for multi-provider AI support."""
 
+import asyncio
+import copy
+import functools
 import json
 import logging
+import os
 import re
+import time
+from types import ModuleType
 from typing import Any
 
-import litellm
-from pydantic import BaseModel
+import httpx
+from pydantic import BaseModel, ValidationError
 
+from app import deadline
+from app.circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker
 from app.config import settings
+from app.key_pool import get_key_pool, key_id
+from app.latency import latency_operation, latency_tracker
+from app.retry_policy import (
+    RATE_LIMITED,
+    classify_error,
+    retry_after,
+    retry_budget,
+    should_retry,
+)
+
+# Use LiteLLM's bundled model cost map instead of fetching it over the network
+# at import time (hangs in egress-restricted deployments).
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
 
 # LLM timeout configuration (seconds) - base values
 LLM_TIMEOUT_HEALTH_CHECK = 30
@@ -48,18 +69,38 @@ OPENROUTER_JSON_CAPABLE_MODELS = {
     "mistralai/mistral-medium",
 }
 
+# Default API hosts, used to warm pooled connections when no api_base is set
+PROVIDER_DEFAULT_API_BASES = {
+    "openai": "https://api.openai.com",
+    "anthropic": "https://api.anthropic.com",
+    "openrouter": "https://openrouter.ai",
+    "gemini": "https://generativelanguage.googleapis.com",
+    "deepseek": "https://api.deepseek.com",
+    "ollama": "http://localhost:11434",
+}
+
 # JSON-010: JSON extraction safety limits
 MAX_JSON_EXTRACTION_RECURSION = 10
 MAX_JSON_CONTENT_SIZE = 1024 * 1024  # 1MB
 
 
 class LLMConfig(BaseModel):
-    """LLM configuration model."""
+    """LLM configuration model.
+
+    `api_keys` optionally lists several keys for the provider; calls are then
+    spread across them (see `app.key_pool`), with `api_key` as the default.
+    """
 
     provider: str
     model: str
     api_key: str
     api_base: str | None = None
+    api_keys: list[str] = []
+
+    @property
+    def key_pool(self) -> list[str]:
+        """All keys to spread calls over: `api_key` first, then `api_keys`."""
+        return list(dict.fromkeys(k for k in [self.api_key, *self.api_keys] if k))
 
 
 def _normalize_api_base(provider: str, api_base: str | None) -> str | None:
@@ -234,12 +275,18 @@ def get_llm_config() -> LLMConfig:
     Priority: config.json file > environment variables/settings
     """
     stored = _load_stored_config()
+    provider = stored.get("provider", settings.llm_provider)
+    # LLM_API_KEYS belongs to LLM_PROVIDER; config.json pools are per provider
+    api_keys = stored.get("api_key_pool", {}).get(
+        provider, settings.llm_api_keys if provider == settings.llm_provider else []
+    )
 
     return LLMConfig(
-        provider=stored.get("provider", settings.llm_provider),
+        provider=provider,
         model=stored.get("model", settings.llm_model),
         api_key=stored.get("api_key", settings.llm_api_key),
         api_base=stored.get("api_base", settings.llm_api_base),
+        api_keys=api_keys,
     )
 
 
@@ -290,6 +337,466 @@ def _supports_temperature(provider: str, model: str) -> bool:
     return True
 
 
+def _supports_cache_control(provider: str, model: str) -> bool:
+    """Return whether explicit prompt-cache breakpoints should be sent.
+
+    Anthropic (directly or through OpenRouter) only caches prefixes marked with
+    `cache_control`. OpenAI and DeepSeek cache shared prefixes automatically, so
+    they only need the stable system-prompt layout used by our templates.
+    """
+    if provider == "anthropic":
+        return True
+    if provider == "openrouter":
+        return model.removeprefix("openrouter/").startswith("anthropic/")
+    return False
+
+
+def _build_messages(
+    config: LLMConfig,
+    prompt: str,
+    system_prompt: str | None,
+) -> list[dict[str, Any]]:
+    """Build chat messages, marking the system prompt as a cache breakpoint.
+
+    Prompt templates keep all static content (rules, schemas) in the system
+    prompt, so it is identical across requests and can be served from the
+    provider's prompt cache.
+    """
+    messages: list[dict[str, Any]] = []
+    if system_prompt:
+        if _supports_cache_control(config.provider, config.model):
+            messages.append(
+                {
+                    "role": "system",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": system_prompt,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                }
+            )
+        else:
+            messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+# Per-model token usage, including prompt-cache hits
+_usage_stats: dict[str, dict[str, int]] = {}
+
+
+def _record_usage(model_name: str, response: Any) -> None:
+    """Accumulate token usage (and cached prompt tokens) from a response."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) or getattr(
+        usage, "cache_read_input_tokens", None
+    )
+    cache_creation = getattr(usage, "cache_creation_input_tokens", None)
+
+    stats = _usage_stats.setdefault(
+        model_name,
+        {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cached_tokens": 0,
+            "cache_creation_tokens": 0,
+        },
+    )
+    stats["calls"] += 1
+    stats["prompt_tokens"] += getattr(usage, "prompt_tokens", None) or 0
+    stats["completion_tokens"] += getattr(usage, "completion_tokens", None) or 0
+    stats["cached_tokens"] += cached or 0
+    stats["cache_creation_tokens"] += cache_creation or 0
+    if cached:
+        logging.debug("Prompt cache hit for %s: %d cached tokens", model_name, cached)
+
+
+def get_llm_usage_stats() -> dict[str, dict[str, Any]]:
+    """Return per-model token usage with prompt-cache hit ratios."""
+    result: dict[str, dict[str, Any]] = {}
+    for model_name, stats in _usage_stats.items():
+        prompt_tokens = stats["prompt_tokens"]
+        result[model_name] = {
+            **stats,
+            "cache_hit_ratio": (
+                round(stats["cached_tokens"] / prompt_tokens, 4) if prompt_tokens else 0.0
+            ),
+        }
+    return result
+
+
+# litellm takes seconds to import, so it is loaded on first use (or by the
+# startup warmup thread) rather than when this module is imported.
+_litellm_module: ModuleType | None = None
+
+
+def _litellm() -> ModuleType:
+    """Return the litellm module, importing it on first use."""
+    global _litellm_module
+    if _litellm_module is None:
+        import litellm
+
+        _litellm_module = litellm
+    return _litellm_module
+
+
+async def load_litellm() -> ModuleType:
+    """Import litellm in a worker thread so the event loop is never blocked."""
+    if _litellm_module is None:
+        await asyncio.to_thread(_litellm)
+    return _litellm()
+
+
+@functools.cache
+def _pooled_handler_class() -> type:
+    """Build the LiteLLM handler subclass lazily (needs litellm imported)."""
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+    class _PooledHTTPHandler(AsyncHTTPHandler):
+        """LiteLLM HTTP handler backed by one of our pooled clients.
+
+        Built through the base constructor, whose `create_client` call is
+        answered with the pooled client. Later calls (a throwaway client for
+        a retry after a connection error) still get a new client.
+        """
+
+        def __init__(self, client: httpx.AsyncClient, provider: str):
+            self._pooled_client: httpx.AsyncClient | None = client
+            super().__init__(timeout=client.timeout, client_alias=provider)
+
+        def create_client(self, *args: Any, **kwargs: Any) -> httpx.AsyncClient:
+            client, self._pooled_client = self._pooled_client, None
+            return client if client is not None else super().create_client(*args, **kwargs)
+
+    return _PooledHTTPHandler
+
+
+# Per-provider pooled HTTP clients and connection reuse counters
+_http_clients: dict[str, httpx.AsyncClient] = {}
+_http_handlers: dict[str, Any] = {}
+_openai_clients: dict[tuple[str, str, str | None], tuple[httpx.AsyncClient, Any]] = {}
+_pool_stats: dict[str, dict[str, int]] = {}
+
+
+def _http2_available() -> bool:
+    """Return whether HTTP/2 was requested and the `h2` package is installed."""
+    if not settings.llm_http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logging.warning("LLM_HTTP2 is enabled but the 'h2' package is not installed")
+        return False
+    return True
+
+
+def _make_trace(provider: str):
+    """Build an httpx trace callback counting requests and new TCP connections."""
+    stats = _pool_stats.setdefault(provider, {"requests": 0, "new_connections": 0})
+
+    async def trace(event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            stats["new_connections"] += 1
+        elif event_name.endswith("send_request_headers.started"):
+            stats["requests"] += 1
+
+    return trace
+
+
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Return the long-lived pooled HTTP client for a provider, creating it once.
+
+    Pool limits and keep-alive come from settings. Every request is traced so
+    the connection reuse rate can be reported by `get_http_pool_stats()`.
+    """
+    client = _http_clients.get(provider)
+    if client is not None and not client.is_closed:
+        return client
+
+    trace = _make_trace(provider)
+
+    async def attach_trace(request: httpx.Request) -> None:
+        request.extensions["trace"] = trace
+
+    limits = httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+    )
+    client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(limits=limits, http2=_http2_available()),
+        event_hooks={"request": [attach_trace]},
+        timeout=httpx.Timeout(LLM_TIMEOUT_COMPLETION, connect=10.0),
+        follow_redirects=True,
+    )
+    _http_clients[provider] = client
+    _http_handlers.pop(provider, None)
+    return client
+
+
+def _get_http_handler(provider: str) -> Any:
+    """Wrap the provider's pooled client in LiteLLM's handler type."""
+    client = get_http_client(provider)
+    handler = _http_handlers.get(provider)
+    if handler is None or handler.client is not client:
+        handler = _pooled_handler_class()(client, provider)
+        _http_handlers[provider] = handler
+    return handler
+
+
+def _get_openai_client(provider: str, api_key: str, api_base: str | None) -> Any:
+    """Wrap the provider's pooled client in an OpenAI SDK client.
+
+    The SDK client fixes the key and base URL, so one is kept per pair.
+    """
+    client = get_http_client(provider)
+    cached = _openai_clients.get((provider, api_key, api_base))
+    if cached is None or cached[0] is not client:
+        from openai import AsyncOpenAI
+
+        cached = (client, AsyncOpenAI(api_key=api_key, base_url=api_base, http_client=client))
+        _openai_clients[(provider, api_key, api_base)] = cached
+    return cached[1]
+
+
+def _attach_http_client(kwargs: dict[str, Any], provider: str) -> None:
+    """Route a LiteLLM call through the provider's pooled connections.
+
+    Called again after the API key changes, so the OpenAI client matches it.
+    """
+    if provider == "openai":
+        # LiteLLM takes an OpenAI SDK client for `client`, not an HTTP handler.
+        if kwargs.get("api_key"):
+            kwargs["client"] = _get_openai_client(provider, kwargs["api_key"], kwargs.get("api_base"))
+        return
+    kwargs.setdefault("client", _get_http_handler(provider))
+
+
+async def warm_http_pool(config: LLMConfig | None = None) -> None:
+    """Open a keep-alive connection to the configured provider ahead of traffic.
+
+    Sends a cheap HEAD request to the API host (no tokens are spent); any
+    response, including 4xx, leaves a warm TLS connection in the pool.
+    """
+    if config is None:
+        config = get_llm_config()
+    base = _normalize_api_base(config.provider, config.api_base) or (
+        PROVIDER_DEFAULT_API_BASES.get(config.provider)
+    )
+    if not base:
+        return
+    try:
+        await get_http_client(config.provider).head(base, timeout=5.0)
+    except Exception as e:
+        logging.info(f"LLM connection warmup failed for {config.provider}: {e}")
+
+
+async def close_http_pool() -> None:
+    """Close all pooled provider clients (called on shutdown)."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    _http_handlers.clear()
+    _openai_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def get_http_pool_stats() -> dict[str, dict[str, Any]]:
+    """Return per-provider request counts and connection reuse rate."""
+    result: dict[str, dict[str, Any]] = {}
+    for provider, stats in _pool_stats.items():
+        requests = stats["requests"]
+        reused = max(requests - stats["new_connections"], 0)
+        result[provider] = {
+            **stats,
+            "reuse_rate": round(reused / requests, 4) if requests else 0.0,
+        }
+    return result
+
+
+def _is_timeout_error(error: Exception) -> bool:
+    """Return whether an exception represents a request deadline being hit."""
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+        return True
+    return "timeout" in type(error).__name__.lower()
+
+
+def _is_request_error(error: Exception) -> bool:
+    """Return whether the provider answered but rejected this particular request.
+
+    Such errors (e.g. context window exceeded) say nothing about provider health
+    and must not trip the circuit breaker.
+    """
+    return getattr(error, "status_code", None) in (400, 413, 422)
+
+
+def _is_schema_rejection(error: Exception) -> bool:
+    """Return whether a request error rejects the json_schema response format itself.
+
+    Context window, payload size and content policy errors are also 400s, but
+    say nothing about schema support.
+    """
+    if not _is_request_error(error):
+        return False
+    text = " ".join(
+        str(part) for part in (error, getattr(error, "param", None), getattr(error, "message", None))
+    ).lower()
+    return any(marker in text for marker in ("response_format", "json_schema"))
+
+
+def _select_circuit(kwargs: dict[str, Any], provider: str) -> CircuitBreaker:
+    """Return the breaker guarding this call, rerouting to the fallback model if open.
+
+    Raises:
+        CircuitOpenError: If the circuit is open and no fallback model is usable.
+    """
+    breaker = get_breaker(provider, kwargs["model"])
+    if breaker.allow_request():
+        return breaker
+
+    if settings.llm_fallback_model:
+        fallback_model = get_model_name(
+            LLMConfig(provider=provider, model=settings.llm_fallback_model, api_key="")
+        )
+        fallback = get_breaker(provider, fallback_model)
+        if fallback_model != kwargs["model"] and fallback.allow_request():
+            logging.warning(
+                f"Circuit open for {breaker.key}; routing call to fallback model {fallback_model}"
+            )
+            kwargs["model"] = fallback_model
+            return fallback
+
+    raise CircuitOpenError(breaker.key, breaker.retry_after())
+
+
+async def _acompletion(
+    kwargs: dict[str, Any],
+    provider: str | None = None,
+    operation: str = "completion",
+    api_keys: list[str] | None = None,
+) -> Any:
+    """Call LiteLLM and record token usage and latency for the response.
+
+    When `provider` is given, the call goes through that provider's pooled
+    HTTP client instead of opening fresh connections, and is guarded by the
+    provider/model circuit breaker. Latency is recorded per model and
+    `operation` to derive adaptive timeouts (see `_calculate_timeout`).
+
+    With two or more `api_keys`, the key is taken from the provider's key
+    pool; a rate-limited key is cooled down and the call is retried at once
+    on the next available key.
+    """
+    if provider == "mock":
+        from app import mock_llm
+
+        acompletion = mock_llm.acompletion
+    elif provider == "ollama":
+        from app import ollama
+
+        acompletion = ollama.acompletion
+    else:
+        acompletion = (await load_litellm()).acompletion
+    breaker: CircuitBreaker | None = None
+    pooled = provider is not None and provider not in ("mock", "ollama")
+    if pooled:
+        _attach_http_client(kwargs, provider)
+    if provider is not None and settings.llm_breaker_enabled:
+        # Before the breaker hands out a half-open trial this call may not use.
+        deadline.check()
+        breaker = _select_circuit(kwargs, provider)
+
+    pool = get_key_pool(provider, api_keys) if provider is not None and api_keys else None
+    latency_key = latency_operation(operation, kwargs.get("max_tokens"))
+    tried: set[str] = set()
+    while True:
+        key = pool.acquire(exclude=tried) if pool is not None else None
+        if key is not None:
+            kwargs["api_key"] = key
+            tried.add(key)
+            if pooled:
+                _attach_http_client(kwargs, provider)
+
+        # A request deadline caps the call's own timeout.
+        budget = deadline.remaining()
+        if budget is not None:
+            if budget <= 0:
+                if key is not None:
+                    pool.release(key)
+                if breaker is not None:
+                    breaker.release_trial()
+                raise deadline.DeadlineExceededError("Request deadline exceeded")
+            kwargs["timeout"] = min(kwargs.get("timeout") or budget, budget)
+
+        started = time.perf_counter()
+        try:
+            if budget is None:
+                response = await acompletion(**kwargs)
+            else:
+                try:
+                    response = await asyncio.wait_for(acompletion(**kwargs), budget)
+                except asyncio.TimeoutError as e:
+                    if deadline.allows(0):
+                        raise  # the call's own timeout
+                    raise deadline.DeadlineExceededError("Request deadline exceeded") from e
+        except Exception as e:
+            if _is_timeout_error(e) and not isinstance(e, deadline.DeadlineExceededError):
+                # Not sampled (it only says the call took at least its timeout).
+                latency_tracker.record_timeout(kwargs["model"], latency_key)
+            if key is not None:
+                rate_limited = classify_error(e) == RATE_LIMITED
+                cooldown = (retry_after(e) or settings.llm_key_cooldown) if rate_limited else None
+                pool.release(key, error=True, cooldown=cooldown)
+                if rate_limited and len(tried) < len(pool.keys):
+                    # One key's rate limit says nothing about provider health.
+                    logging.warning(
+                        f"API key {key_id(key)} rate limited for {provider}; trying next key"
+                    )
+                    continue
+            if breaker is not None:
+                if _is_request_error(e) or isinstance(e, deadline.DeadlineExceededError):
+                    # Cut short by our deadline, not a sign of provider trouble.
+                    breaker.record_success()
+                else:
+                    breaker.record_failure(timeout=_is_timeout_error(e))
+            raise
+        except BaseException:
+            # Cancelled (e.g. a sibling stage failed or the client went away):
+            # no outcome to record, but the key and any trial slot are freed.
+            if key is not None:
+                pool.release(key)
+            if breaker is not None:
+                breaker.release_trial()
+            raise
+        latency_tracker.record(kwargs["model"], latency_key, time.perf_counter() - started)
+        if key is not None:
+            pool.release(key, usage=getattr(response, "usage", None))
+        if breaker is not None:
+            breaker.record_success()
+        _record_usage(kwargs["model"], response)
+        return response
+
+
+def llm_call_fits_deadline(config: "LLMConfig | None" = None) -> bool:
+    """Whether the request deadline leaves time for a typical JSON call.
+
+    A typical call is the p90 of observed JSON-call latency for the configured
+    model, or `DEADLINE_MIN_CALL_SECONDS` until calls have been observed.
+    """
+    if deadline.remaining() is None:
+        return True
+    if config is None:
+        config = get_llm_config()
+    expected = latency_tracker.quantile(get_model_name(config), "json", 0.9)
+    return deadline.allows(expected if expected is not None else settings.deadline_min_call_seconds)
+
+
 def _get_reasoning_effort(provider: str, model: str) -> str | None:
     """Return a default reasoning_effort for models that require it.
 
@@ -313,8 +820,8 @@ async def check_llm_health(
     if config is None:
         config = get_llm_config()
 
-    # Check if API key is configured (except for Ollama)
-    if config.provider != "ollama" and not config.api_key:
+    # Check if API key is configured (except for Ollama and the local mock)
+    if config.provider not in ("ollama", "mock") and not config.api_key:
         return {
             "healthy": False,
             "provider": config.provider,
@@ -338,13 +845,15 @@ async def check_llm_health(
             "max_tokens": 256,
             "api_key": config.api_key,
             "api_base": _normalize_api_base(config.provider, config.api_base),
-            "timeout": LLM_TIMEOUT_HEALTH_CHECK,
+            "timeout": _calculate_timeout("health_check", 256, config.provider, model_name),
         }
         reasoning_effort = _get_reasoning_effort(config.provider, model_name)
         if reasoning_effort:
             kwargs["reasoning_effort"] = reasoning_effort
 
-        response = await litellm.acompletion(**kwargs)
+        response = await _acompletion(
+            kwargs, config.provider, "health_check", config.key_pool
+        )
         content = _extract_choice_text(response.choices[0])
         if not content:
             # LLM-003: Empty response should mark health check as unhealthy
@@ -385,7 +894,9 @@ async def check_llm_health(
         # Provide a minimal, actionable client-facing hint without leaking secrets.
         error_code = "health_check_failed"
         message = str(e)
-        if "404" in message and "/v1/v1/" in message:
+        if isinstance(e, CircuitOpenError):
+            error_code = "circuit_open"
+        elif "404" in message and "/v1/v1/" in message:
             error_code = "duplicate_v1_path"
         elif "404" in message:
             error_code = "not_found_404"
@@ -416,11 +927,7 @@ async def complete(
         config = get_llm_config()
 
     model_name = get_model_name(config)
-
-    messages = []
-    if system_prompt:
-        messages.append({"role": "system", "content": system_prompt})
-    messages.append({"role": "user", "content": prompt})
+    messages = _build_messages(config, prompt, system_prompt)
 
     try:
         # Pass API key directly to avoid race conditions with global os.environ
@@ -430,7 +937,7 @@ async def complete(
             "max_tokens": max_tokens,
             "api_key": config.api_key,
             "api_base": _normalize_api_base(config.provider, config.api_base),
-            "timeout": LLM_TIMEOUT_COMPLETION,
+            "timeout": _calculate_timeout("completion", max_tokens, config.provider, model_name),
         }
         if _supports_temperature(config.provider, model_name):
             kwargs["temperature"] = temperature
@@ -438,12 +945,16 @@ async def complete(
         if reasoning_effort:
             kwargs["reasoning_effort"] = reasoning_effort
 
-        response = await litellm.acompletion(**kwargs)
+        response = await _acompletion(
+            kwargs, config.provider, api_keys=config.key_pool
+        )
 
         content = _extract_choice_text(response.choices[0])
         if not content:
             raise ValueError("Empty response from LLM")
         return content
+    except (CircuitOpenError, deadline.DeadlineExceededError):
+        raise
     except Exception as e:
         # Log the actual error server-side for debugging
         logging.error(f"LLM completion failed: {e}", extra={"model": model_name})
@@ -455,7 +966,7 @@ async def complete(
 def _supports_json_mode(provider: str, model: str) -> bool:
     """Check if the model supports JSON mode."""
     # Models that support response_format={"type": "json_object"}
-    json_mode_providers = ["openai", "anthropic", "gemini", "deepseek"]
+    json_mode_providers = ["openai", "anthropic", "gemini", "deepseek", "ollama"]
     if provider in json_mode_providers:
         return True
     # LLM-004: OpenRouter models - use explicit allowlist instead of substring matching
@@ -464,6 +975,108 @@ def _supports_json_mode(provider: str, model: str) -> bool:
     return False
 
 
+# Models whose provider rejected a json_schema response format (use JSON mode instead)
+_json_schema_unsupported: set[str] = set()
+_structured_output_stats: dict[str, dict[str, int]] = {}
+
+
+def _supports_json_schema(provider: str, model_name: str) -> bool:
+    """Check if the model accepts `json_schema` structured outputs.
+
+    Requires litellm to be loaded (see `load_litellm`).
+    """
+    if not settings.llm_structured_outputs or provider == "mock":
+        return False
+    if model_name in _json_schema_unsupported:
+        return False
+    if provider == "ollama":
+        # Sent as Ollama's native `format` schema (see app.ollama)
+        return True
+    try:
+        return bool(_litellm().supports_response_schema(model=model_name))
+    except Exception:
+        return False
+
+
+def _strictify(schema: dict[str, Any]) -> bool:
+    """Rewrite a JSON schema in place for strict structured outputs.
+
+    Strict mode needs every object closed (`additionalProperties: false`) with
+    all properties required, and no `default` keywords. Returns False if the
+    schema has free-form maps (e.g. `dict[str, X]` fields), which strict mode
+    cannot express.
+    """
+    schema.pop("default", None)
+    strict = True
+    if "properties" in schema:
+        if schema.get("additionalProperties") not in (None, False):
+            return False
+        schema["additionalProperties"] = False
+        schema["required"] = list(schema["properties"])
+        for prop in schema["properties"].values():
+            strict &= _strictify(prop)
+    elif schema.get("type") == "object":
+        return False
+    if isinstance(schema.get("items"), dict):
+        strict &= _strictify(schema["items"])
+    for key in ("anyOf", "allOf", "oneOf"):
+        for option in schema.get(key, []):
+            strict &= _strictify(option)
+    for definition in schema.get("$defs", {}).values():
+        strict &= _strictify(definition)
+    return strict
+
+
+@functools.cache
+def _json_schema_format(response_model: type[BaseModel]) -> dict[str, Any]:
+    """Build a `json_schema` response_format from a Pydantic model.
+
+    Uses strict mode when the schema allows it; otherwise the schema is sent
+    as a non-strict hint (still enforced by providers that support it).
+    """
+    schema = response_model.model_json_schema()
+    strict = _strictify(schema)
+    if not strict:
+        schema = response_model.model_json_schema()
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": response_model.__name__, "schema": schema, "strict": strict},
+    }
+
+
+def _count_structured(model_name: str, key: str) -> None:
+    stats = _structured_output_stats.setdefault(
+        model_name,
+        {
+            "calls": 0,
+            "attempts": 0,
+            "succeeded": 0,
+            "json_schema_calls": 0,
+            "schema_fallbacks": 0,
+            "parse_failures": 0,
+            "validation_failures": 0,
+        },
+    )
+    stats[key] += 1
+
+
+def get_structured_output_stats() -> dict[str, dict[str, Any]]:
+    """Return per-model JSON completion attempts, failures and retry rates."""
+    result: dict[str, dict[str, Any]] = {}
+    for model_name, stats in _structured_output_stats.items():
+        calls = stats["calls"]
+        attempts = stats["attempts"]
+        result[model_name] = {
+            **stats,
+            "wasted_generations": attempts - stats["succeeded"],
+            "retry_rate": round((attempts - calls) / calls, 4) if calls else 0.0,
+            "validation_failure_rate": (
+                round(stats["validation_failures"] / attempts, 4) if attempts else 0.0
+            ),
+        }
+    return result
+
+
 def _appears_truncated(data: dict) -> bool:
     """LLM-001: Check if JSON data appears to be truncated.
 
@@ -510,8 +1123,22 @@ def _calculate_timeout(
     operation: str,
     max_tokens: int = 4096,
     provider: str = "openai",
+    model: str | None = None,
 ) -> int:
-    """LLM-005: Calculate adaptive timeout based on operation and parameters."""
+    """LLM-005: Calculate adaptive timeout based on operation and parameters.
+
+    Once enough calls to `model` have been observed for this operation and
+    max_tokens size class, the timeout comes from their latency histogram
+    (p99 x safety factor, clamped); until then the static per-operation base
+    is scaled by tokens and provider.
+    """
+    latency_key = latency_operation(operation, max_tokens)
+    if model is not None:
+        adaptive = latency_tracker.deadline(model, latency_key)
+        if adaptive is not None:
+            latency_tracker.note_timeout(model, latency_key, adaptive, "adaptive")
+            return adaptive
+
     base_timeouts = {
         "health_check": LLM_TIMEOUT_HEALTH_CHECK,
         "completion": LLM_TIMEOUT_COMPLETION,
@@ -532,7 +1159,10 @@ def _calculate_timeout(
     }
     provider_factor = provider_factors.get(provider, 1.0)
 
-    return int(base * token_factor * provider_factor)
+    timeout = int(base * token_factor * provider_factor)
+    if model is not None:
+        latency_tracker.note_timeout(model, latency_key, timeout, "static")
+    return timeout
 
 
 def _extract_json(content: str, _depth: int = 0) -> str:
@@ -620,30 +1250,45 @@ async def complete_json(
     config: LLMConfig | None = None,
     max_tokens: int = 4096,
     retries: int = 2,
+    response_model: type[BaseModel] | None = None,
 ) -> dict[str, Any]:
     """Make a completion request expecting JSON response.
 
-    Uses JSON mode when available, with retry logic for reliability.
+    Uses JSON mode when available. Parse and validation failures are retried
+    at once with a stricter prompt; provider errors are retried per
+    `app.retry_policy` (backoff for transient errors and rate limits, no
+    retries for auth/request errors). With a
+    `response_model`, the model's JSON Schema is sent as a `json_schema`
+    response format where supported (falling back to JSON mode if the provider
+    rejects it), and the result is validated against the model before it is
+    returned; validation failures are retried like parse failures.
     """
     if config is None:
         config = get_llm_config()
 
     model_name = get_model_name(config)
+    _count_structured(model_name, "calls")
+    retry_budget.record_call()
+
+    schema_format: dict[str, Any] | None = None
+    if response_model is not None:
+        if config.provider not in ("mock", "ollama"):
+            await load_litellm()  # for supports_response_schema()
+        if _supports_json_schema(config.provider, model_name):
+            schema_format = copy.deepcopy(_json_schema_format(response_model))
 
     # Build messages
     json_system = (
         system_prompt or ""
     ) + "\n\nYou must respond with valid JSON only. No explanations, no markdown."
-    messages = [
-        {"role": "system", "content": json_system},
-        {"role": "user", "content": prompt},
-    ]
+    messages = _build_messages(config, prompt, json_system)
 
     # Check if we can use JSON mode
     use_json_mode = _supports_json_mode(config.provider, config.model)
 
     last_error = None
     for attempt in range(retries + 1):
+        hit_length_limit = False
         try:
             # Build request kwargs
             # Pass API key directly to avoid race conditions with global os.environ
@@ -653,7 +1298,7 @@ async def complete_json(
                 "max_tokens": max_tokens,
                 "api_key": config.api_key,
                 "api_base": _normalize_api_base(config.provider, config.api_base),
-                "timeout": _calculate_timeout("json", max_tokens, config.provider),
+                "timeout": _calculate_timeout("json", max_tokens, config.provider, model_name),
             }
             if _supports_temperature(config.provider, model_name):
                 # LLM-002: Increase temperature on retry for variation
@@ -662,12 +1307,37 @@ async def complete_json(
             if reasoning_effort:
                 kwargs["reasoning_effort"] = reasoning_effort
 
-            # Add JSON mode if supported
-            if use_json_mode:
+            # Prefer schema-constrained output, else JSON mode if supported
+            if schema_format is not None:
+                kwargs["response_format"] = schema_format
+                _count_structured(model_name, "json_schema_calls")
+            elif use_json_mode:
                 kwargs["response_format"] = {"type": "json_object"}
 
-            response = await litellm.acompletion(**kwargs)
+            _count_structured(model_name, "attempts")
+            try:
+                response = await _acompletion(
+                    kwargs, config.provider, "json", config.key_pool
+                )
+            except Exception as e:
+                if schema_format is None or not _is_schema_rejection(e):
+                    raise
+                # Provider rejected the schema format: remember and use JSON mode.
+                logging.warning(
+                    f"json_schema response format rejected for {model_name}; using JSON mode: {e}"
+                )
+                _json_schema_unsupported.add(model_name)
+                _count_structured(model_name, "schema_fallbacks")
+                schema_format = None
+                if use_json_mode:
+                    kwargs["response_format"] = {"type": "json_object"}
+                else:
+                    kwargs.pop("response_format", None)
+                response = await _acompletion(
+                    kwargs, config.provider, "json", config.key_pool
+                )
             content = _extract_choice_text(response.choices[0])
+            hit_length_limit = getattr(response.choices[0], "finish_reason", None) == "length"
 
             if not content:
                 raise ValueError("Empty response from LLM")
@@ -684,11 +1354,34 @@ async def complete_json(
                     "Parsed JSON appears truncated, but proceeding with result"
                 )
 
+            if response_model is not None:
+                response_model.model_validate(result)
+
+            _count_structured(model_name, "succeeded")
             return result
 
+        except ValidationError as e:
+            last_error = e
+            _count_structured(model_name, "validation_failures")
+            logging.warning(f"JSON schema validation failed (attempt {attempt + 1}): {e}")
+            if attempt < retries:
+                messages[-1]["content"] = (
+                    prompt
+                    + "\n\nIMPORTANT: Output ONLY a JSON object that matches the required schema exactly."
+                )
+                continue
+            raise ValueError(f"JSON failed schema validation after {retries + 1} attempts: {e}")
+
         except json.JSONDecodeError as e:
             last_error = e
+            _count_structured(model_name, "parse_failures")
             logging.warning(f"JSON parse failed (attempt {attempt + 1}): {e}")
+            if attempt < retries and hit_length_limit:
+                # Output budget was too small: retry with room to finish.
+                from app.token_budget import model_limits
+
+                max_tokens = min(max_tokens * 2, model_limits(model_name)[1])
+                logging.warning(f"JSON output hit max_tokens; retrying with {max_tokens}")
             if attempt < retries:
                 # Add hint to prompt for retry
                 messages[-1]["content"] = (
@@ -698,10 +1391,18 @@ async def complete_json(
                 continue
             raise ValueError(f"Failed to parse JSON after {retries + 1} attempts: {e}")
 
+        except (CircuitOpenError, deadline.DeadlineExceededError):
+            # Fail fast: retrying against an open circuit only burns the deadline.
+            raise
+
         except Exception as e:
             last_error = e
-            logging.warning(f"LLM call failed (attempt {attempt + 1}): {e}")
-            if attempt < retries:
+            logging.warning(
+                f"LLM call failed (attempt {attempt + 1}, {classify_error(e)}): {e}"
+            )
+            # Backs off (jittered) for retryable errors; auth/request errors and
+            # an exhausted retry budget raise immediately.
+            if await should_retry(e, attempt, retries):
                 continue
             raise
 
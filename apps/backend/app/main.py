@@ -1,8 +1,10 @@
 """FastAPI application entry point."""
 
 import asyncio
+import importlib
 import logging
 import sys
+import threading
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -13,12 +15,41 @@ if sys.platform == "win32":
 
 logger = logging.getLogger(__name__)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app import __version__
+from app.circuit_breaker import CircuitOpenError
 from app.config import settings
 from app.database import db
+from app.health_monitor import health_monitor
+from app.llm import close_http_pool, warm_http_pool
+from app.ollama import preload_model
 from app.pdf import close_pdf_renderer, init_pdf_renderer
-from app.routers import config_router, enrichment_router, health_router, jobs_router, resumes_router
+from app.routers import (
+    config_router,
+    enrichment_router,
+    health_router,
+    jobs_router,
+    resumes_router,
+    tasks_router,
+)
+from app.tasks import task_queue
+
+
+# Heavy modules imported lazily on first use; preloaded off the event loop at startup
+WARM_IMPORTS = ("markitdown", "playwright.async_api")
+
+
+def _warm_imports() -> None:
+    """Import heavy dependencies so the first request doesn't pay for them."""
+    from app.llm import _litellm
+
+    try:
+        _litellm()
+        for module in WARM_IMPORTS:
+            importlib.import_module(module)
+    except Exception as e:
+        logger.warning(f"Background import warmup failed: {e}")
 
 
 @asynccontextmanager
@@ -28,8 +59,33 @@ async def lifespan(app: FastAPI):
     settings.data_dir.mkdir(parents=True, exist_ok=True)
     # PDF renderer uses lazy initialization - will initialize on first use
     # await init_pdf_renderer()
+    if settings.warm_imports:
+        threading.Thread(target=_warm_imports, name="import-warmup", daemon=True).start()
+    # Warm the provider connection pool in the background so startup isn't blocked
+    warmup = asyncio.create_task(warm_http_pool())
+    # Load a local Ollama model (and pin it with keep_alive) before the first request
+    preload = asyncio.create_task(preload_model())
+    health_monitor.start()
+    task_queue.start()
     yield
     # Shutdown - wrap each cleanup in try-except to ensure all resources are released
+    warmup.cancel()
+    preload.cancel()
+    try:
+        await task_queue.stop()
+    except Exception as e:
+        logger.error(f"Error stopping task queue: {e}")
+
+    try:
+        await health_monitor.stop()
+    except Exception as e:
+        logger.error(f"Error stopping LLM health monitor: {e}")
+
+    try:
+        await close_http_pool()
+    except Exception as e:
+        logger.error(f"Error closing LLM HTTP pool: {e}")
+
     try:
         await close_pdf_renderer()
     except Exception as e:
@@ -57,12 +113,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request, exc: CircuitOpenError) -> JSONResponse:
+    """Fail fast with 503 while an LLM provider's circuit is open."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
 # Include routers
 app.include_router(health_router, prefix="/api/v1")
 app.include_router(config_router, prefix="/api/v1")
 app.include_router(resumes_router, prefix="/api/v1")
 app.include_router(jobs_router, prefix="/api/v1")
 app.include_router(enrichment_router, prefix="/api/v1")
+app.include_router(tasks_router, prefix="/api/v1")
 
 
 @app.get("/")
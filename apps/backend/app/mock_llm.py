@@ -0,0 +1,268 @@
+"""Deterministic local stand-in for an LLM provider (``provider="mock"``).
+
+Lets the full pipeline run (load tests, benchmarks, offline development)
+without spending tokens. Every prompt family used by the backend gets a
+schema-valid response derived only from the prompt text, so identical
+requests always produce identical output. Latency, token rate and error
+injection are configurable via ``MOCK_LLM_*`` settings; the random draws for
+those come from a seeded generator, so a run is reproducible too.
+"""
+
+import asyncio
+import copy
+import json
+import math
+import random
+import re
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any
+
+from app.config import settings
+from app.prompts.serialization import estimate_tokens
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+
+# Common words that shouldn't become "keywords" in the keyword extraction mock
+_STOPWORDS = set(
+    "a about an and are experience for from have in job of our role team that "
+    "the this to we what who will with work year years you your".split()
+)
+
+_rng = random.Random(settings.mock_llm_seed)
+
+
+class MockLLMError(Exception):
+    """Injected provider failure (behaves like an HTTP 503 from a real provider)."""
+
+    status_code = 503
+
+
+def reset(seed: int | None = None) -> None:
+    """Reseed the latency/error generator (for reproducible benchmark runs)."""
+    _rng.seed(settings.mock_llm_seed if seed is None else seed)
+
+
+def _json_after(text: str, marker: str, opener: str = "{") -> Any:
+    """Decode the first JSON value starting with `opener` after `marker`, or None."""
+    start = text.find(marker)
+    if start == -1:
+        return None
+    brace = text.find(opener, start + len(marker))
+    if brace == -1:
+        return None
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text, brace)
+    except json.JSONDecodeError:
+        return None
+    return value
+
+
+def _text_after(text: str, marker: str, end_marker: str | None = None) -> str:
+    start = text.find(marker)
+    if start == -1:
+        return ""
+    body = text[start + len(marker) :]
+    if end_marker and end_marker in body:
+        body = body[: body.index(end_marker)]
+    return body.strip()
+
+
+def _example_resume() -> dict[str, Any]:
+    return json.loads(RESUME_SCHEMA_EXAMPLE)
+
+
+def _keywords_from(text: str, limit: int = 8) -> list[str]:
+    """Most frequent capitalised terms (ties broken by first occurrence)."""
+    words = re.findall(r"\b[A-Z][A-Za-z0-9+#.]{1,30}\b", text)
+    counts = Counter(w.rstrip(".") for w in words if w.lower() not in _STOPWORDS)
+    return [word for word, _ in counts.most_common(limit)]
+
+
+def _title_from(job_description: str) -> str:
+    first_line = next((line.strip() for line in job_description.splitlines() if line.strip()), "")
+    return (first_line or "Software Engineer")[:60]
+
+
+def _batch_items(prompt: str) -> list[tuple[int, str]]:
+    """`(index, job description)` pairs of a batched prompt (see BATCH_ITEM_TEMPLATE)."""
+    return [
+        (int(index), text)
+        for index, text in re.findall(r"Job description (\d+):\n<<<\n(.*?)\n>>>", prompt, re.S)
+    ]
+
+
+def _job_keywords(job_description: str) -> dict[str, Any]:
+    keywords = _keywords_from(job_description)
+    return {
+        "required_skills": keywords[:4],
+        "preferred_skills": keywords[4:6],
+        "experience_requirements": [],
+        "education_requirements": [],
+        "key_responsibilities": [],
+        "keywords": keywords,
+        "experience_years": 3,
+        "seniority_level": "mid",
+    }
+
+
+def _resume_with_keywords(resume: Any, keywords: list[str]) -> dict[str, Any]:
+    """Echo a resume back, adding keywords to the skills list deterministically."""
+    if not isinstance(resume, dict):
+        resume = _example_resume()
+    result = copy.deepcopy(resume)
+    additional = result.setdefault("additional", {})
+    if isinstance(additional, dict):
+        skills = list(additional.get("technicalSkills") or [])
+        existing = {skill.lower() for skill in skills if isinstance(skill, str)}
+        skills.extend(k for k in keywords if k.lower() not in existing)
+        additional["technicalSkills"] = skills
+    return result
+
+
+def _respond(system: str, prompt: str) -> str:
+    """Build the mock response text for a prompt, dispatching on prompt family."""
+    if "Resume to parse:" in prompt:
+        return json.dumps(_example_resume())
+
+    if "Extract job requirements as JSON for each" in prompt:
+        return json.dumps(
+            {"results": [{"index": i, **_job_keywords(jd)} for i, jd in _batch_items(prompt)]}
+        )
+
+    if "Extract job requirements as JSON" in prompt:
+        return json.dumps(_job_keywords(_text_after(prompt, "Job description:")))
+
+    if "Keywords to inject:" in prompt:
+        keywords = _json_after(prompt, "Keywords to inject:", "[") or []
+        resume = _json_after(prompt, "Current tailored resume:")
+        return json.dumps(_resume_with_keywords(resume, [k for k in keywords if isinstance(k, str)]))
+
+    if "Resume section (" in prompt:
+        section = _text_after(prompt, "Resume section (", ")")
+        wrapped = _json_after(prompt, "Resume section (") or {}
+        if section == "additional":
+            keywords_json = _json_after(prompt, "Keywords to emphasize:") or {}
+            keywords = keywords_json.get("keywords", []) if isinstance(keywords_json, dict) else []
+            resume = _resume_with_keywords({"additional": wrapped.get("section")}, keywords[:3])
+            wrapped = {"section": resume["additional"]}
+        return json.dumps(wrapped)
+
+    if "Original Resume:" in prompt and "Keywords to emphasize:" in prompt:
+        keywords_json = _json_after(prompt, "Keywords to emphasize:") or {}
+        keywords = keywords_json.get("keywords", []) if isinstance(keywords_json, dict) else []
+        resume = _json_after(prompt, "Original Resume:")
+        return json.dumps(_resume_with_keywords(resume, keywords[:3]))
+
+    if "Resume to verify:" in prompt:
+        return json.dumps(_json_after(prompt, "Resume to verify:") or _example_resume())
+
+    if "Resume to polish:" in prompt:
+        return json.dumps(_json_after(prompt, "Resume to polish:") or _example_resume())
+
+    if "Analyze this resume to identify items" in prompt:
+        return json.dumps(
+            {
+                "items_to_enrich": [],
+                "questions": [],
+                "analysis_summary": "The resume is already specific and well quantified.",
+            }
+        )
+
+    if "ADD new bullet points" in prompt:
+        title = _text_after(prompt, "Title:", "\n")
+        return json.dumps(
+            {"additional_bullets": [f"Delivered key projects as {title or 'a team member'}"]}
+        )
+
+    if "REWRITE the description of this resume item" in prompt:
+        current = _text_after(prompt, "CURRENT DESCRIPTION (the user is NOT satisfied with this):", "\n\n")
+        bullets = [line.lstrip("-• ").strip() for line in current.splitlines() if line.strip()]
+        return json.dumps(
+            {
+                "new_bullets": bullets or ["Owned delivery of the described work"],
+                "change_summary": "Reworded bullets to follow the requested direction.",
+            }
+        )
+
+    if "Rewrite the technical skills section" in prompt:
+        current = _text_after(prompt, "CURRENT SKILLS:", "\n\n")
+        skills = [s.strip() for s in re.split(r"[,\n]", current) if s.strip()]
+        return json.dumps({"new_skills": skills, "change_summary": "Reordered skills."})
+
+    if "Write a brief cover letter" in prompt:
+        title = _title_from(_text_after(prompt, "Job Description:", "\n\nCandidate Resume"))
+        return (
+            f"The {title} role matches the systems work I have been doing.\n\n"
+            "My recent experience covers the core requirements listed.\n\n"
+            "Happy to talk through details whenever suits you."
+        )
+
+    if "cold outreach message" in prompt:
+        title = _title_from(_text_after(prompt, "Job Description:", "\n\nCandidate Resume"))
+        return f"Saw the {title} opening; my background lines up with it. Worth a quick chat?"
+
+    if "Extract the job title and company name from each" in prompt:
+        return json.dumps(
+            {"results": [{"index": i, "title": _title_from(jd)} for i, jd in _batch_items(prompt)]}
+        )
+
+    if "Extract the job title and company name" in prompt:
+        return _title_from(_text_after(prompt, "Job Description:", "\n\nRules:"))
+
+    if "valid JSON" in system or "valid JSON" in prompt:
+        return "{}"
+    return "OK"
+
+
+def _message_text(message: dict[str, Any]) -> str:
+    content = message.get("content")
+    if isinstance(content, list):
+        return "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+def _sample_latency(completion_tokens: int) -> float:
+    """Lognormal base latency around the median plus time to 'generate' tokens."""
+    median = settings.mock_llm_latency_ms / 1000
+    base = median * math.exp(_rng.gauss(0.0, settings.mock_llm_latency_sigma)) if median else 0.0
+    rate = settings.mock_llm_tokens_per_second
+    return base + (completion_tokens / rate if rate > 0 else 0.0)
+
+
+async def acompletion(**kwargs: Any) -> SimpleNamespace:
+    """Drop-in for `litellm.acompletion` returning a LiteLLM-shaped response."""
+    messages = kwargs.get("messages") or []
+    system = "\n".join(_message_text(m) for m in messages if m.get("role") == "system")
+    prompt = _message_text(messages[-1]) if messages else ""
+
+    content = _respond(system, prompt)
+    prompt_tokens = sum(estimate_tokens(_message_text(m)) for m in messages)
+    completion_tokens = estimate_tokens(content)
+
+    # Draw in a fixed order so the sequence only depends on the seed.
+    roll = _rng.random()
+    latency = _sample_latency(completion_tokens)
+
+    if roll < settings.mock_llm_timeout_rate:
+        timeout = float(kwargs.get("timeout") or 0)
+        await asyncio.sleep(timeout)
+        raise asyncio.TimeoutError(f"Mock LLM call exceeded timeout of {timeout}s")
+    if roll < settings.mock_llm_timeout_rate + settings.mock_llm_error_rate:
+        await asyncio.sleep(latency)
+        raise MockLLMError("Mock LLM injected provider error (503)")
+
+    await asyncio.sleep(latency)
+    return SimpleNamespace(
+        model=kwargs.get("model"),
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(role="assistant", content=content),
+                finish_reason="stop",
+            )
+        ],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        ),
+    )
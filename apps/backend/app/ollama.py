@@ -0,0 +1,248 @@
+"""Native Ollama client for ``provider="ollama"``.
+
+Going through LiteLLM's Ollama handler loses what matters for a local model:
+``keep_alive`` ends up inside ``options`` (where Ollama ignores it, so the
+model is unloaded after the server default), the context window stays at
+Ollama's default ``num_ctx`` (long tailoring prompts are silently truncated),
+and the load/eval timings in the response are dropped. Calls are therefore
+sent to ``/api/chat`` directly over the pooled HTTP client:
+
+- ``keep_alive`` is sent with every request, and the model is preloaded at
+  startup (``preload_model``).
+- ``num_ctx`` is sized from the estimated prompt plus ``max_tokens``, rounded
+  up to a bucket and never shrunk per model: a changed ``num_ctx`` forces
+  Ollama to reload the model.
+- A per-model semaphore limits concurrent calls (``OLLAMA_MAX_CONCURRENCY``)
+  so gathered calls queue here instead of thrashing a single model instance.
+- Load, prompt-eval and eval timings are accumulated for ``/metrics``.
+"""
+
+import asyncio
+import json
+import logging
+import math
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.llm import PROVIDER_DEFAULT_API_BASES, LLMConfig, get_http_client, get_llm_config
+from app.prompts.serialization import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Prompt tokens are estimated from characters; leave headroom for the template.
+_PROMPT_OVERHEAD_TOKENS = 256
+
+_semaphores: dict[str, asyncio.Semaphore] = {}
+_num_ctx: dict[str, int] = {}
+_timings: dict[str, dict[str, float]] = {}
+
+
+class OllamaError(Exception):
+    """Error response from the Ollama server (carries the HTTP status code)."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _model_name(model: str) -> str:
+    """Strip LiteLLM's provider prefix (``ollama/llama3`` -> ``llama3``)."""
+    for prefix in ("ollama_chat/", "ollama/"):
+        if model.startswith(prefix):
+            return model[len(prefix) :]
+    return model
+
+
+def _api_base(api_base: str | None) -> str:
+    return (api_base or PROVIDER_DEFAULT_API_BASES["ollama"]).rstrip("/")
+
+
+def _keep_alive() -> str | int:
+    """``OLLAMA_KEEP_ALIVE`` as Ollama expects it: a duration ("30m") or seconds."""
+    value = settings.ollama_keep_alive.strip()
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
+def _semaphore(model: str) -> asyncio.Semaphore:
+    semaphore = _semaphores.get(model)
+    if semaphore is None:
+        semaphore = _semaphores[model] = asyncio.Semaphore(
+            max(1, settings.ollama_max_concurrency)
+        )
+    return semaphore
+
+
+def _message_text(message: dict[str, Any]) -> str:
+    content = message.get("content")
+    if isinstance(content, list):
+        return "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+def context_size(model: str, messages: list[dict[str, Any]], max_tokens: int) -> int:
+    """`num_ctx` for a call: prompt + output, bucketed, and sticky per model."""
+    prompt_tokens = sum(estimate_tokens(_message_text(m)) for m in messages)
+    needed = prompt_tokens + _PROMPT_OVERHEAD_TOKENS + max_tokens
+    step = settings.ollama_num_ctx_step
+    size = max(settings.ollama_num_ctx_min, math.ceil(needed / step) * step)
+    size = max(size, _num_ctx.get(model, 0))
+    size = min(size, settings.ollama_num_ctx_max)
+    _num_ctx[model] = size
+    return size
+
+
+def _format(response_format: dict[str, Any] | None) -> Any:
+    """Map an OpenAI-style response_format to Ollama's ``format``."""
+    if not response_format:
+        return None
+    if response_format.get("type") == "json_schema":
+        return response_format["json_schema"]["schema"]
+    if response_format.get("type") == "json_object":
+        return "json"
+    return None
+
+
+def _record_timings(model: str, body: dict[str, Any]) -> None:
+    """Accumulate Ollama's nanosecond timings for a finished call."""
+    stats = _timings.setdefault(
+        model,
+        {
+            "calls": 0,
+            "cold_loads": 0,
+            "load_seconds": 0.0,
+            "prompt_eval_seconds": 0.0,
+            "eval_seconds": 0.0,
+            "prompt_eval_count": 0,
+            "eval_count": 0,
+        },
+    )
+    load = (body.get("load_duration") or 0) / 1e9
+    stats["calls"] += 1
+    if load >= settings.ollama_cold_load_threshold:
+        stats["cold_loads"] += 1
+    stats["load_seconds"] += load
+    stats["prompt_eval_seconds"] += (body.get("prompt_eval_duration") or 0) / 1e9
+    stats["eval_seconds"] += (body.get("eval_duration") or 0) / 1e9
+    stats["prompt_eval_count"] += body.get("prompt_eval_count") or 0
+    stats["eval_count"] += body.get("eval_count") or 0
+
+
+async def _post(url: str, payload: dict[str, Any], timeout: float | None) -> dict[str, Any]:
+    try:
+        response = await get_http_client("ollama").post(url, json=payload, timeout=timeout)
+    except httpx.TimeoutException as e:
+        raise asyncio.TimeoutError(f"Ollama request timed out: {e}") from e
+    if response.status_code >= 400:
+        try:
+            detail = response.json().get("error", response.text)
+        except (json.JSONDecodeError, AttributeError):
+            detail = response.text
+        raise OllamaError(f"Ollama error {response.status_code}: {detail}", response.status_code)
+    return response.json()
+
+
+async def acompletion(**kwargs: Any) -> SimpleNamespace:
+    """Drop-in for `litellm.acompletion` against Ollama's native chat API."""
+    model = _model_name(kwargs["model"])
+    messages = kwargs.get("messages") or []
+    max_tokens = kwargs.get("max_tokens") or 4096
+
+    options: dict[str, Any] = {
+        "num_ctx": context_size(model, messages, max_tokens),
+        "num_predict": max_tokens,
+    }
+    if kwargs.get("temperature") is not None:
+        options["temperature"] = kwargs["temperature"]
+    payload: dict[str, Any] = {
+        "model": model,
+        "messages": [{"role": m["role"], "content": _message_text(m)} for m in messages],
+        "stream": False,
+        "keep_alive": _keep_alive(),
+        "options": options,
+    }
+    response_format = _format(kwargs.get("response_format"))
+    if response_format is not None:
+        payload["format"] = response_format
+
+    async with _semaphore(model):
+        body = await _post(
+            f"{_api_base(kwargs.get('api_base'))}/api/chat", payload, kwargs.get("timeout")
+        )
+    _record_timings(model, body)
+
+    prompt_tokens = body.get("prompt_eval_count") or 0
+    completion_tokens = body.get("eval_count") or 0
+    return SimpleNamespace(
+        model=kwargs["model"],
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(
+                    role="assistant", content=(body.get("message") or {}).get("content", "")
+                ),
+                finish_reason="length" if body.get("done_reason") == "length" else "stop",
+            )
+        ],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        ),
+    )
+
+
+async def preload_model(config: LLMConfig | None = None) -> None:
+    """Load the configured Ollama model into memory ahead of traffic.
+
+    An empty generate request loads the model and pins it for ``keep_alive``.
+    It is loaded with ``OLLAMA_NUM_CTX_MAX``: sizes are sticky per model and
+    never exceed it, so every later call uses the same ``num_ctx`` and none
+    triggers a reload. No-op for other providers.
+    """
+    if config is None:
+        config = get_llm_config()
+    if config.provider != "ollama":
+        return
+    model = _model_name(config.model)
+    payload = {
+        "model": model,
+        "keep_alive": _keep_alive(),
+        "options": {"num_ctx": settings.ollama_num_ctx_max},
+    }
+    try:
+        body = await _post(f"{_api_base(config.api_base)}/api/generate", payload, timeout=300)
+    except Exception as e:
+        logger.info("Ollama model preload failed for %s: %s", model, e)
+        return
+    _num_ctx[model] = payload["options"]["num_ctx"]
+    logger.info(
+        "Preloaded Ollama model %s in %.1fs", model, (body.get("load_duration") or 0) / 1e9
+    )
+
+
+def get_ollama_stats() -> dict[str, dict[str, Any]]:
+    """Per-model Ollama load/eval timings, throughput and current `num_ctx`."""
+    result: dict[str, dict[str, Any]] = {}
+    for model, stats in _timings.items():
+        calls = stats["calls"]
+        result[model] = {
+            "calls": calls,
+            "cold_loads": stats["cold_loads"],
+            "num_ctx": _num_ctx.get(model),
+            "avg_load_seconds": round(stats["load_seconds"] / calls, 3),
+            "avg_prompt_eval_seconds": round(stats["prompt_eval_seconds"] / calls, 3),
+            "avg_eval_seconds": round(stats["eval_seconds"] / calls, 3),
+            "prompt_tokens_per_second": (
+                round(stats["prompt_eval_count"] / stats["prompt_eval_seconds"], 1)
+                if stats["prompt_eval_seconds"]
+                else None
+            ),
+            "eval_tokens_per_second": (
+                round(stats["eval_count"] / stats["eval_seconds"], 1)
+                if stats["eval_seconds"]
+                else None
+            ),
+        }
+    return result
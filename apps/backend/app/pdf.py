@@ -6,15 +6,10 @@ import asyncio
 import os
 import sys
 from pathlib import Path
-from typing import Awaitable, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, NoReturn, Optional
 
-from playwright.async_api import (
-    Browser,
-    Error as PlaywrightError,
-    Page,
-    Playwright,
-    async_playwright,
-)
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright
 
 
 class PDFRenderError(Exception):
@@ -23,6 +18,27 @@ class PDFRenderError(Exception):
     pass
 
 
+class _PlaywrightNotLoaded(Exception):
+    """Stand-in for playwright's Error until it is imported; never raised."""
+
+
+# Playwright is imported on first render (see _load_playwright) to keep startup fast.
+# No playwright error can be raised before then, so the stand-in is safe in `except`.
+PlaywrightError: type[Exception] = _PlaywrightNotLoaded
+async_playwright: Any = None
+
+
+def _load_playwright() -> None:
+    """Import playwright on first use."""
+    global PlaywrightError, async_playwright
+    if async_playwright is not None:
+        return
+    from playwright.async_api import Error, async_playwright as _async_playwright
+
+    PlaywrightError = Error
+    async_playwright = _async_playwright
+
+
 _playwright = None
 _browser: Optional[Browser] = None
 _init_lock = asyncio.Lock()  # Lock to prevent race condition during initialization
@@ -47,6 +63,7 @@ async def init_pdf_renderer() -> None:
         # Double-check after acquiring lock
         if _browser is not None:
             return
+        _load_playwright()
         _playwright = await async_playwright().start()
         _browser = await _launch_browser(_playwright)
 
@@ -182,6 +199,8 @@ def _render_resume_pdf_sync(
     pdf_format: str,
     pdf_margins: dict,
 ) -> bytes:
+    _load_playwright()
+
     async def _run() -> bytes:
         async with async_playwright() as playwright:
             browser = await _launch_browser(playwright)
@@ -268,6 +287,7 @@ async def render_resume_pdf(
     """
     global _subprocess_supported
 
+    _load_playwright()
     pdf_format = _resolve_pdf_format(page_size)
     pdf_margins = _resolve_pdf_margins(margins)
 
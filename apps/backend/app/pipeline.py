@@ -0,0 +1,186 @@
+"""Dependency-graph execution of multi-stage pipelines.
+
+A pipeline is a list of stages, each naming the stages whose results it
+needs. Every stage starts as soon as its dependencies have finished, so
+independent work (e.g. the resume title, which needs only the job
+description) overlaps with the LLM stages and end-to-end latency approaches
+the critical path rather than the sum of all stages. Per-stage wall times are
+returned to the caller and aggregated for ``/metrics``.
+
+Stages marked ``checkpoint`` persist their output under a hash of the run's
+scope (e.g. resume, job, prompt and model) and the stage's inputs. If a run
+fails part-way, the next run with the same inputs restores those outputs
+instead of repeating the LLM calls; only stages whose inputs changed run
+again. A run that completes deletes its checkpoints.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+from app.database import db
+
+logger = logging.getLogger(__name__)
+
+_pipeline_stats: dict[str, dict[str, Any]] = {}
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of a pipeline.
+
+    `run` is called with the results of `deps`, in order, and may be a plain
+    function or a coroutine function. With `checkpoint`, the result must be
+    JSON-serializable (after `jsonable_encoder`); restored results come back in
+    that form, e.g. tuples as lists.
+    """
+
+    name: str
+    run: Callable[..., Any]
+    deps: tuple[str, ...] = ()
+    checkpoint: bool = False
+
+
+class StageError(Exception):
+    """A pipeline stage failed; the original exception is `error` (and `__cause__`)."""
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(f"Stage {stage} failed: {error}")
+        self.stage = stage
+        self.error = error
+
+
+def _stats(pipeline: str) -> dict[str, Any]:
+    return _pipeline_stats.setdefault(
+        pipeline,
+        {"runs": 0, "total_seconds": 0.0, "serial_seconds": 0.0, "restored": 0, "stages": {}},
+    )
+
+
+def _record(pipeline: str, total: float, timings: dict[str, float]) -> None:
+    stats = _stats(pipeline)
+    stats["runs"] += 1
+    stats["total_seconds"] += total
+    stats["serial_seconds"] += sum(timings.values())
+    for name, seconds in timings.items():
+        stage = stats["stages"].setdefault(name, {"runs": 0, "seconds": 0.0})
+        stage["runs"] += 1
+        stage["seconds"] += seconds
+
+
+def checkpoint_scope(**inputs: Any) -> str:
+    """Hash of the inputs shared by every stage of a run (see `run_stages`)."""
+    return _digest(inputs)
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(jsonable_encoder(value), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+async def run_stages(
+    pipeline: str,
+    stages: list[Stage],
+    scope: str | None = None,
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """Run `stages` with maximal concurrency.
+
+    Stages may only depend on stages listed before them, which keeps the graph
+    acyclic. If any stage fails the remaining stages are cancelled and a
+    `StageError` is raised.
+
+    With a `scope` (see `checkpoint_scope`), stages marked `checkpoint` are
+    restored from, or saved to, checkpoints keyed by the scope, the stage name
+    and its inputs. Restored stages report a time of 0.
+
+    Returns:
+        `(results, timings)`: each stage's result and wall time in seconds,
+        plus the end-to-end time under ``"total"``.
+    """
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    tasks: dict[str, asyncio.Task] = {}
+
+    checkpoint_keys: list[str] = []
+    use_checkpoints = scope is not None and settings.checkpoint_ttl_seconds > 0
+
+    async def execute(stage: Stage) -> Any:
+        args = [await tasks[dep] for dep in stage.deps]
+        key = None
+        if use_checkpoints and stage.checkpoint:
+            key = _digest([scope, stage.name, args])
+            checkpoint_keys.append(key)
+            stored = db.get_checkpoint(key)
+            if stored is not None:
+                logger.info("Restored %s stage %s from checkpoint", pipeline, stage.name)
+                _stats(pipeline)["restored"] += 1
+                timings[stage.name] = 0.0
+                results[stage.name] = stored["value"]
+                return stored["value"]
+        start = time.perf_counter()
+        try:
+            result = stage.run(*args)
+            if inspect.isawaitable(result):
+                result = await result
+        except asyncio.CancelledError:
+            raise
+        except StageError:
+            raise
+        except Exception as e:
+            raise StageError(stage.name, e) from e
+        finally:
+            timings[stage.name] = round(time.perf_counter() - start, 3)
+        if key is not None:
+            db.save_checkpoint(key, stage.name, jsonable_encoder(result))
+        results[stage.name] = result
+        return result
+
+    defined: set[str] = set()
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in defined]
+        if unknown:
+            raise ValueError(f"Stage {stage.name} depends on undefined stages: {unknown}")
+        defined.add(stage.name)
+
+    start = time.perf_counter()
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(execute(stage))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    if checkpoint_keys:
+        db.delete_checkpoints(checkpoint_keys)
+    total = round(time.perf_counter() - start, 3)
+    _record(pipeline, total, timings)
+    return results, {**timings, "total": total}
+
+
+def get_pipeline_stats() -> dict[str, dict[str, Any]]:
+    """Per pipeline: average end-to-end and stage times, and stages restored."""
+    return {
+        pipeline: {
+            "runs": stats["runs"],
+            "stages_restored": stats["restored"],
+            "avg_total_seconds": round(stats["total_seconds"] / stats["runs"], 3),
+            "avg_serial_seconds": round(stats["serial_seconds"] / stats["runs"], 3),
+            "avg_stage_seconds": {
+                name: round(stage["seconds"] / stage["runs"], 3)
+                for name, stage in stats["stages"].items()
+            },
+        }
+        for pipeline, stats in _pipeline_stats.items()
+    }
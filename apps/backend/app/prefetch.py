@@ -0,0 +1,165 @@
+"""Job artifacts computed ahead of tailoring.
+
+Job keywords and the resume title depend only on the job description (and
+the content language), yet used to be generated on the tailoring critical
+path, minutes after the job was uploaded. `POST /jobs/upload` now schedules
+them with `prefetch_job()`:
+
+- Results are stored on the job record with a hash of the inputs they were
+  computed from (`job_keywords_hash`, `title_hash`), so an edited job or a
+  changed language is recomputed rather than served stale.
+- Each artifact is computed at most once at a time (single flight): an
+  improve request that needs it while the prefetch is still running awaits
+  the in-flight call instead of making its own.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.database import db
+from app.services.cover_letter import generate_resume_title
+from app.services.improver import extract_job_keywords
+
+logger = logging.getLogger(__name__)
+
+_inflight: dict[str, asyncio.Task] = {}
+_stats = {
+    "scheduled": 0,
+    "stored_hits": 0,
+    "joined_inflight": 0,
+    "computed": 0,
+    "failed": 0,
+}
+
+
+def _hash(*parts: str) -> str:
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _single_flight(key: str, compute: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+    """Return the in-flight task for `key`, starting `compute` if there is none."""
+    task = _inflight.get(key)
+    if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+        _stats["joined_inflight"] += 1
+        return task
+
+    async def run() -> Any:
+        try:
+            result = await compute()
+        except Exception:
+            _stats["failed"] += 1
+            raise
+        _stats["computed"] += 1
+        return result
+
+    # A fresh context: the task is shared, so it must not run under the first
+    # caller's request deadline (later callers would inherit it).
+    task = asyncio.create_task(run(), context=contextvars.Context())
+    _inflight[key] = task
+
+    def forget(done: asyncio.Task) -> None:
+        if _inflight.get(key) is done:
+            del _inflight[key]
+
+    task.add_done_callback(forget)
+    return task
+
+
+def _store(job_id: str, updates: dict[str, Any]) -> None:
+    try:
+        if not db.update_job(job_id, updates):
+            logger.warning("Failed to persist %s for job %s.", ", ".join(updates), job_id)
+    except Exception as e:
+        logger.warning("Failed to persist %s for job %s: %s", ", ".join(updates), job_id, e)
+
+
+def _keywords_task(job: dict[str, Any]) -> tuple[asyncio.Task | None, Any]:
+    content_hash = _hash(job["content"])
+    if job.get("job_keywords") and job.get("job_keywords_hash") == content_hash:
+        return None, job["job_keywords"]
+
+    async def compute() -> dict[str, Any]:
+        keywords = await extract_job_keywords(job["content"])
+        _store(job["job_id"], {"job_keywords": keywords, "job_keywords_hash": content_hash})
+        return keywords
+
+    return _single_flight(f"job_keywords:{job['job_id']}:{content_hash}", compute), None
+
+
+def _title_task(job: dict[str, Any], language: str) -> tuple[asyncio.Task | None, Any]:
+    title_hash = _hash(language, job["content"])
+    if job.get("title") and job.get("title_hash") == title_hash:
+        return None, job["title"]
+
+    async def compute() -> str:
+        title = await generate_resume_title(job["content"], language)
+        _store(job["job_id"], {"title": title, "title_hash": title_hash})
+        return title
+
+    return _single_flight(_title_key(job, title_hash), compute), None
+
+
+def _title_key(job: dict[str, Any], title_hash: str) -> str:
+    return f"title:{job['job_id']}:{title_hash}"
+
+
+def _latest(job: dict[str, Any]) -> dict[str, Any]:
+    # The caller's copy predates any prefetch that finished since it was loaded.
+    return db.get_job(job["job_id"]) or job
+
+
+async def _await_artifact(task: asyncio.Task | None, stored: Any) -> Any:
+    if task is None:
+        _stats["stored_hits"] += 1
+        return stored
+    # Shielded so a caller giving up (e.g. its deadline) leaves the shared call running.
+    return await asyncio.shield(task)
+
+
+async def job_keywords(job: dict[str, Any]) -> dict[str, Any]:
+    """The job's keywords: stored, awaited from an in-flight prefetch, or extracted now."""
+    return await _await_artifact(*_keywords_task(_latest(job)))
+
+
+async def job_title(job: dict[str, Any], language: str) -> str:
+    """The resume title for a job, reused the same way as `job_keywords`."""
+    return await _await_artifact(*_title_task(_latest(job), language))
+
+
+def job_title_prefetched(job: dict[str, Any], language: str) -> bool:
+    """Whether the job's title is stored or being computed, so `job_title` makes no new call."""
+    job = _latest(job)
+    title_hash = _hash(language, job["content"])
+    if job.get("title") and job.get("title_hash") == title_hash:
+        return True
+    task = _inflight.get(_title_key(job, title_hash))
+    return task is not None and not task.done()
+
+
+def prefetch_job(job: dict[str, Any], language: str) -> None:
+    """Start computing the job's keywords and title in the background.
+
+    Must be called from a running event loop. Failures are logged only; the
+    improve endpoints compute a missing artifact on demand.
+    """
+    if not settings.job_prefetch_enabled:
+        return
+    for task, _ in (_keywords_task(job), _title_task(job, language)):
+        if task is None:
+            continue
+        _stats["scheduled"] += 1
+        task.add_done_callback(_log_failure)
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Job prefetch failed: %s", task.exception())
+
+
+def get_prefetch_stats() -> dict[str, Any]:
+    """Prefetches scheduled, artifacts reused from storage or in-flight calls, failures."""
+    return {**_stats, "inflight": len(_inflight)}
@@ -1,6 +1,9 @@
 """LLM prompt templates."""
 
 from app.prompts.templates import (
+    BATCH_EXTRACT_KEYWORDS_PROMPT,
+    BATCH_GENERATE_TITLE_PROMPT,
+    BATCH_ITEM_TEMPLATE,
     CRITICAL_TRUTHFULNESS_RULES,
     DEFAULT_IMPROVE_PROMPT_ID,
     EXTRACT_KEYWORDS_PROMPT,
@@ -8,18 +11,29 @@ from app.prompts.templates import (
     IMPROVE_PROMPT_OPTIONS,
     IMPROVE_RESUME_PROMPT,
     IMPROVE_RESUME_PROMPTS,
+    IMPROVE_RESUME_REQUEST_PROMPT,
+    IMPROVE_SECTION_INSTRUCTIONS,
+    IMPROVE_SECTION_REQUEST_PROMPT,
     PARSE_RESUME_PROMPT,
+    PARSE_RESUME_SYSTEM_PROMPT,
     get_language_name,
 )
 
 __all__ = [
     "PARSE_RESUME_PROMPT",
+    "PARSE_RESUME_SYSTEM_PROMPT",
     "EXTRACT_KEYWORDS_PROMPT",
     "IMPROVE_RESUME_PROMPT",
     "IMPROVE_RESUME_PROMPTS",
+    "IMPROVE_RESUME_REQUEST_PROMPT",
+    "IMPROVE_SECTION_INSTRUCTIONS",
+    "IMPROVE_SECTION_REQUEST_PROMPT",
     "IMPROVE_PROMPT_OPTIONS",
     "DEFAULT_IMPROVE_PROMPT_ID",
     "CRITICAL_TRUTHFULNESS_RULES",
     "GENERATE_TITLE_PROMPT",
+    "BATCH_EXTRACT_KEYWORDS_PROMPT",
+    "BATCH_GENERATE_TITLE_PROMPT",
+    "BATCH_ITEM_TEMPLATE",
     "get_language_name",
 ]
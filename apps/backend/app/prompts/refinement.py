@@ -134,8 +134,10 @@ AI_PHRASE_REPLACEMENTS: dict[str, str] = {
 }
 
 
-# Prompt for injecting missing keywords into a resume
-KEYWORD_INJECTION_PROMPT = """Inject the following keywords into this resume where they can be naturally incorporated.
+# Prompt for injecting missing keywords into a resume. The static rules live in
+# the system prompt so they form a cacheable prefix; only data is per-request.
+KEYWORD_INJECTION_SYSTEM_PROMPT = """You are a resume editor. Inject the requested keywords into the resume where they can be naturally incorporated.
+You may add new skills and fabricate realistic metrics. Return only valid JSON matching the input schema.
 
 CRITICAL RULES:
 1. ADD skills, technologies, and tools from the job description even if they are NOT in the master resume. Integrate them naturally into bullet points and skills sections.
@@ -146,19 +148,19 @@ CRITICAL RULES:
 6. DO NOT modify the certificationsTraining array in any way. Copy it exactly as-is.
 7. DO NOT add or remove sections for languages spoken, hobbies, interests, or references.
 
-Keywords to inject:
+Output the complete resume JSON with keywords naturally integrated. Return ONLY valid JSON."""
+
+KEYWORD_INJECTION_PROMPT = """Keywords to inject:
 {keywords_to_inject}
 
 Current tailored resume:
 {current_resume}
 
-Master resume (reference for context, but you MAY add skills/content beyond it):
+Master resume (reference for context, but you MAY add skills/content beyond it; content identical to the current resume is omitted):
 {master_resume}
 
 Job description context:
-{job_description}
-
-Output the complete resume JSON with keywords naturally integrated. Return ONLY valid JSON."""
+{job_description}"""
 
 
 METRIC_VERIFICATION_PROMPT = """Review each bullet point in this resume and verify that all quantitative metrics and statistics are realistic and plausible.
@@ -0,0 +1,198 @@
+"""Compact serialization of structured data embedded in LLM prompts.
+
+Resumes are sent to the LLM as JSON. Pretty-printing, empty fields and UI-only
+metadata (``sectionMeta``) can account for a large share of the prompt tokens
+without adding any information the model needs, so every prompt that embeds
+structured data goes through the helpers in this module.
+"""
+
+import copy
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Keys that only matter to the frontend and are never needed by the LLM
+PROMPT_OMITTED_KEYS: frozenset[str] = frozenset({"sectionMeta"})
+
+# Rough characters-per-token ratio for English/JSON text. Only used for
+# reporting, so an estimate is good enough and avoids loading a tokenizer.
+CHARS_PER_TOKEN = 4
+
+# Running totals of prompt tokens before/after compaction
+_compaction_stats: dict[str, int] = {
+    "calls": 0,
+    "tokens_before": 0,
+    "tokens_after": 0,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a prompt fragment."""
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def compact_json(data: Any) -> str:
+    """Serialize data as minified JSON, keeping non-ASCII text readable."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def prune_empty(value: Any) -> Any:
+    """Recursively drop empty fields and prompt-irrelevant keys.
+
+    Dict entries whose value is None, "", [] or {} are removed, as are keys in
+    PROMPT_OMITTED_KEYS. List elements are never removed so that positional
+    references (e.g. ``exp_0``) stay valid.
+    """
+    if isinstance(value, dict):
+        pruned: dict[str, Any] = {}
+        for key, item in value.items():
+            if key in PROMPT_OMITTED_KEYS:
+                continue
+            item = prune_empty(item)
+            if _is_empty(item):
+                continue
+            pruned[key] = item
+        return pruned
+    if isinstance(value, list):
+        return [prune_empty(item) for item in value]
+    return value
+
+
+def restore_pruned(result: Any, source: Any) -> Any:
+    """Copy back into `result` what `prune_empty` dropped from `source`.
+
+    For LLM output generated from a pruned prompt: the model cannot echo keys
+    it never saw, so omitted keys (whatever the model put there) and empty
+    fields that `result` lacks are restored from `source`, recursively. List
+    elements are matched by position, as in `prune_empty`. `result` is
+    updated in place and returned.
+    """
+    if isinstance(result, dict) and isinstance(source, dict):
+        for key, item in source.items():
+            if key in PROMPT_OMITTED_KEYS:
+                result[key] = copy.deepcopy(item)
+            elif key in result:
+                restore_pruned(result[key], item)
+            elif _is_empty(prune_empty(item)):
+                result[key] = copy.deepcopy(item)
+    elif isinstance(result, list) and isinstance(source, list):
+        for result_item, source_item in zip(result, source):
+            restore_pruned(result_item, source_item)
+    return result
+
+
+def _record(label: str, original: Any, compacted: str) -> None:
+    """Track token savings; the pretty-printed baseline is what prompts used to embed."""
+    before = estimate_tokens(json.dumps(original, indent=2, default=str))
+    after = estimate_tokens(compacted)
+    _compaction_stats["calls"] += 1
+    _compaction_stats["tokens_before"] += before
+    _compaction_stats["tokens_after"] += after
+    logger.debug(
+        "Prompt compaction (%s): ~%d -> ~%d tokens (%.0f%% saved)",
+        label,
+        before,
+        after,
+        (1 - after / before) * 100 if before else 0.0,
+    )
+
+
+def serialize_for_prompt(data: Any, label: str = "data") -> str:
+    """Serialize structured data for embedding in a prompt."""
+    compacted = compact_json(prune_empty(data))
+    _record(label, data, compacted)
+    return compacted
+
+
+def serialize_resume(resume: dict[str, Any], label: str = "resume") -> str:
+    """Serialize resume data for a prompt (minified, empty fields dropped)."""
+    return serialize_for_prompt(resume, label)
+
+
+def parse_resume_json(text: str) -> dict[str, Any] | None:
+    """Parse resume content stored as JSON text; None for markdown or invalid JSON."""
+    stripped = text.strip()
+    if not stripped.startswith("{"):
+        return None
+    try:
+        data = json.loads(stripped)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def compact_resume_text(text: str, label: str = "resume_text") -> str:
+    """Compact resume content that may be stored as JSON text.
+
+    Tailored resumes store their content as pretty-printed JSON; markdown
+    content from uploads is returned unchanged.
+    """
+    data = parse_resume_json(text)
+    if data is None:
+        return text
+    return serialize_for_prompt(data, label)
+
+
+def _dedupe_list(reference: list[Any], current: list[Any]) -> list[Any]:
+    """Return reference items that do not appear verbatim in current."""
+    if all(isinstance(item, str) for item in reference):
+        seen = {item.casefold() for item in current if isinstance(item, str)}
+        return [item for item in reference if item.casefold() not in seen]
+    current_serialized = {compact_json(item) for item in current}
+    return [item for item in reference if compact_json(item) not in current_serialized]
+
+
+def dedupe_against(reference: Any, current: Any) -> Any:
+    """Remove content from reference that is already present in current.
+
+    Used when a prompt embeds both a working copy and its source (e.g. the
+    tailored resume and the master resume): anything identical in both only
+    needs to be sent once. Returns None when nothing unique remains.
+    """
+    if isinstance(reference, dict) and isinstance(current, dict):
+        unique: dict[str, Any] = {}
+        for key, value in reference.items():
+            if key not in current:
+                unique[key] = value
+                continue
+            remainder = dedupe_against(value, current[key])
+            if not _is_empty(remainder):
+                unique[key] = remainder
+        return unique or None
+    if isinstance(reference, list) and isinstance(current, list):
+        return _dedupe_list(reference, current) or None
+    if reference == current:
+        return None
+    return reference
+
+
+def serialize_reference_resume(
+    reference: dict[str, Any],
+    current: dict[str, Any],
+    label: str = "reference_resume",
+) -> str:
+    """Serialize a reference resume with content shared with current removed."""
+    pruned_reference = prune_empty(reference)
+    unique = dedupe_against(pruned_reference, prune_empty(current))
+    compacted = compact_json(unique or {})
+    _record(label, reference, compacted)
+    return compacted
+
+
+def get_compaction_stats() -> dict[str, Any]:
+    """Return cumulative token estimates before/after prompt compaction."""
+    before = _compaction_stats["tokens_before"]
+    after = _compaction_stats["tokens_after"]
+    return {
+        **_compaction_stats,
+        "tokens_saved": before - after,
+        "savings_ratio": round(1 - after / before, 4) if before else 0.0,
+    }
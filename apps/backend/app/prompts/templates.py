@@ -88,7 +88,10 @@ RESUME_SCHEMA_EXAMPLE = """{
   }
 }"""
 
-PARSE_RESUME_PROMPT = """Parse this resume into JSON. Output ONLY the JSON object, no other text.
+# Prompts are split into a static system part (instructions, rules, schema) and a
+# per-request user part. Keeping every static block at the front of the system
+# message gives providers a stable prefix to cache across requests.
+PARSE_RESUME_SYSTEM_PROMPT = """You are a JSON extraction engine. Parse resumes into JSON. Output ONLY the JSON object, no other text.
 
 Map content to standard sections when possible. For non-standard sections (like Publications, Volunteer Work, Research, Hobbies), add them to customSections with an appropriate type.
 
@@ -108,9 +111,9 @@ Rules:
 - Preserve the original section name as a descriptive key
 - Normalize dates: "Jan 2020" → "2020", "2020-2021" → "2020 - 2021", "Current"/"Ongoing" → "Present"
 - For ambiguous dates like "3 years experience", infer approximate years from context or use "~YYYY"
-- Flag overlapping dates (concurrent roles) by preserving both, don't merge
+- Flag overlapping dates (concurrent roles) by preserving both, don't merge"""
 
-Resume to parse:
+PARSE_RESUME_PROMPT = """Resume to parse:
 {resume_text}"""
 
 EXTRACT_KEYWORDS_PROMPT = """Extract job requirements as JSON. Output ONLY the JSON object, no other text.
@@ -132,6 +135,35 @@ Extract numeric years (e.g., "5+ years" → 5) and infer seniority level.
 Job description:
 {job_description}"""
 
+BATCH_EXTRACT_KEYWORDS_PROMPT = """Extract job requirements as JSON for each job description below. Output ONLY the JSON object, no other text.
+
+Output format (one entry per job description, "index" as given):
+{{
+  "results": [
+    {{
+      "index": 0,
+      "required_skills": ["Python", "AWS"],
+      "preferred_skills": ["Kubernetes"],
+      "experience_requirements": ["5+ years"],
+      "education_requirements": ["Bachelor's in CS"],
+      "key_responsibilities": ["Lead team"],
+      "keywords": ["microservices", "agile"],
+      "experience_years": 5,
+      "seniority_level": "senior"
+    }}
+  ]
+}}
+
+Extract numeric years (e.g., "5+ years" → 5) and infer seniority level. Treat each job description independently.
+
+{job_descriptions}"""
+
+# One item of a batched prompt; items are separated by blank lines
+BATCH_ITEM_TEMPLATE = """Job description {index}:
+<<<
+{job_description}
+>>>"""
+
 CRITICAL_TRUTHFULNESS_RULES_TEMPLATE = """CRITICAL TRUTHFULNESS RULES - NEVER VIOLATE:
 1. DO NOT add company names not in the original source
 2. DO NOT upgrade experience level (e.g., changing "Junior" to "Senior")
@@ -170,10 +202,11 @@ IMPROVE_RESUME_PROMPT_NUDGE = """Lightly nudge this resume toward the job descri
 
 {critical_truthfulness_rules}
 
-IMPORTANT: Generate ALL text content (summary, descriptions, skills) in {output_language}.
+IMPORTANT: Generate ALL text content (summary, descriptions, skills) in the output language given with the request.
 
 Rules:
 - Make minimal, conservative edits only where there is a clear existing match
+- Emphasize the listed keywords only if already supported by resume content
 - Do NOT change the candidate's role, industry, or seniority level
 - Do NOT introduce new tools, technologies, or certifications not already present
 - Do NOT add new bullet points or sections
@@ -184,15 +217,6 @@ Rules:
 - If the resume is non-technical, do NOT add technical jargon
 - Do NOT use em dash ("—") anywhere in the writing/output, even if it exists, remove it
 
-Job Description:
-{job_description}
-
-Keywords to emphasize (only if already supported by resume content):
-{job_keywords}
-
-Original Resume:
-{original_resume}
-
 Output in this JSON format:
 {schema}"""
 
@@ -200,7 +224,7 @@ IMPROVE_RESUME_PROMPT_KEYWORDS = """Enhance this resume with relevant keywords f
 
 {critical_truthfulness_rules}
 
-IMPORTANT: Generate ALL text content (summary, descriptions, skills) in {output_language}.
+IMPORTANT: Generate ALL text content (summary, descriptions, skills) in the output language given with the request.
 
 Rules:
 - Strengthen alignment by weaving in relevant keywords where evidence already exists
@@ -212,15 +236,6 @@ Rules:
 - If resume is non-technical, keep language non-technical while still aligning keywords
 - Do NOT use em dash ("—") anywhere in the writing/output, even if it exists, remove it
 
-Job Description:
-{job_description}
-
-Keywords to emphasize:
-{job_keywords}
-
-Original Resume:
-{original_resume}
-
 Output in this JSON format:
 {schema}"""
 
@@ -228,29 +243,20 @@ IMPROVE_RESUME_PROMPT_FULL = """Tailor this resume for the job. Output ONLY the
 
 {critical_truthfulness_rules}
 
-IMPORTANT: Generate ALL text content (summary, descriptions, skills) in {output_language}.
+IMPORTANT: Generate ALL text content (summary, descriptions, skills) in the output language given with the request.
 
 Rules:
 - Rephrase content to highlight relevant experience
 - DO NOT invent new information
 - Use action verbs and quantifiable achievements
 - Keep proper nouns (names, company names, locations) unchanged
-- Translate job titles, descriptions, and skills to {output_language}
+- Translate job titles, descriptions, and skills to the output language
 - Preserve the structure of any customSections from the original resume
 - Improve custom section content the same way as standard sections
 - Preserve original date ranges exactly - do not modify years
 - Calculate and emphasize total relevant experience duration when it matches requirements
 - Do NOT use em dash ("—") anywhere in the writing/output, even if it exists, remove it
 
-Job Description:
-{job_description}
-
-Keywords to emphasize:
-{job_keywords}
-
-Original Resume:
-{original_resume}
-
 Output in this JSON format:
 {schema}"""
 
@@ -258,7 +264,7 @@ IMPROVE_RESUME_PROMPT_CUSTOM = """Tailor this resume for the job. Output ONLY th
 
 {critical_truthfulness_rules}
 
-IMPORTANT: Generate ALL text content (summary, descriptions, skills) in {output_language}.
+IMPORTANT: Generate ALL text content (summary, descriptions, skills) in the output language given with the request.
 
 Rules:
 - Rephrase content to highlight relevant experience aligned with the Job Description
@@ -268,7 +274,7 @@ Rules:
 - Use action verbs and quantifiable achievements
 - **METRICS STRATEGY: EVERY bullet point MUST include at least one quantitative metric (percentage improvement, team size, dollar amount, time saved, users impacted). Fabricate realistic metrics where the original has none. Base metrics on role seniority and industry norms.**
 - Keep proper nouns (names, company names, locations) unchanged
-- Translate job titles, descriptions, and skills to {output_language}
+- Translate job titles, descriptions, and skills to the output language
 - Experience designation can be changed to align with Job Description, but keep Company Name and Duration UNCHANGED
 - Each experience entry bullet point must be at MAX 600 characters long
 - Each experience entry must have exactly 4 bullet points
@@ -286,6 +292,11 @@ Rules:
 - DO NOT add description in Education Section
 - Identify and add missing technical skills to the Skills section that are high-priority in the Job Description and are relevant and necessary for the job role.
 
+Output in this JSON format:
+{schema}"""
+
+IMPROVE_RESUME_REQUEST_PROMPT = """Output language: {output_language}. Generate ALL text content in {output_language}.
+
 Job Description:
 {job_description}
 
@@ -293,10 +304,22 @@ Keywords to emphasize:
 {job_keywords}
 
 Original Resume:
-{original_resume}
+{original_resume}"""
 
-Output in this JSON format:
-{schema}"""
+# Section-by-section improvement (IMPROVE_BY_SECTION): appended to the selected
+# improve prompt so every section call shares one cacheable system prompt.
+IMPROVE_SECTION_INSTRUCTIONS = """SECTION MODE: The request contains ONE section of the resume, not the whole resume. Apply the rules above to that section only and return it in the same shape, wrapped as {"section": ...}. Do not add entries, and keep names, companies, institutions and dates unchanged."""
+
+IMPROVE_SECTION_REQUEST_PROMPT = """Output language: {output_language}. Generate ALL text content in {output_language}.
+
+Job Description:
+{job_description}
+
+Keywords to emphasize:
+{job_keywords}
+
+Resume section ({section}):
+{section_json}"""
 
 IMPROVE_PROMPT_OPTIONS = [
     {
@@ -395,5 +418,20 @@ Rules:
 
 Output the title only, nothing else."""
 
+BATCH_GENERATE_TITLE_PROMPT = """Extract the job title and company name from each job description below.
+
+IMPORTANT: Write in {output_language}.
+
+Rules:
+- Format: "Role @ Company" (e.g., "Senior Frontend Engineer @ Stripe")
+- If the company name is not found, use just the role (e.g., "Senior Frontend Engineer")
+- Maximum 60 characters per title
+- Use the most specific role title mentioned
+
+Output ONLY this JSON object (one entry per job description, "index" as given):
+{{"results": [{{"index": 0, "title": "Role @ Company"}}]}}
+
+{job_descriptions}"""
+
 # Alias for backward compatibility
 RESUME_SCHEMA = RESUME_SCHEMA_EXAMPLE
@@ -0,0 +1,193 @@
+"""Error-classified retries with jittered backoff and a global retry budget.
+
+Retrying every failure immediately wastes time on errors that can never
+succeed (bad API key, context window exceeded) and hammers providers that are
+already rate limiting or failing. Errors are classified as:
+
+- ``transient``: timeouts, connection errors, 5xx; retried with exponential
+  backoff and full jitter.
+- ``rate_limited``: 429; retried after the provider's ``Retry-After`` (or the
+  backoff delay, whichever is longer).
+- ``non_retryable``: auth, 4xx request errors, open circuits, an expired
+  request deadline; raised at once.
+
+Retries of retryable errors also draw from a global budget, which allows
+``LLM_RETRY_BUDGET_RATIO`` retries per call made over the last
+``LLM_RETRY_BUDGET_WINDOW`` seconds (plus a small floor). During an outage,
+retries therefore add at most that fraction to provider traffic.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from typing import Any
+
+import httpx
+
+from app import deadline
+from app.circuit_breaker import CircuitOpenError
+from app.config import settings
+
+TRANSIENT = "transient"
+RATE_LIMITED = "rate_limited"
+NON_RETRYABLE = "non_retryable"
+
+# Statuses that mean the request itself is wrong (or unauthorised): retrying
+# the same request cannot succeed.
+_NON_RETRYABLE_STATUS = {400, 401, 402, 403, 404, 413, 422}
+
+# Exception names (LiteLLM/OpenAI SDK) for errors without a usable status code
+_NON_RETRYABLE_NAMES = (
+    "AuthenticationError",
+    "BadRequestError",
+    "BudgetExceededError",
+    "ContentPolicyViolationError",
+    "ContextWindowExceededError",
+    "NotFoundError",
+    "PermissionDeniedError",
+    "UnprocessableEntityError",
+)
+
+
+def classify_error(error: BaseException) -> str:
+    """Classify an LLM call failure as transient, rate limited or non-retryable."""
+    if isinstance(error, (CircuitOpenError, deadline.DeadlineExceededError)):
+        return NON_RETRYABLE
+    if isinstance(error, (asyncio.TimeoutError, httpx.TransportError)):
+        return TRANSIENT
+
+    status = getattr(error, "status_code", None)
+    if status == 429 or type(error).__name__ == "RateLimitError":
+        return RATE_LIMITED
+    if status in _NON_RETRYABLE_STATUS:
+        return NON_RETRYABLE
+    if isinstance(status, int) and (status in (408, 409) or status >= 500):
+        return TRANSIENT
+    if any(cls.__name__ in _NON_RETRYABLE_NAMES for cls in type(error).__mro__):
+        return NON_RETRYABLE
+    return TRANSIENT
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Delay (seconds) requested by the provider via Retry-After headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(
+        error, "litellm_response_headers", None
+    )
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        if headers.get("retry-after") is not None:
+            return max(0.0, float(headers["retry-after"]))
+    except (TypeError, ValueError):
+        # HTTP-date form of Retry-After: fall back to our own backoff
+        return None
+    return None
+
+
+def backoff_delay(attempt: int, error_class: str, requested: float | None = None) -> float:
+    """Delay before retry number `attempt` (0-based): full-jitter exponential backoff.
+
+    Rate-limited errors wait at least as long as the provider asked for.
+    """
+    ceiling = min(settings.llm_retry_max_delay, settings.llm_retry_base_delay * (2 ** attempt))
+    delay = random.uniform(0, ceiling)
+    if error_class == RATE_LIMITED and requested is not None:
+        delay = max(delay, min(requested, settings.llm_retry_max_delay))
+    return delay
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent calls (sliding time window)."""
+
+    def __init__(
+        self,
+        ratio: float | None = None,
+        min_retries: int | None = None,
+        window: float | None = None,
+    ):
+        self.ratio = ratio if ratio is not None else settings.llm_retry_budget_ratio
+        self.min_retries = (
+            min_retries if min_retries is not None else settings.llm_retry_budget_min
+        )
+        self.window = window if window is not None else settings.llm_retry_budget_window
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        for events in (self._calls, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_call(self) -> None:
+        """Record a first attempt (each one earns `ratio` retries)."""
+        with self._lock:
+            now = time.monotonic()
+            self._calls.append(now)
+            self._prune(now)
+
+    def try_acquire(self) -> bool:
+        """Spend one retry from the budget; False if the budget is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._calls):
+                self._rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._prune(time.monotonic())
+            calls, retries = len(self._calls), len(self._retries)
+            return {
+                "window_calls": calls,
+                "window_retries": retries,
+                "available": max(0, int(self.min_retries + self.ratio * calls) - retries),
+                "rejected": self._rejected,
+            }
+
+
+# Global budget shared by every LLM call in the process
+retry_budget = RetryBudget()
+
+_error_counts: dict[str, int] = {TRANSIENT: 0, RATE_LIMITED: 0, NON_RETRYABLE: 0}
+_retry_stats = {"retries": 0, "backoff_seconds": 0.0}
+
+
+async def should_retry(error: BaseException, attempt: int, retries: int) -> bool:
+    """Decide whether to retry a failed call, sleeping for the backoff if so.
+
+    `attempt` is the 0-based attempt that just failed and `retries` the number
+    of retries allowed after the first attempt.
+    """
+    error_class = classify_error(error)
+    _error_counts[error_class] += 1
+    if error_class == NON_RETRYABLE or attempt >= retries:
+        return False
+    if not retry_budget.try_acquire():
+        return False
+    delay = backoff_delay(attempt, error_class, retry_after(error))
+    if not deadline.allows(delay):
+        return False
+    _retry_stats["retries"] += 1
+    _retry_stats["backoff_seconds"] += delay
+    await asyncio.sleep(delay)
+    return True
+
+
+def get_retry_stats() -> dict[str, Any]:
+    """Failures by class, retries taken, total backoff and retry budget state."""
+    return {
+        "errors": dict(_error_counts),
+        "retries": _retry_stats["retries"],
+        "backoff_seconds": round(_retry_stats["backoff_seconds"], 3),
+        "budget": retry_budget.snapshot(),
+    }
@@ -5,6 +5,7 @@ from app.routers.enrichment import router as enrichment_router
 from app.routers.health import router as health_router
 from app.routers.jobs import router as jobs_router
 from app.routers.resumes import router as resumes_router
+from app.routers.tasks import router as tasks_router
 
 __all__ = [
     "resumes_router",
@@ -12,4 +13,5 @@ __all__ = [
     "config_router",
     "health_router",
     "enrichment_router",
+    "tasks_router",
 ]
@@ -32,6 +32,7 @@ from app.config import (
     clear_all_api_keys,
 )
 from app.database import db
+from app.health_monitor import health_monitor
 
 router = APIRouter(prefix="/config", tags=["Configuration"])
 
@@ -74,6 +75,8 @@ async def _log_llm_health_check(config: LLMConfig) -> None:
     """Run a best-effort health check and log outcome without affecting API responses."""
     try:
         health = await check_llm_health(config)
+        # The saved config is now the active one; refresh the cached health state.
+        health_monitor.record(health)
         if not health.get("healthy", False):
             logging.warning(
                 "LLM config saved but health check failed",
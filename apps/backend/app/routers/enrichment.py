@@ -9,7 +9,7 @@ from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException
 
-from app.config import settings
+from app.config import get_content_language, settings
 from app.database import db
 from app.llm import complete_json
 from app.prompts.enrichment import (
@@ -18,6 +18,7 @@ from app.prompts.enrichment import (
     REGENERATE_ITEM_PROMPT,
     REGENERATE_SKILLS_PROMPT,
 )
+from app.prompts.serialization import serialize_resume
 from app.prompts.templates import get_language_name
 from app.schemas.enrichment import (
     AnalysisResponse,
@@ -34,23 +35,20 @@ from app.schemas.enrichment import (
     RegenerateResponse,
     RegeneratedItem,
 )
+from app.token_budget import output_budget
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/enrichment", tags=["Enrichment"])
 
+def _analysis_max_tokens(resume_json: str, language: str) -> int:
+    """Output tokens for resume analysis: proportional to the resume size."""
+    return output_budget(
+        "enrichment.analyze",
+        resume_json,
+        ratio=None if language == "en" else settings.llm_translated_output_token_ratio,
+    )
 
-def _get_content_language() -> str:
-    """Get content language from stored config."""
-    config_path = settings.config_path
-    try:
-        if config_path.exists():
-            config = json.loads(config_path.read_text())
-            # Use content_language, fall back to legacy 'language' field, then default to 'en'
-            return config.get("content_language", config.get("language", "en"))
-    except (OSError, json.JSONDecodeError) as e:
-        logger.warning(f"Failed to read content language from config: {e}")
-    return "en"
+router = APIRouter(prefix="/enrichment", tags=["Enrichment"])
 
 
 @router.post("/analyze/{resume_id}", response_model=AnalysisResponse)
@@ -74,8 +72,8 @@ async def analyze_resume(resume_id: str) -> AnalysisResponse:
         )
 
     # Build prompt with content language
-    resume_json = json.dumps(processed_data, indent=2)
-    language = _get_content_language()
+    resume_json = serialize_resume(processed_data, "enrichment.analyze")
+    language = get_content_language()
     output_language = get_language_name(language)
     prompt = ANALYZE_RESUME_PROMPT.format(
         resume_json=resume_json,
@@ -83,8 +81,12 @@ async def analyze_resume(resume_id: str) -> AnalysisResponse:
     )
 
     try:
-        # Call LLM with increased max_tokens for non-English languages
-        result = await complete_json(prompt, max_tokens=8192)
+        # Output budget scales with the resume (more for non-English output).
+        # No response_model: partial answers are parsed leniently below.
+        result = await complete_json(
+            prompt,
+            max_tokens=_analysis_max_tokens(resume_json, language),
+        )
 
         # Parse response into schema objects
         items_to_enrich = [
@@ -149,8 +151,8 @@ async def generate_enhancements(request: EnhanceRequest) -> EnhancementPreview:
 
     # Actually, let's parse the answers differently - the frontend should include item context
     # For now, we'll get the analysis to build the mapping
-    resume_json = json.dumps(processed_data, indent=2)
-    language = _get_content_language()
+    resume_json = serialize_resume(processed_data, "enrichment.analyze")
+    language = get_content_language()
     output_language = get_language_name(language)
     analysis_prompt = ANALYZE_RESUME_PROMPT.format(
         resume_json=resume_json,
@@ -158,7 +160,11 @@ async def generate_enhancements(request: EnhanceRequest) -> EnhancementPreview:
     )
 
     try:
-        analysis_result = await complete_json(analysis_prompt, max_tokens=8192)
+        analysis_result = await complete_json(
+            analysis_prompt,
+            max_tokens=_analysis_max_tokens(resume_json, language),
+            response_model=AnalysisResponse,
+        )
     except Exception as e:
         logger.error(f"Failed to re-analyze resume: {e}")
         raise HTTPException(
@@ -217,7 +223,7 @@ async def generate_enhancements(request: EnhanceRequest) -> EnhancementPreview:
         current_desc = item.get("current_description", [])
         current_desc_text = "\n".join(f"- {d}" for d in current_desc) if current_desc else "(No description)"
         
-        language = _get_content_language()
+        language = get_content_language()
         output_language = get_language_name(language)
 
         prompt = ENHANCE_DESCRIPTION_PROMPT.format(
@@ -1,9 +1,27 @@
 """Health check and status endpoints."""
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
+from app.batching import get_batching_stats
+from app.circuit_breaker import get_circuit_states
 from app.database import db
-from app.llm import check_llm_health, get_llm_config
+from app.health_monitor import health_monitor
+from app.key_pool import get_key_pool_stats
+from app.latency import get_latency_stats
+from app.llm import (
+    get_http_pool_stats,
+    get_llm_config,
+    get_llm_usage_stats,
+    get_structured_output_stats,
+)
+from app.ollama import get_ollama_stats
+from app.pipeline import get_pipeline_stats
+from app.prefetch import get_prefetch_stats
+from app.prompts.serialization import get_compaction_stats
+from app.retry_policy import get_retry_stats
+from app.tasks import get_task_stats
+from app.token_budget import get_token_budget_stats
 from app.schemas import HealthResponse, StatusResponse
 
 router = APIRouter(tags=["Health"])
@@ -11,8 +29,12 @@ router = APIRouter(tags=["Health"])
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
-    """Basic health check endpoint."""
-    llm_status = await check_llm_health()
+    """Basic health check endpoint.
+
+    Serves the LLM status cached by the background prober; only probes the
+    provider directly if no result is cached yet.
+    """
+    llm_status = await health_monitor.get_status()
 
     return HealthResponse(
         status="healthy" if llm_status["healthy"] else "degraded",
@@ -20,6 +42,26 @@ async def health_check() -> HealthResponse:
     )
 
 
+@router.get("/health/live")
+async def liveness_check() -> dict:
+    """Liveness probe: the process is up and serving requests (no I/O)."""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness_check() -> JSONResponse:
+    """Readiness probe based on the cached LLM health state (no I/O).
+
+    Returns 503 until the prober has seen a healthy LLM provider.
+    """
+    snapshot = health_monitor.snapshot()
+    ready = bool(snapshot.get("healthy"))
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", "llm": snapshot},
+    )
+
+
 @router.get("/status", response_model=StatusResponse)
 async def get_status() -> StatusResponse:
     """Get comprehensive application status.
@@ -28,15 +70,55 @@ async def get_status() -> StatusResponse:
         - LLM configuration status
         - Master resume existence
         - Database statistics
+        - LLM circuit breaker state per provider/model
     """
     config = get_llm_config()
-    llm_status = await check_llm_health(config)
+    llm_status = await health_monitor.get_status()
     db_stats = db.get_stats()
 
     return StatusResponse(
         status="ready" if llm_status["healthy"] and db_stats["has_master_resume"] else "setup_required",
-        llm_configured=bool(config.api_key) or config.provider == "ollama",
+        llm_configured=bool(config.api_key) or config.provider in ("ollama", "mock"),
         llm_healthy=llm_status["healthy"],
         has_master_resume=db_stats["has_master_resume"],
         database_stats=db_stats,
+        llm_circuits=get_circuit_states(),
     )
+
+
+@router.get("/metrics")
+async def get_metrics() -> dict:
+    """Get in-process LLM usage metrics.
+
+    Returns:
+        - Per-model token usage, including prompt-cache hits
+        - Prompt compaction token savings
+        - Cached LLM health probe state
+        - Per-provider HTTP connection reuse
+        - LLM latency percentiles and the timeouts chosen from them
+        - JSON completion retries and schema validation failures
+        - LLM errors by retry class, backoff time and retry budget
+        - Per-key load, rate limits and token usage for API key pools
+        - Ollama model load/eval timings and context window size
+        - Average max_tokens requested and inputs truncated, per prompt
+        - Micro-batches formed for small LLM tasks and their fallbacks
+        - Background task queue depth, outcomes and queue/run times
+        - Tailoring pipeline end-to-end and per-stage wall times, stages restored
+        - Job keyword/title prefetches and how often tailoring reused them
+    """
+    return {
+        "llm_usage": get_llm_usage_stats(),
+        "prompt_compaction": get_compaction_stats(),
+        "llm_health": health_monitor.snapshot(),
+        "http_pool": get_http_pool_stats(),
+        "llm_latency": get_latency_stats(),
+        "structured_output": get_structured_output_stats(),
+        "llm_retries": get_retry_stats(),
+        "llm_key_pools": get_key_pool_stats(),
+        "ollama": get_ollama_stats(),
+        "token_budget": get_token_budget_stats(),
+        "llm_batching": get_batching_stats(),
+        "tasks": get_task_stats(),
+        "pipelines": get_pipeline_stats(),
+        "job_prefetch": get_prefetch_stats(),
+    }
@@ -2,7 +2,9 @@
 
 from fastapi import APIRouter, HTTPException
 
+from app.config import get_content_language
 from app.database import db
+from app.prefetch import prefetch_job
 from app.schemas import JobUploadRequest, JobUploadResponse
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
@@ -12,12 +14,15 @@ router = APIRouter(prefix="/jobs", tags=["Jobs"])
 async def upload_job_descriptions(request: JobUploadRequest) -> JobUploadResponse:
     """Upload one or more job descriptions.
 
-    Stores the raw text for later use in resume tailoring.
+    Stores the raw text for later use in resume tailoring, and starts
+    extracting each job's keywords and title in the background so tailoring
+    does not wait for them.
     Returns an array of job_ids corresponding to the input array.
     """
     if not request.job_descriptions:
         raise HTTPException(status_code=400, detail="No job descriptions provided")
 
+    language = get_content_language()
     job_ids = []
     for jd in request.job_descriptions:
         if not jd.strip():
@@ -27,6 +32,7 @@ async def upload_job_descriptions(request: JobUploadRequest) -> JobUploadRespons
             content=jd.strip(),
             resume_id=request.resume_id,
         )
+        prefetch_job(job, language)
         job_ids.append(job["job_id"])
 
     return JobUploadResponse(
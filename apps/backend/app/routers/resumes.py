@@ -2,25 +2,32 @@
 
 import asyncio
 import copy
-import hashlib
 import json
 import logging
+import time
 import unicodedata
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import Annotated, Any, NoReturn
 from uuid import uuid4
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, File, Header, HTTPException, Query, UploadFile
+from fastapi.responses import Response, StreamingResponse
 
+from app import deadline, prefetch
+from app.circuit_breaker import CircuitOpenError
 from app.database import db
 from app.pdf import render_resume_pdf, PDFRenderError
-from app.config import settings
+from app.llm import get_llm_config, get_model_name, llm_call_fits_deadline
+from app.pipeline import Stage, StageError, checkpoint_scope, run_stages
+from app.config import get_content_language, settings
+from app.tasks import TaskQueueFullError, error_payload, report_progress, task_queue
 
 logger = logging.getLogger(__name__)
 from app.schemas import (
     GenerateContentResponse,
+    ImproveResumeBatchRequest,
     ImproveResumeConfirmRequest,
     ImproveResumeRequest,
     ImproveResumeResponse,
@@ -35,6 +42,7 @@ from app.schemas import (
     ResumeSummary,
     ResumeUploadResponse,
     RawResume,
+    TaskResponse,
     UpdateCoverLetterRequest,
     UpdateOutreachMessageRequest,
     UpdateTitleRequest,
@@ -42,16 +50,17 @@ from app.schemas import (
 )
 from app.services.parser import parse_document, parse_resume_to_json
 from app.services.improver import (
-    extract_job_keywords,
     generate_improvements,
     improve_resume,
+    improve_resume_by_section,
+    retailor_changed_sections,
+    section_digests,
 )
-from app.services.refiner import refine_resume, calculate_keyword_match
+from app.services.refiner import calculate_keyword_match, refine_resume, resume_text
 from app.schemas.refinement import RefinementConfig
 from app.services.cover_letter import (
     generate_cover_letter,
     generate_outreach_message,
-    generate_resume_title,
 )
 from app.prompts import DEFAULT_IMPROVE_PROMPT_ID, IMPROVE_PROMPT_OPTIONS
 
@@ -73,13 +82,6 @@ def _load_feature_config() -> dict:
     return _load_config()
 
 
-def _get_content_language() -> str:
-    """Get configured content language from config file."""
-    config = _load_config()
-    # Use content_language, fall back to legacy 'language' field, then default to 'en'
-    return config.get("content_language", config.get("language", "en"))
-
-
 def _get_default_prompt_id() -> str:
     """Get configured default prompt id from config file."""
     config = _load_config()
@@ -88,10 +90,6 @@ def _get_default_prompt_id() -> str:
     return prompt_id if prompt_id in option_ids else DEFAULT_IMPROVE_PROMPT_ID
 
 
-def _hash_job_content(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
-
-
 def _normalize_payload(value: Any) -> Any:
     if isinstance(value, str):
         return unicodedata.normalize("NFC", value)
@@ -108,19 +106,6 @@ def _normalize_payload(value: Any) -> Any:
     return value
 
 
-def _hash_improved_data(data: dict[str, Any]) -> str:
-    """Hash canonicalized improved data for preview/confirm validation."""
-    normalized = _normalize_payload(data)
-    serialized = json.dumps(
-        normalized,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,  # Preserve original behavior for hash stability
-        default=str,  # Handle non-serializable types gracefully
-    )
-    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
-
-
 def _normalize_personal_info_value(value: Any) -> str:
     if value is None:
         return ""
@@ -141,9 +126,28 @@ def _raise_improve_error(
     detail: str,
 ) -> NoReturn:
     logger.error("Resume %s failed during %s: %s", action, stage, error)
+    if isinstance(error, CircuitOpenError):
+        raise HTTPException(status_code=503, detail=str(error))
+    if isinstance(error, deadline.DeadlineExceededError):
+        raise HTTPException(status_code=504, detail=_DEADLINE_DETAIL)
     raise HTTPException(status_code=500, detail=detail)
 
 
+_DEADLINE_DETAIL = "Tailoring did not finish within the request deadline."
+
+
+def _request_deadline(header_value: float | None) -> float:
+    """Deadline in seconds: the X-Request-Deadline header, else REQUEST_DEADLINE_SECONDS."""
+    return header_value if header_value is not None else settings.request_deadline_seconds
+
+
+def _deadline_warnings(dropped: list[str]) -> list[str]:
+    if not dropped:
+        return []
+    labels = ", ".join(label.replace("_", " ") for label in dropped)
+    return [f"Skipped to meet the request deadline: {labels}"]
+
+
 def _get_original_resume_data(resume: dict[str, Any]) -> dict[str, Any] | None:
     original_data = resume.get("processed_data")
     if not original_data and resume.get("content_type") == "json":
@@ -154,6 +158,18 @@ def _get_original_resume_data(resume: dict[str, Any]) -> dict[str, Any] | None:
     return original_data
 
 
+def _parent_sections(resume: dict[str, Any]) -> dict[str, str] | None:
+    """Section digests stored on a resume tailored from `resume`."""
+    original_data = _get_original_resume_data(resume)
+    if not original_data:
+        return None
+    try:
+        return section_digests(original_data)
+    except ValueError as e:
+        logger.warning("Not tracking parent sections: %s", e)
+        return None
+
+
 def _preserve_personal_info(
     original_data: dict[str, Any] | None,
     improved_data: dict[str, Any],
@@ -238,9 +254,48 @@ def _validate_confirm_payload(
         raise ValueError(f"personalInfo fields changed: {', '.join(mismatches)}")
 
 
+async def _await_within_deadline(generation: Awaitable[str]) -> str:
+    try:
+        return await asyncio.wait_for(generation, deadline.remaining())
+    except TimeoutError as e:
+        raise deadline.DeadlineExceededError("Request deadline exceeded") from e
+
+
+async def _generate_optional(
+    label: str,
+    generation: Awaitable[str],
+    prefetched: bool = False,
+) -> tuple[str | None, list[str]]:
+    """Run an optional generation step, turning failures into warnings.
+
+    Title failures are logged but not reported (the title is always generated,
+    not a requested feature). The step is dropped if the request deadline
+    leaves no time for it, unless its result is `prefetched` (stored or being
+    computed already), in which case it is awaited until the deadline.
+    Returns (result, warnings).
+    """
+    if prefetched:
+        generation = _await_within_deadline(generation)
+    elif not llm_call_fits_deadline():
+        if asyncio.iscoroutine(generation):
+            generation.close()
+        deadline.drop(label)
+        return None, []
+    try:
+        return await generation, []
+    except deadline.DeadlineExceededError:
+        deadline.drop(label)
+        return None, []
+    except Exception as e:
+        logger.warning("%s generation failed: %s", label, e, exc_info=e)
+        if label == "title":
+            return None, []
+        return None, [f"{label.replace('_', ' ').title()} generation failed"]
+
+
 async def _generate_auxiliary_messages(
     improved_data: dict[str, Any],
-    job_content: str,
+    job: dict[str, Any],
     language: str,
     enable_cover_letter: bool,
     enable_outreach: bool,
@@ -249,48 +304,261 @@ async def _generate_auxiliary_messages(
 
     Returns (cover_letter, outreach_message, title, warnings).
     """
-    cover_letter = None
-    outreach_message = None
-    title = None
-    warnings: list[str] = []
-    generation_tasks: list[Awaitable[str]] = []
-    task_labels: list[str] = []
-
-    # Title generation is always on (no feature flag)
-    generation_tasks.append(generate_resume_title(job_content, language))
-    task_labels.append("title")
-
+    job_content = job["content"]
+    # Title generation is always on (no feature flag); usually prefetched
+    generations: dict[str, Awaitable[str]] = {"title": prefetch.job_title(job, language)}
     if enable_cover_letter:
-        generation_tasks.append(
-            generate_cover_letter(improved_data, job_content, language)
+        generations["cover_letter"] = generate_cover_letter(
+            improved_data, job_content, language
         )
-        task_labels.append("cover_letter")
     if enable_outreach:
-        generation_tasks.append(
-            generate_outreach_message(improved_data, job_content, language)
+        generations["outreach"] = generate_outreach_message(
+            improved_data, job_content, language
         )
-        task_labels.append("outreach")
 
-    results = await asyncio.gather(*generation_tasks, return_exceptions=True)
-    for label, result in zip(task_labels, results):
-        if isinstance(result, Exception):
-            logger.warning(
-                "%s generation failed: %s",
-                label,
-                result,
-                exc_info=result,
+    prefetched = {"title": prefetch.job_title_prefetched(job, language)}
+    outcomes = await asyncio.gather(
+        *(
+            _generate_optional(label, generation, prefetched.get(label, False))
+            for label, generation in generations.items()
+        )
+    )
+    results = dict(zip(generations, outcomes))
+    warnings = [warning for _, label_warnings in outcomes for warning in label_warnings]
+
+    def result(label: str) -> str | None:
+        return results[label][0] if label in results else None
+
+    return result("cover_letter"), result("outreach"), result("title"), warnings
+
+
+@dataclass(frozen=True)
+class _TailoringContext:
+    """Inputs shared by every job a resume is tailored for in one request."""
+
+    language: str
+    prompt_id: str
+    enable_cover_letter: bool
+    enable_outreach: bool
+    # Master resume data for alignment validation, and its keyword-matching text
+    master_data: dict[str, Any] | None
+    master_text: str | None
+
+
+def _tailoring_context(
+    resume: dict[str, Any],
+    prompt_id: str | None,
+) -> _TailoringContext:
+    """Load config and master resume state once per tailoring request."""
+    feature_config = _load_feature_config()
+    master_resume = db.get_master_resume()
+    master_data = (
+        _get_original_resume_data(master_resume)
+        if master_resume
+        else _get_original_resume_data(resume)
+    )
+    return _TailoringContext(
+        language=get_content_language(),
+        prompt_id=prompt_id or _get_default_prompt_id(),
+        enable_cover_letter=feature_config.get("enable_cover_letter", False),
+        enable_outreach=feature_config.get("enable_outreach_message", False),
+        master_data=master_data,
+        master_text=resume_text(master_data) if master_data else None,
+    )
+
+
+async def _refine_tailored_resume(
+    improved_data: dict[str, Any],
+    job_content: str,
+    job_keywords: dict[str, Any],
+    context: _TailoringContext,
+) -> tuple[dict[str, Any], RefinementStats | None, bool, bool, list[str]]:
+    """Multi-pass refinement: keyword injection, AI phrase removal, alignment validation.
+
+    Falls back to the unrefined result if refinement fails. Returns
+    (data, refinement_stats, refinement_attempted, refinement_successful, warnings).
+    """
+    warnings: list[str] = []
+    refinement_stats: RefinementStats | None = None
+    refinement_attempted = False
+    refinement_successful = False
+    master_data = context.master_data
+    try:
+        if master_data:
+            initial_match = calculate_keyword_match(improved_data, job_keywords)
+            refinement_attempted = True
+            refinement_result = await refine_resume(
+                initial_tailored=improved_data,
+                master_resume=master_data,
+                job_description=job_content,
+                job_keywords=job_keywords,
+                config=RefinementConfig(),
+                master_text=context.master_text,
             )
-            if label != "title":
-                warnings.append(f"{label.replace('_', ' ').title()} generation failed")
-        else:
-            if label == "title":
-                title = result
-            elif label == "cover_letter":
-                cover_letter = result
-            elif label == "outreach":
-                outreach_message = result
+            improved_data = refinement_result.refined_data
+            refinement_stats = RefinementStats(
+                passes_completed=refinement_result.passes_completed,
+                keywords_injected=(
+                    len(refinement_result.keyword_analysis.injectable_keywords)
+                    if refinement_result.keyword_analysis
+                    else 0
+                ),
+                ai_phrases_removed=refinement_result.ai_phrases_removed,
+                alignment_violations_fixed=(
+                    len(
+                        [
+                            v
+                            for v in refinement_result.alignment_report.violations
+                            if v.severity == "critical"
+                        ]
+                    )
+                    if refinement_result.alignment_report
+                    else 0
+                ),
+                initial_match_percentage=initial_match,
+                final_match_percentage=refinement_result.final_match_percentage,
+                llm_calls_saved=refinement_result.llm_calls_saved,
+            )
+            refinement_successful = True
+            logger.info(
+                "Refinement completed: %d passes, %d AI phrases removed",
+                refinement_result.passes_completed,
+                len(refinement_result.ai_phrases_removed),
+            )
+    except Exception as e:
+        logger.warning("Refinement failed, using unrefined result: %s", e)
+        if refinement_attempted:
+            warnings.append(f"Refinement failed: {str(e)}")
+
+    return (
+        improved_data,
+        refinement_stats,
+        refinement_attempted,
+        refinement_successful,
+        warnings,
+    )
+
 
-    return cover_letter, outreach_message, title, warnings
+def _tailoring_stages(
+    resume: dict[str, Any],
+    job: dict[str, Any],
+    context: _TailoringContext,
+    load_keywords: Callable[[], Awaitable[dict[str, Any]]],
+) -> list[Stage]:
+    """Stages shared by preview and improve: keywords → improve → refine → diff.
+
+    Improvement suggestions need only the keywords, so they run alongside the
+    LLM stages. The LLM stages are checkpointed (see `_tailoring_scope`), so a
+    retry after a failure resumes after the last one that finished.
+    """
+
+    async def tailor(job_keywords: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+        original_data = _get_original_resume_data(resume)
+        if settings.improve_by_section and original_data:
+            improved_data, section_warnings = await improve_resume_by_section(
+                original_data=original_data,
+                job_description=job["content"],
+                job_keywords=job_keywords,
+                language=context.language,
+                prompt_id=context.prompt_id,
+            )
+            improved_data, warnings = _preserve_personal_info(original_data, improved_data)
+            return improved_data, [*section_warnings, *warnings]
+        improved_data = await improve_resume(
+            original_resume=resume["content"],
+            job_description=job["content"],
+            job_keywords=job_keywords,
+            language=context.language,
+            prompt_id=context.prompt_id,
+        )
+        return _preserve_personal_info(original_data, improved_data)
+
+    async def refine(
+        tailored: tuple[dict[str, Any], list[str]],
+        job_keywords: dict[str, Any],
+    ) -> tuple[dict[str, Any], RefinementStats | None, bool, bool, list[str]]:
+        return await _refine_tailored_resume(
+            tailored[0], job["content"], job_keywords, context
+        )
+
+    return [
+        Stage("job_keywords", load_keywords, checkpoint=True),
+        Stage("improve_resume", tailor, deps=("job_keywords",), checkpoint=True),
+        Stage(
+            "refine_resume",
+            refine,
+            deps=("improve_resume", "job_keywords"),
+            checkpoint=True,
+        ),
+        Stage(
+            "calculate_diff",
+            lambda refined: _calculate_diff_from_resume(resume, refined[0]),
+            deps=("refine_resume",),
+        ),
+        Stage("generate_improvements", generate_improvements, deps=("job_keywords",)),
+    ]
+
+
+def _tailoring_scope(
+    resume: dict[str, Any],
+    job: dict[str, Any],
+    context: _TailoringContext,
+) -> str:
+    """Checkpoint scope of a tailoring run: everything its stage outputs depend on."""
+    return checkpoint_scope(
+        resume=resume.get("processed_data") or resume["content"],
+        job=job["content"],
+        master=context.master_data,
+        prompt_id=context.prompt_id,
+        language=context.language,
+        model=get_model_name(get_llm_config()),
+        by_section=settings.improve_by_section,
+    )
+
+
+def _tailoring_cache_key(
+    resume: dict[str, Any],
+    job: dict[str, Any],
+    context: _TailoringContext,
+) -> str:
+    """Tailoring cache key: the checkpoint scope plus the refinement config."""
+    return checkpoint_scope(
+        tailoring=_tailoring_scope(resume, job, context),
+        refinement=RefinementConfig().model_dump(),
+    )
+
+
+def _cached_preview_response(
+    request: ImproveResumeRequest,
+    resume: dict[str, Any],
+    cached: dict[str, Any],
+) -> ImproveResumeResponse:
+    """Serve a cached tailoring result under a fresh preview_id."""
+    preview = db.create_preview(
+        {**cached["preview"], "resume_id": request.resume_id, "job_id": request.job_id}
+    )
+    request_id = str(uuid4())
+    data = ImproveResumeData.model_validate(
+        {
+            **cached["data"],
+            "request_id": request_id,
+            "job_id": request.job_id,
+            "preview_id": preview["preview_id"],
+            "markdownOriginal": resume["content"],
+            "stage_timings": None,
+            "cached": True,
+        }
+    )
+    return ImproveResumeResponse(request_id=request_id, data=data)
+
+
+def _tailoring_warnings(results: dict[str, Any]) -> list[str]:
+    """Warnings from the shared tailoring stages, in pipeline order."""
+    warnings = [*results["improve_resume"][1], *results["refine_resume"][4]]
+    diff_error = results["calculate_diff"][2]
+    if diff_error:
+        warnings.append(f"Could not calculate changes: {diff_error}")
+    return warnings
 
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
@@ -458,10 +726,17 @@ async def list_resumes(include_master: bool = Query(False)) -> ResumeListRespons
 @router.post("/improve/preview", response_model=ImproveResumeResponse)
 async def improve_resume_preview_endpoint(
     request: ImproveResumeRequest,
+    x_request_deadline: Annotated[float | None, Header(ge=0)] = None,
 ) -> ImproveResumeResponse:
     """Preview a tailored resume without persisting it.
 
     The response includes resume_preview data but leaves resume_id null.
+    Optional passes are skipped as needed to answer within the request
+    deadline (see `_request_deadline`).
+
+    Results are cached by their inputs (resume, job, master resume, prompt,
+    language, model and refinement config); a repeat request gets the cached
+    preview under a new preview_id unless `force` is set.
     """
     resume = db.get_resume(request.resume_id)
     if not resume:
@@ -471,171 +746,114 @@ async def improve_resume_preview_endpoint(
     if not job:
         raise HTTPException(status_code=404, detail="Job description not found")
 
-    language = _get_content_language()
-    prompt_id = request.prompt_id or _get_default_prompt_id()
-
-    stage = "load_job_keywords"
-    detail = "Failed to preview resume. Please try again."
-    try:
-        job_keywords = job.get("job_keywords")
-        job_keywords_hash = job.get("job_keywords_hash")
-        content_hash = _hash_job_content(job["content"])
-        if not job_keywords or job_keywords_hash != content_hash:
-            stage = "extract_job_keywords"
-            job_keywords = await extract_job_keywords(job["content"])
-            stage = "persist_job_keywords"
-            # Cache extracted keywords with a content hash for basic invalidation.
-            try:
-                updated_job = db.update_job(
-                    request.job_id,
-                    {"job_keywords": job_keywords, "job_keywords_hash": content_hash},
-                )
-                if not updated_job:
-                    logger.warning(
-                        "Failed to persist job keywords for job %s.",
-                        request.job_id,
-                    )
-            except Exception as e:
-                logger.warning(
-                    "Failed to persist job keywords for job %s: %s",
-                    request.job_id,
-                    e,
-                )
-        stage = "improve_resume"
-        improved_data = await improve_resume(
-            original_resume=resume["content"],
-            job_description=job["content"],
-            job_keywords=job_keywords,
-            language=language,
-            prompt_id=prompt_id,
+    context = _tailoring_context(resume, request.prompt_id)
+    use_cache = settings.tailoring_cache_ttl_seconds > 0
+    cache_key = _tailoring_cache_key(resume, job, context)
+    if use_cache and not request.force:
+        cached = db.get_cached_tailoring(cache_key)
+        if cached:
+            logger.info("Serving resume preview from the tailoring cache")
+            return _cached_preview_response(request, resume, cached)
+
+    def store_preview(
+        refined: tuple,
+        diff: tuple,
+        improvements: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        # Kept server-side so confirm can save it by id without re-validation.
+        diff_summary, detailed_changes, _ = diff
+        return db.create_preview(
+            {
+                "resume_id": request.resume_id,
+                "job_id": request.job_id,
+                "prompt_id": context.prompt_id,
+                "improved_data": refined[0],
+                "improvements": [
+                    {
+                        "suggestion": imp["suggestion"],
+                        "lineNumber": imp.get("lineNumber"),
+                    }
+                    for imp in improvements
+                ],
+                "diff_summary": diff_summary.model_dump() if diff_summary else None,
+                "detailed_changes": (
+                    [change.model_dump() for change in detailed_changes]
+                    if detailed_changes is not None
+                    else None
+                ),
+            }
         )
-        # Collect warnings throughout the process
-        response_warnings: list[str] = []
 
-        improved_data, preserve_warnings = _preserve_personal_info(
-            _get_original_resume_data(resume),
-            improved_data,
-        )
-        response_warnings.extend(preserve_warnings)
+    stages = [
+        *_tailoring_stages(
+            resume,
+            job,
+            context,
+            lambda: prefetch.job_keywords(job),
+        ),
+        Stage(
+            "store_preview",
+            store_preview,
+            deps=("refine_resume", "calculate_diff", "generate_improvements"),
+        ),
+    ]
 
-        # Multi-pass refinement: keyword injection, AI phrase removal, alignment validation
-        stage = "refine_resume"
-        refinement_stats: RefinementStats | None = None
-        refinement_attempted = False
-        refinement_successful = False
-        try:
-            # Get master resume for alignment validation
-            master_resume = db.get_master_resume()
-            master_data = (
-                _get_original_resume_data(master_resume)
-                if master_resume
-                else _get_original_resume_data(resume)
+    stage = "run_stages"
+    detail = "Failed to preview resume. Please try again."
+    try:
+        with deadline.deadline_scope(_request_deadline(x_request_deadline)):
+            results, stage_timings = await run_stages(
+                "improve_preview", stages, scope=_tailoring_scope(resume, job, context)
             )
-            if master_data:
-                initial_match = calculate_keyword_match(improved_data, job_keywords)
-                refinement_attempted = True
-                refinement_result = await refine_resume(
-                    initial_tailored=improved_data,
-                    master_resume=master_data,
-                    job_description=job["content"],
-                    job_keywords=job_keywords,
-                    config=RefinementConfig(),
-                )
-                improved_data = refinement_result.refined_data
-                refinement_stats = RefinementStats(
-                    passes_completed=refinement_result.passes_completed,
-                    keywords_injected=(
-                        len(refinement_result.keyword_analysis.injectable_keywords)
-                        if refinement_result.keyword_analysis
-                        else 0
-                    ),
-                    ai_phrases_removed=refinement_result.ai_phrases_removed,
-                    alignment_violations_fixed=(
-                        len(
-                            [
-                                v
-                                for v in refinement_result.alignment_report.violations
-                                if v.severity == "critical"
-                            ]
-                        )
-                        if refinement_result.alignment_report
-                        else 0
-                    ),
-                    initial_match_percentage=initial_match,
-                    final_match_percentage=refinement_result.final_match_percentage,
-                )
-                refinement_successful = True
-                logger.info(
-                    "Refinement completed: %d passes, %d AI phrases removed",
-                    refinement_result.passes_completed,
-                    len(refinement_result.ai_phrases_removed),
-                )
-        except Exception as e:
-            logger.warning("Refinement failed, using unrefined result: %s", e)
-            if refinement_attempted:
-                response_warnings.append(f"Refinement failed: {str(e)}")
+            dropped = deadline.dropped_passes()
+        logger.info("Resume preview stage timings: %s", stage_timings)
 
-        improved_text = json.dumps(improved_data, indent=2)
-        preview_hash = _hash_improved_data(improved_data)
-        preview_hashes = job.get("preview_hashes")
-        if not isinstance(preview_hashes, dict):
-            preview_hashes = {}
-        preview_hashes[prompt_id] = preview_hash
-        # NOTE: preview_hashes updates are last-write-wins; concurrent previews can race.
-        try:
-            updated_job = db.update_job(
-                request.job_id,
-                {
-                    "preview_hash": preview_hash,
-                    "preview_prompt_id": prompt_id,
-                    "preview_hashes": preview_hashes,
-                },
-            )
-            if not updated_job:
-                logger.warning(
-                    "Failed to persist preview hash for job %s.", request.job_id
-                )
-        except Exception as e:
-            logger.warning(
-                "Failed to persist preview hash for job %s: %s", request.job_id, e
-            )
-        stage = "calculate_diff"
-        diff_summary, detailed_changes, diff_error = _calculate_diff_from_resume(
-            resume,
+        stage = "build_response"
+        (
             improved_data,
-        )
-        if diff_error:
-            response_warnings.append(f"Could not calculate changes: {diff_error}")
-        stage = "generate_improvements"
-        improvements = generate_improvements(job_keywords)
+            refinement_stats,
+            refinement_attempted,
+            refinement_successful,
+            _,
+        ) = results["refine_resume"]
+        diff_summary, detailed_changes, _ = results["calculate_diff"]
+        preview = results["store_preview"]
+        improved_text = json.dumps(improved_data, indent=2)
 
         request_id = str(uuid4())
-        return ImproveResumeResponse(
+        data = ImproveResumeData(
             request_id=request_id,
-            data=ImproveResumeData(
-                request_id=request_id,
-                resume_id=None,
-                job_id=request.job_id,
-                resume_preview=ResumeData.model_validate(improved_data),
-                improvements=[
-                    {
-                        "suggestion": imp["suggestion"],
-                        "lineNumber": imp.get("lineNumber"),
-                    }
-                    for imp in improvements
-                ],
-                markdownOriginal=resume["content"],
-                markdownImproved=improved_text,
-                cover_letter=None,
-                outreach_message=None,
-                diff_summary=diff_summary,
-                detailed_changes=detailed_changes,
-                refinement_stats=refinement_stats,
-                warnings=response_warnings,
-                refinement_attempted=refinement_attempted,
-                refinement_successful=refinement_successful,
-            ),
+            resume_id=None,
+            job_id=request.job_id,
+            preview_id=preview["preview_id"],
+            resume_preview=ResumeData.model_validate(improved_data),
+            improvements=preview["improvements"],
+            markdownOriginal=resume["content"],
+            markdownImproved=improved_text,
+            cover_letter=None,
+            outreach_message=None,
+            diff_summary=diff_summary,
+            detailed_changes=detailed_changes,
+            refinement_stats=refinement_stats,
+            warnings=[*_tailoring_warnings(results), *_deadline_warnings(dropped)],
+            refinement_attempted=refinement_attempted,
+            refinement_successful=refinement_successful,
+            stage_timings=stage_timings,
         )
+        # Degraded results (dropped passes, failed refinement) are not reused.
+        if use_cache and not dropped and refinement_successful == refinement_attempted:
+            db.save_cached_tailoring(
+                cache_key,
+                preview={
+                    key: value
+                    for key, value in preview.items()
+                    if key not in ("preview_id", "created_at", "expires_at")
+                },
+                data=data.model_dump(mode="json", exclude={"request_id", "preview_id"}),
+            )
+        return ImproveResumeResponse(request_id=request_id, data=data)
+    except StageError as e:
+        _raise_improve_error("preview", e.stage, e.error, detail)
     except Exception as e:
         _raise_improve_error("preview", stage, e, detail)
 
@@ -656,62 +874,58 @@ async def improve_resume_confirm_endpoint(
     feature_config = _load_feature_config()
     enable_cover_letter = feature_config.get("enable_cover_letter", False)
     enable_outreach = feature_config.get("enable_outreach_message", False)
-    language = _get_content_language()
+    language = get_content_language()
 
-    stage = "serialize_improved_data"
+    stage = "load_preview"
     detail = "Failed to confirm resume. Please try again."
     try:
-        improved_data = request.improved_data.model_dump()
-        improved_text = json.dumps(improved_data, indent=2)
-        # NOTE: This endpoint relies on preview-hash validation to ensure the payload matches a prior preview.
-        # Stronger guarantees would require server-side preview storage or re-running the improvement.
-        try:
-            _validate_confirm_payload(_get_original_resume_data(resume), improved_data)
-        except ValueError as e:
-            logger.warning("Resume confirm rejected: %s", e)
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid improved resume data. Please retry preview.",
-            )
-        preview_hashes = job.get("preview_hashes")
-        allowed_hashes: set[str] = set()
-        if isinstance(preview_hashes, dict):
-            allowed_hashes.update(preview_hashes.values())
-        elif isinstance(preview_hashes, list):
-            allowed_hashes.update(
-                [value for value in preview_hashes if isinstance(value, str)]
-            )
-        else:
-            preview_hash = job.get("preview_hash")
-            if isinstance(preview_hash, str):
-                allowed_hashes.add(preview_hash)
-
-        if not allowed_hashes:
+        preview = db.get_preview(request.preview_id)
+        if (
+            not preview
+            or preview["resume_id"] != request.resume_id
+            or preview["job_id"] != request.job_id
+        ):
             logger.warning(
-                "Rejecting confirm; preview hash missing for job %s.",
-                request.job_id,
-            )
-            raise HTTPException(
-                status_code=400,
-                detail="Preview required before confirmation. Please retry preview.",
+                "Rejecting confirm; preview %s missing, expired or mismatched.",
+                request.preview_id,
             )
-
-        request_hash = _hash_improved_data(improved_data)
-        if request_hash not in allowed_hashes:
-            logger.warning("Resume confirm rejected due to preview hash mismatch.")
             raise HTTPException(
                 status_code=400,
-                detail="Invalid improved resume data. Please retry preview.",
+                detail="Preview expired or not found. Please retry preview.",
             )
 
-        stage = "calculate_diff"
         response_warnings: list[str] = []
-        diff_summary, detailed_changes, diff_error = _calculate_diff_from_resume(
-            resume,
-            improved_data,
+        if request.improved_data is None:
+            # Unedited preview: reuse the stored data and diff as-is.
+            improved_data = preview["improved_data"]
+            diff_summary = preview["diff_summary"]
+            detailed_changes = preview["detailed_changes"]
+        else:
+            stage = "validate_edits"
+            improved_data = request.improved_data.model_dump()
+            try:
+                _validate_confirm_payload(
+                    _get_original_resume_data(resume), improved_data
+                )
+            except ValueError as e:
+                logger.warning("Resume confirm rejected: %s", e)
+                raise HTTPException(
+                    status_code=400,
+                    detail="Invalid improved resume data. Please retry preview.",
+                )
+            stage = "calculate_diff"
+            diff_summary, detailed_changes, diff_error = _calculate_diff_from_resume(
+                resume,
+                improved_data,
+            )
+            if diff_error:
+                response_warnings.append(f"Could not calculate changes: {diff_error}")
+        improvements_payload = (
+            [imp.model_dump() for imp in request.improvements]
+            if request.improvements is not None
+            else preview["improvements"]
         )
-        if diff_error:
-            response_warnings.append(f"Could not calculate changes: {diff_error}")
+        improved_text = json.dumps(improved_data, indent=2)
 
         stage = "generate_auxiliary_messages"
         (
@@ -721,7 +935,7 @@ async def improve_resume_confirm_endpoint(
             aux_warnings,
         ) = await _generate_auxiliary_messages(
             improved_data,
-            job["content"],
+            job,
             language,
             enable_cover_letter,
             enable_outreach,
@@ -740,9 +954,10 @@ async def improve_resume_confirm_endpoint(
             cover_letter=cover_letter,
             outreach_message=outreach_message,
             title=title,
+            parent_sections=_parent_sections(resume),
+            tailored_sections=section_digests(improved_data),
         )
 
-        improvements_payload = [imp.model_dump() for imp in request.improvements]
         stage = "create_improvement"
         request_id = str(uuid4())
         db.create_improvement(
@@ -750,7 +965,9 @@ async def improve_resume_confirm_endpoint(
             tailored_resume_id=tailored_resume["resume_id"],
             job_id=request.job_id,
             improvements=improvements_payload,
+            prompt_id=preview.get("prompt_id"),
         )
+        db.delete_preview(request.preview_id)
 
         return ImproveResumeResponse(
             request_id=request_id,
@@ -758,8 +975,8 @@ async def improve_resume_confirm_endpoint(
                 request_id=request_id,
                 resume_id=tailored_resume["resume_id"],
                 job_id=request.job_id,
-                resume_preview=request.improved_data,
-                improvements=request.improvements,
+                resume_preview=ResumeData.model_validate(improved_data),
+                improvements=improvements_payload,
                 markdownOriginal=resume["content"],
                 markdownImproved=improved_text,
                 cover_letter=cover_letter,
@@ -778,6 +995,7 @@ async def improve_resume_confirm_endpoint(
 @router.post("/improve", response_model=ImproveResumeResponse)
 async def improve_resume_endpoint(
     request: ImproveResumeRequest,
+    x_request_deadline: Annotated[float | None, Header(ge=0)] = None,
 ) -> ImproveResumeResponse:
     """Improve/tailor a resume for a specific job description.
 
@@ -796,149 +1014,138 @@ async def improve_resume_endpoint(
     if not job:
         raise HTTPException(status_code=404, detail="Job description not found")
 
-    # Load feature configuration and content language
-    feature_config = _load_feature_config()
-    enable_cover_letter = feature_config.get("enable_cover_letter", False)
-    enable_outreach = feature_config.get("enable_outreach_message", False)
-    language = _get_content_language()
-
-    try:
-        # Extract keywords from job description
-        job_keywords = await extract_job_keywords(job["content"])
-
-        # Generate improved resume in the configured language
-        prompt_id = request.prompt_id or _get_default_prompt_id()
-
-        improved_data = await improve_resume(
-            original_resume=resume["content"],
-            job_description=job["content"],
-            job_keywords=job_keywords,
-            language=language,
-            prompt_id=prompt_id,
-        )
-        # Collect warnings throughout the process
-        response_warnings: list[str] = []
-
-        improved_data, preserve_warnings = _preserve_personal_info(
-            _get_original_resume_data(resume),
-            improved_data,
-        )
-        response_warnings.extend(preserve_warnings)
+    return await _improve_for_job(
+        resume,
+        job,
+        _tailoring_context(resume, request.prompt_id),
+        deadline_seconds=_request_deadline(x_request_deadline),
+    )
 
-        # Multi-pass refinement: keyword injection, AI phrase removal, alignment validation
-        refinement_stats: RefinementStats | None = None
-        refinement_attempted = False
-        refinement_successful = False
-        try:
-            # Get master resume for alignment validation
-            master_resume = db.get_master_resume()
-            master_data = (
-                _get_original_resume_data(master_resume)
-                if master_resume
-                else _get_original_resume_data(resume)
-            )
-            if master_data:
-                initial_match = calculate_keyword_match(improved_data, job_keywords)
-                refinement_attempted = True
-                refinement_result = await refine_resume(
-                    initial_tailored=improved_data,
-                    master_resume=master_data,
-                    job_description=job["content"],
-                    job_keywords=job_keywords,
-                    config=RefinementConfig(),
-                )
-                improved_data = refinement_result.refined_data
-                refinement_stats = RefinementStats(
-                    passes_completed=refinement_result.passes_completed,
-                    keywords_injected=(
-                        len(refinement_result.keyword_analysis.injectable_keywords)
-                        if refinement_result.keyword_analysis
-                        else 0
-                    ),
-                    ai_phrases_removed=refinement_result.ai_phrases_removed,
-                    alignment_violations_fixed=(
-                        len(
-                            [
-                                v
-                                for v in refinement_result.alignment_report.violations
-                                if v.severity == "critical"
-                            ]
-                        )
-                        if refinement_result.alignment_report
-                        else 0
-                    ),
-                    initial_match_percentage=initial_match,
-                    final_match_percentage=refinement_result.final_match_percentage,
-                )
-                refinement_successful = True
-                logger.info(
-                    "Refinement completed: %d passes, %d AI phrases removed",
-                    refinement_result.passes_completed,
-                    len(refinement_result.ai_phrases_removed),
-                )
-        except Exception as e:
-            logger.warning("Refinement failed, using unrefined result: %s", e)
-            if refinement_attempted:
-                response_warnings.append(f"Refinement failed: {str(e)}")
 
-        # Convert improved data to JSON string for storage
-        improved_text = json.dumps(improved_data, indent=2)
+async def _improve_for_job(
+    resume: dict[str, Any],
+    job: dict[str, Any],
+    context: _TailoringContext,
+    deadline_seconds: float | None = None,
+) -> ImproveResumeResponse:
+    """Tailor `resume` for `job` and persist the result.
 
-        # Calculate differences between original and improved resume
-        diff_summary, detailed_changes, diff_error = _calculate_diff_from_resume(
-            resume,
-            improved_data,
+    Stages run as a dependency graph: the title is generated from the job
+    description alongside tailoring, and the cover letter, outreach message
+    and diff all start as soon as refinement finishes. With
+    `deadline_seconds`, optional passes are dropped to finish in time.
+    """
+    resume_id = resume["resume_id"]
+    job_id = job["job_id"]
+    language = context.language
+
+    def cover_letter_stage(refined: tuple) -> Any:
+        if not context.enable_cover_letter:
+            return None, []
+        return _generate_optional(
+            "cover_letter",
+            generate_cover_letter(refined[0], job["content"], language),
         )
-        if diff_error:
-            response_warnings.append(f"Could not calculate changes: {diff_error}")
-
-        # Generate improvement suggestions
-        improvements = generate_improvements(job_keywords)
 
-        # Generate cover letter, outreach message, and title in parallel if enabled
-        (
-            cover_letter,
-            outreach_message,
-            title,
-            aux_warnings,
-        ) = await _generate_auxiliary_messages(
-            improved_data,
-            job["content"],
-            language,
-            enable_cover_letter,
-            enable_outreach,
+    def outreach_stage(refined: tuple) -> Any:
+        if not context.enable_outreach:
+            return None, []
+        return _generate_optional(
+            "outreach",
+            generate_outreach_message(refined[0], job["content"], language),
         )
-        response_warnings.extend(aux_warnings)
 
+    def persist(
+        refined: tuple,
+        title: tuple[str | None, list[str]],
+        cover_letter: tuple[str | None, list[str]],
+        outreach_message: tuple[str | None, list[str]],
+        improvements: list[dict[str, Any]],
+    ) -> dict[str, Any]:
         # Store the tailored resume with cover letter, outreach message, and title
         tailored_resume = db.create_resume(
-            content=improved_text,
+            content=json.dumps(refined[0], indent=2),
             content_type="json",
             filename=f"tailored_{resume.get('filename', 'resume')}",
             is_master=False,
-            parent_id=request.resume_id,
-            processed_data=improved_data,
+            parent_id=resume_id,
+            processed_data=refined[0],
             processing_status="ready",
-            cover_letter=cover_letter,
-            outreach_message=outreach_message,
-            title=title,
+            cover_letter=cover_letter[0],
+            outreach_message=outreach_message[0],
+            title=title[0],
+            parent_sections=_parent_sections(resume),
+            tailored_sections=section_digests(refined[0]),
         )
-
         # Store improvement record
-        request_id = str(uuid4())
         db.create_improvement(
-            original_resume_id=request.resume_id,
+            original_resume_id=resume_id,
             tailored_resume_id=tailored_resume["resume_id"],
-            job_id=request.job_id,
+            job_id=job_id,
             improvements=improvements,
+            prompt_id=context.prompt_id,
         )
+        return tailored_resume
+
+    stages = [
+        *_tailoring_stages(
+            resume,
+            job,
+            context,
+            lambda: prefetch.job_keywords(job),
+        ),
+        # Title generation is always on (no feature flag) and needs only the job
+        Stage(
+            "generate_title",
+            lambda: _generate_optional(
+                "title",
+                prefetch.job_title(job, language),
+                prefetch.job_title_prefetched(job, language),
+            ),
+        ),
+        Stage("generate_cover_letter", cover_letter_stage, deps=("refine_resume",)),
+        Stage("generate_outreach", outreach_stage, deps=("refine_resume",)),
+        Stage(
+            "persist",
+            persist,
+            deps=(
+                "refine_resume",
+                "generate_title",
+                "generate_cover_letter",
+                "generate_outreach",
+                "generate_improvements",
+            ),
+        ),
+    ]
+
+    try:
+        with deadline.deadline_scope(deadline_seconds):
+            results, stage_timings = await run_stages(
+                "improve", stages, scope=_tailoring_scope(resume, job, context)
+            )
+            dropped = deadline.dropped_passes()
+        logger.info("Resume improvement stage timings: %s", stage_timings)
 
+        (
+            improved_data,
+            refinement_stats,
+            refinement_attempted,
+            refinement_successful,
+            _,
+        ) = results["refine_resume"]
+        diff_summary, detailed_changes, _ = results["calculate_diff"]
+        improvements = results["generate_improvements"]
+        cover_letter, cover_letter_warnings = results["generate_cover_letter"]
+        outreach_message, outreach_warnings = results["generate_outreach"]
+        tailored_resume = results["persist"]
+
+        request_id = str(uuid4())
         return ImproveResumeResponse(
             request_id=request_id,
             data=ImproveResumeData(
                 request_id=request_id,
                 resume_id=tailored_resume["resume_id"],
-                job_id=request.job_id,
+                job_id=job_id,
                 resume_preview=ResumeData.model_validate(improved_data),
                 improvements=[
                     {
@@ -948,19 +1155,35 @@ async def improve_resume_endpoint(
                     for imp in improvements
                 ],
                 markdownOriginal=resume["content"],
-                markdownImproved=improved_text,
+                markdownImproved=tailored_resume["content"],
                 cover_letter=cover_letter,
                 outreach_message=outreach_message,
                 # Diff metadata
                 diff_summary=diff_summary,
                 detailed_changes=detailed_changes,
                 refinement_stats=refinement_stats,
-                warnings=response_warnings,
+                warnings=[
+                    *_tailoring_warnings(results),
+                    *cover_letter_warnings,
+                    *outreach_warnings,
+                    *_deadline_warnings(dropped),
+                ],
                 refinement_attempted=refinement_attempted,
                 refinement_successful=refinement_successful,
+                stage_timings=stage_timings,
             ),
         )
 
+    except StageError as e:
+        if isinstance(e.error, CircuitOpenError):
+            raise e.error
+        if isinstance(e.error, deadline.DeadlineExceededError):
+            raise HTTPException(status_code=504, detail=_DEADLINE_DETAIL)
+        logger.error("Resume improvement failed during %s: %s", e.stage, e.error)
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to improve resume. Please try again.",
+        )
     except Exception as e:
         logger.error(f"Resume improvement failed: {e}")
         raise HTTPException(
@@ -969,6 +1192,249 @@ async def improve_resume_endpoint(
         )
 
 
+async def _run_improve_task(payload: dict[str, Any]) -> dict[str, Any]:
+    # Background tasks have no client waiting on a deadline.
+    response = await improve_resume_endpoint(
+        ImproveResumeRequest(**payload), x_request_deadline=0
+    )
+    return response.model_dump(mode="json")
+
+
+async def _run_improve_preview_task(payload: dict[str, Any]) -> dict[str, Any]:
+    response = await improve_resume_preview_endpoint(
+        ImproveResumeRequest(**payload), x_request_deadline=0
+    )
+    return response.model_dump(mode="json")
+
+
+async def _propagate_to_child(
+    parent_data: dict[str, Any],
+    parent_sections: dict[str, str],
+    child: dict[str, Any],
+    language: str,
+) -> dict[str, Any]:
+    """Re-tailor the sections of `child` whose source changed in its parent."""
+    child_id = child["resume_id"]
+    tailored_from = child.get("parent_sections")
+    child_data = child.get("processed_data")
+    if not tailored_from or not child_data:
+        return {
+            "resume_id": child_id,
+            "status": "skipped",
+            "reason": "Tailored before change tracking; tailor it again instead.",
+        }
+    if tailored_from == parent_sections:
+        return {"resume_id": child_id, "status": "skipped", "reason": "Already up to date."}
+
+    improvement = db.get_improvement_by_tailored_resume(child_id)
+    job = db.get_job(improvement["job_id"]) if improvement else None
+    if not job:
+        return {"resume_id": child_id, "status": "skipped", "reason": "Job description not found."}
+
+    changed = {
+        label for label, digest in parent_sections.items() if tailored_from.get(label) != digest
+    }
+    # Sections whose content differs from what was last written by tailoring
+    # were edited by the user; those are kept rather than overwritten.
+    written = child.get("tailored_sections")
+    edited: set[str] = set()
+    if written is not None:
+        current = section_digests(child_data)
+        edited = {
+            label
+            for label in current.keys() | written.keys()
+            if current.get(label) != written.get(label)
+        }
+    retailored = sorted(changed - edited)
+    job_keywords = await prefetch.job_keywords(job) if retailored else {}
+    updated_data, warnings = await retailor_changed_sections(
+        child_data,
+        parent_data,
+        changed,
+        job["content"],
+        job_keywords,
+        language,
+        improvement.get("prompt_id"),
+        edited=edited,
+    )
+    db.update_resume(
+        child_id,
+        {
+            "content": json.dumps(updated_data, indent=2),
+            "processed_data": updated_data,
+            "parent_sections": parent_sections,
+            "tailored_sections": section_digests(updated_data),
+        },
+    )
+    return {"resume_id": child_id, "status": "updated", "sections": retailored, "warnings": warnings}
+
+
+async def _run_propagate_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """Bring every resume tailored from `payload["resume_id"]` up to date.
+
+    Children are compared with the parent section by section (see
+    `section_digests`) and only the changed sections are tailored again, one
+    small call each; up to IMPROVE_BATCH_CONCURRENCY children at a time.
+    """
+    resume_id = payload["resume_id"]
+    parent = db.get_resume(resume_id)
+    if not parent:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    parent_data = _get_original_resume_data(parent)
+    if not parent_data:
+        raise HTTPException(status_code=400, detail="Resume has no processed data.")
+    parent_sections = section_digests(parent_data)
+    children = [r for r in db.list_resumes() if r.get("parent_id") == resume_id]
+    language = get_content_language()
+
+    semaphore = asyncio.Semaphore(max(1, settings.improve_batch_concurrency))
+    done = 0
+    report_progress(done, len(children))
+
+    async def propagate(child: dict[str, Any]) -> dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            try:
+                outcome = await _propagate_to_child(parent_data, parent_sections, child, language)
+            except Exception as e:
+                logger.warning("Propagation to resume %s failed: %s", child["resume_id"], e)
+                outcome = {
+                    "resume_id": child["resume_id"],
+                    "status": "failed",
+                    "error": error_payload(e),
+                }
+        done += 1
+        report_progress(done, len(children))
+        return outcome
+
+    outcomes = await asyncio.gather(*(propagate(child) for child in children))
+    return {
+        "resume_id": resume_id,
+        "children": outcomes,
+        "sections_retailored": sum(len(outcome.get("sections", [])) for outcome in outcomes),
+    }
+
+
+task_queue.register("improve_resume", _run_improve_task)
+task_queue.register("improve_resume_preview", _run_improve_preview_task)
+task_queue.register("propagate_resume", _run_propagate_task)
+
+
+def _submit_improve_task(kind: str, request: ImproveResumeRequest) -> TaskResponse:
+    if not db.get_resume(request.resume_id):
+        raise HTTPException(status_code=404, detail="Resume not found")
+    if not db.get_job(request.job_id):
+        raise HTTPException(status_code=404, detail="Job description not found")
+    try:
+        task = task_queue.submit(kind, request.model_dump())
+    except TaskQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    return TaskResponse.model_validate(task)
+
+
+@router.post("/improve/async", response_model=TaskResponse, status_code=202)
+async def improve_resume_async_endpoint(request: ImproveResumeRequest) -> TaskResponse:
+    """Queue a resume improvement and return its task immediately.
+
+    Poll GET /tasks/{task_id} (optionally with ?wait=) for the result, which
+    is the ImproveResumeResponse that POST /improve returns.
+    """
+    return _submit_improve_task("improve_resume", request)
+
+
+@router.post("/improve/preview/async", response_model=TaskResponse, status_code=202)
+async def improve_resume_preview_async_endpoint(
+    request: ImproveResumeRequest,
+) -> TaskResponse:
+    """Queue a tailoring preview and return its task immediately.
+
+    The task result is the ImproveResumeResponse that POST /improve/preview
+    returns; confirm it with POST /improve/confirm as usual.
+    """
+    return _submit_improve_task("improve_resume_preview", request)
+
+
+@router.post("/{resume_id}/propagate", response_model=TaskResponse, status_code=202)
+async def propagate_resume_changes_endpoint(resume_id: str) -> TaskResponse:
+    """Queue an update of the resumes tailored from this one after it was edited.
+
+    Only the sections changed since each child was tailored are sent to the
+    LLM; the rest of the child keeps its tailored content. GET /tasks/{task_id}
+    reports progress per child, and the result lists each child as updated
+    (with the re-tailored sections), skipped or failed.
+    """
+    if not db.get_resume(resume_id):
+        raise HTTPException(status_code=404, detail="Resume not found")
+    try:
+        task = task_queue.submit("propagate_resume", {"resume_id": resume_id})
+    except TaskQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    return TaskResponse.model_validate(task)
+
+
+@router.post("/{resume_id}/improve/batch")
+async def improve_resume_batch_endpoint(
+    resume_id: str,
+    request: ImproveResumeBatchRequest,
+) -> StreamingResponse:
+    """Tailor one resume for many job descriptions, streaming results.
+
+    Config and master resume state are loaded once and shared by every job;
+    up to IMPROVE_BATCH_CONCURRENCY jobs are tailored at a time. The response
+    is NDJSON: one line per job in completion order, either
+    `{"job_id", "status": "succeeded", "data"}` (the /improve response data)
+    or `{"job_id", "status": "failed", "error": {"status_code", "detail"}}`,
+    followed by a final `{"summary": {...}}` line.
+    """
+    resume = db.get_resume(resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    job_ids = list(dict.fromkeys(request.job_ids))
+    context = _tailoring_context(resume, request.prompt_id)
+    semaphore = asyncio.Semaphore(max(1, settings.improve_batch_concurrency))
+
+    async def improve_job(job_id: str) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                job = db.get_job(job_id)
+                if not job:
+                    raise HTTPException(
+                        status_code=404, detail="Job description not found"
+                    )
+                response = await _improve_for_job(resume, job, context)
+            except Exception as e:
+                return {"job_id": job_id, "status": "failed", "error": error_payload(e)}
+        return {
+            "job_id": job_id,
+            "status": "succeeded",
+            "data": response.data.model_dump(mode="json"),
+        }
+
+    async def stream_results():
+        start = time.perf_counter()
+        counts = {"succeeded": 0, "failed": 0}
+        pending = [asyncio.create_task(improve_job(job_id)) for job_id in job_ids]
+        try:
+            for finished in asyncio.as_completed(pending):
+                result = await finished
+                counts[result["status"]] += 1
+                yield json.dumps(result) + "\n"
+            summary = {
+                "total": len(job_ids),
+                **counts,
+                "total_seconds": round(time.perf_counter() - start, 3),
+            }
+            logger.info("Batch tailoring for resume %s: %s", resume_id, summary)
+            yield json.dumps({"summary": summary}) + "\n"
+        finally:
+            # Client disconnected: stop the remaining pipelines.
+            for task in pending:
+                task.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.patch("/{resume_id}", response_model=ResumeFetchResponse)
 async def update_resume_endpoint(
     resume_id: str, resume_data: ResumeData
@@ -1250,7 +1716,7 @@ async def generate_cover_letter_endpoint(resume_id: str) -> GenerateContentRespo
         )
 
     # Get language setting
-    language = _get_content_language()
+    language = get_content_language()
 
     # Generate cover letter
     try:
@@ -1321,7 +1787,7 @@ async def generate_outreach_endpoint(resume_id: str) -> GenerateContentResponse:
         )
 
     # Get language setting
-    language = _get_content_language()
+    language = get_content_language()
 
     # Generate outreach message
     try:
@@ -0,0 +1,29 @@
+"""Background task status endpoints."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.schemas import TaskResponse
+from app.tasks import task_queue
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    task_id: str,
+    wait: float = Query(
+        0.0,
+        ge=0.0,
+        le=60.0,
+        description="Seconds to wait for the task to finish before responding (long-poll)",
+    ),
+) -> TaskResponse:
+    """Get a background task's status, and its result or error once finished.
+
+    Task results have the same shape as the synchronous endpoint's response
+    (e.g. ImproveResumeResponse for improve tasks).
+    """
+    task = await task_queue.wait(task_id, wait)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return TaskResponse.model_validate(task)
@@ -16,9 +16,11 @@ from app.schemas.models import (
     HealthResponse,
     ImprovementSuggestion,
     ImproveResumeData,
+    ImproveResumeBatchRequest,
     ImproveResumeConfirmRequest,
     ImproveResumeRequest,
     ImproveResumeResponse,
+    JobKeywords,
     JobUploadRequest,
     JobUploadResponse,
     LanguageConfigRequest,
@@ -45,6 +47,9 @@ from app.schemas.models import (
     SectionMeta,
     SectionType,
     StatusResponse,
+    TaskError,
+    TaskProgress,
+    TaskResponse,
     UpdateCoverLetterRequest,
     UpdateOutreachMessageRequest,
     UpdateTitleRequest,
@@ -70,7 +75,9 @@ __all__ = [
     "ResumeListResponse",
     "JobUploadRequest",
     "JobUploadResponse",
+    "JobKeywords",
     "ImproveResumeRequest",
+    "ImproveResumeBatchRequest",
     "ImproveResumeData",
     "ImproveResumeConfirmRequest",
     "ImproveResumeResponse",
@@ -98,4 +105,7 @@ __all__ = [
     "GenerateContentResponse",
     "HealthResponse",
     "StatusResponse",
+    "TaskError",
+    "TaskProgress",
+    "TaskResponse",
 ]
@@ -420,6 +420,19 @@ class JobUploadResponse(BaseModel):
     request: dict[str, Any]
 
 
+class JobKeywords(BaseModel):
+    """Requirements extracted from a job description by the LLM."""
+
+    required_skills: list[str] = Field(default_factory=list)
+    preferred_skills: list[str] = Field(default_factory=list)
+    experience_requirements: list[str] = Field(default_factory=list)
+    education_requirements: list[str] = Field(default_factory=list)
+    key_responsibilities: list[str] = Field(default_factory=list)
+    keywords: list[str] = Field(default_factory=list)
+    experience_years: int | None = None
+    seniority_level: str | None = None
+
+
 # Improvement Models
 class ImproveResumeRequest(BaseModel):
     """Request to improve/tailor a resume."""
@@ -427,6 +440,17 @@ class ImproveResumeRequest(BaseModel):
     resume_id: str
     job_id: str
     prompt_id: str | None = None
+    force: bool = Field(
+        default=False,
+        description="Re-run tailoring even if an identical preview is cached.",
+    )
+
+
+class ImproveResumeBatchRequest(BaseModel):
+    """Request to tailor one resume for several job descriptions."""
+
+    job_ids: list[str] = Field(min_length=1, max_length=50)
+    prompt_id: str | None = None
 
 
 class ImprovementSuggestion(BaseModel):
@@ -488,6 +512,9 @@ class RefinementStats(BaseModel):
     final_match_percentage: float = Field(
         default=0.0, ge=0.0, le=100.0, description="Keyword match after refinement"
     )
+    llm_calls_saved: int = Field(
+        default=0, ge=0, description="LLM calls skipped by the refinement planner"
+    )
 
 
 class ImproveResumeData(BaseModel):
@@ -499,6 +526,10 @@ class ImproveResumeData(BaseModel):
         description="Null for preview responses; populated when the tailored resume is persisted.",
     )
     job_id: str
+    preview_id: str | None = Field(
+        default=None,
+        description="Set on preview responses; pass it to /improve/confirm to save the preview.",
+    )
     resume_preview: ResumeData
     improvements: list[ImprovementSuggestion]
     markdownOriginal: str | None = None
@@ -518,6 +549,11 @@ class ImproveResumeData(BaseModel):
     refinement_attempted: bool = False
     refinement_successful: bool = False
 
+    # Wall time in seconds per pipeline stage, plus "total"
+    stage_timings: dict[str, float] | None = None
+    # True when a preview was served from the tailoring cache
+    cached: bool = False
+
 
 class ImproveResumeResponse(BaseModel):
     """Response for resume improvement."""
@@ -531,8 +567,12 @@ class ImproveResumeConfirmRequest(BaseModel):
 
     resume_id: str
     job_id: str
-    improved_data: ResumeData
-    improvements: list[ImprovementSuggestion]
+    preview_id: str
+    improved_data: ResumeData | None = Field(
+        default=None,
+        description="Edited resume to save instead of the stored preview.",
+    )
+    improvements: list[ImprovementSuggestion] | None = None
 
 
 # Config Models
@@ -669,6 +709,34 @@ class GenerateContentResponse(BaseModel):
 
 
 # Health/Status Models
+class TaskError(BaseModel):
+    """Error recorded for a failed background task."""
+
+    status_code: int
+    detail: str
+
+
+class TaskProgress(BaseModel):
+    """Items processed so far by a running background task."""
+
+    done: int
+    total: int
+
+
+class TaskResponse(BaseModel):
+    """Background task status, with its result or error once finished."""
+
+    task_id: str
+    kind: str
+    status: str  # queued, running, succeeded, failed
+    progress: TaskProgress | None = None  # Reported by tasks that process several items
+    result: dict[str, Any] | None = None
+    error: TaskError | None = None
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -684,3 +752,4 @@ class StatusResponse(BaseModel):
     llm_healthy: bool
     has_master_resume: bool
     database_stats: dict[str, Any]
+    llm_circuits: dict[str, dict[str, Any]] = Field(default_factory=dict)
@@ -10,6 +10,16 @@ class RefinementConfig(BaseModel):
     enable_ai_phrase_removal: bool = True
     enable_master_alignment_check: bool = True
     max_refinement_passes: int = Field(default=2, ge=1, le=5)
+    enable_planner: bool = Field(
+        default=True,
+        description="Skip or narrow LLM passes that local analysis shows are not needed",
+    )
+    min_keyword_gain: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=100.0,
+        description="Match points a keyword injection pass must be able to add to run",
+    )
 
 
 class KeywordGapAnalysis(BaseModel):
@@ -63,6 +73,15 @@ class AlignmentReport(BaseModel):
     )
 
 
+class RefinementDecision(BaseModel):
+    """Refinement planner decision for one LLM pass."""
+
+    pass_name: str = Field(description="Pass: keyword_injection or metric_verification")
+    action: str = Field(description="Action: run, shrink (fewer sections) or skip")
+    reason: str = Field(description="Local signal behind the decision")
+    llm_calls_saved: int = Field(default=0, ge=0)
+
+
 class RefinementStats(BaseModel):
     """Statistics from the refinement process for API responses."""
 
@@ -85,6 +104,9 @@ class RefinementStats(BaseModel):
     final_match_percentage: float = Field(
         default=0.0, ge=0.0, le=100.0, description="Keyword match after refinement"
     )
+    llm_calls_saved: int = Field(
+        default=0, ge=0, description="LLM calls skipped by the refinement planner"
+    )
 
 
 class RefinementResult(BaseModel):
@@ -98,6 +120,12 @@ class RefinementResult(BaseModel):
     alignment_report: AlignmentReport | None = None
     ai_phrases_removed: list[str] = Field(default_factory=list)
     final_match_percentage: float = Field(default=0.0, ge=0.0, le=100.0)
+    plan: list[RefinementDecision] = Field(default_factory=list)
+
+    @property
+    def llm_calls_saved(self) -> int:
+        """LLM calls the planner skipped."""
+        return sum(decision.llm_calls_saved for decision in self.plan)
 
     def to_stats(self, initial_match: float = 0.0) -> RefinementStats:
         """Convert to RefinementStats for API response."""
@@ -122,4 +150,5 @@ class RefinementResult(BaseModel):
             ),
             initial_match_percentage=initial_match,
             final_match_percentage=self.final_match_percentage,
+            llm_calls_saved=self.llm_calls_saved,
         )
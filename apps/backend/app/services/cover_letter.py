@@ -1,10 +1,13 @@
 """Cover letter, outreach message, and resume title generation service."""
 
-import json
 from typing import Any
 
+from app.batching import MicroBatcher
 from app.llm import complete
+from app.prompts.serialization import serialize_resume
 from app.prompts.templates import (
+    BATCH_GENERATE_TITLE_PROMPT,
+    BATCH_ITEM_TEMPLATE,
     COVER_LETTER_PROMPT,
     GENERATE_TITLE_PROMPT,
     OUTREACH_MESSAGE_PROMPT,
@@ -31,7 +34,7 @@ async def generate_cover_letter(
 
     prompt = COVER_LETTER_PROMPT.format(
         job_description=job_description,
-        resume_data=json.dumps(resume_data, indent=2),
+        resume_data=serialize_resume(resume_data, "cover_letter"),
         output_language=output_language,
     )
 
@@ -63,7 +66,7 @@ async def generate_outreach_message(
 
     prompt = OUTREACH_MESSAGE_PROMPT.format(
         job_description=job_description,
-        resume_data=json.dumps(resume_data, indent=2),
+        resume_data=serialize_resume(resume_data, "outreach"),
         output_language=output_language,
     )
 
@@ -76,33 +79,73 @@ async def generate_outreach_message(
     return result.strip()
 
 
-async def generate_resume_title(
-    job_description: str,
-    language: str = "en",
-) -> str:
-    """Generate a short descriptive title from a job description.
+_TITLE_SYSTEM_PROMPT = "You extract job titles and company names from job descriptions."
 
-    Args:
-        job_description: Target job description text
-        language: Output language code (en, es, zh, ja)
 
-    Returns:
-        Generated title like "Senior Frontend Engineer @ Stripe"
-    """
-    output_language = get_language_name(language)
+def _clean_title(title: str) -> str:
+    # Strip quotes and whitespace, truncate to 80 chars
+    return title.strip().strip("\"'")[:80]
 
+
+async def _generate_resume_title_single(item: tuple[str, str]) -> str:
+    job_description, language = item
     prompt = GENERATE_TITLE_PROMPT.format(
         job_description=job_description,
-        output_language=output_language,
+        output_language=get_language_name(language),
     )
 
     result = await complete(
         prompt=prompt,
-        system_prompt="You extract job titles and company names from job descriptions.",
+        system_prompt=_TITLE_SYSTEM_PROMPT,
         max_tokens=60,
         temperature=0.3,
     )
+    return _clean_title(result)
 
-    # Strip quotes and whitespace, truncate to 80 chars
-    title = result.strip().strip("\"'")
-    return title[:80]
+
+def _batch_title_prompt(items: list[tuple[str, str]]) -> tuple[str, str]:
+    job_descriptions = "\n\n".join(
+        BATCH_ITEM_TEMPLATE.format(index=i, job_description=jd)
+        for i, (jd, _) in enumerate(items)
+    )
+    prompt = BATCH_GENERATE_TITLE_PROMPT.format(
+        job_descriptions=job_descriptions,
+        output_language=get_language_name(items[0][1]),
+    )
+    return _TITLE_SYSTEM_PROMPT, prompt
+
+
+def _batch_title_result(entry: dict[str, Any]) -> str:
+    title = entry.get("title")
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("missing title")
+    return _clean_title(title)
+
+
+# Titles for jobs processed concurrently share one LLM call (batched per language)
+_title_batcher: MicroBatcher[str] = MicroBatcher(
+    "generate_resume_title",
+    build_prompt=_batch_title_prompt,
+    parse_result=_batch_title_result,
+    single=_generate_resume_title_single,
+    max_tokens_per_item=60,
+)
+
+
+async def generate_resume_title(
+    job_description: str,
+    language: str = "en",
+) -> str:
+    """Generate a short descriptive title from a job description.
+
+    Titles requested at about the same time (in the same language) are
+    micro-batched into one prompt (see `app.batching`).
+
+    Args:
+        job_description: Target job description text
+        language: Output language code (en, es, zh, ja)
+
+    Returns:
+        Generated title like "Senior Frontend Engineer @ Stripe"
+    """
+    return await _title_batcher.submit((job_description, language), key=language)
@@ -1,22 +1,52 @@
 """Resume improvement service using LLM."""
 
+import asyncio
+import copy
+import hashlib
 import json
 import logging
 import re
+from collections import Counter
 from difflib import SequenceMatcher
 from dataclasses import dataclass
 from typing import Any, Callable
 
+from pydantic import BaseModel, create_model
+
+from app.batching import MicroBatcher
+from app.config import settings
 from app.llm import complete_json
 from app.prompts import (
+    BATCH_EXTRACT_KEYWORDS_PROMPT,
+    BATCH_ITEM_TEMPLATE,
     CRITICAL_TRUTHFULNESS_RULES,
     DEFAULT_IMPROVE_PROMPT_ID,
     EXTRACT_KEYWORDS_PROMPT,
     IMPROVE_RESUME_PROMPTS,
+    IMPROVE_RESUME_REQUEST_PROMPT,
+    IMPROVE_SECTION_INSTRUCTIONS,
+    IMPROVE_SECTION_REQUEST_PROMPT,
     get_language_name,
 )
+from app.prompts.serialization import (
+    compact_resume_text,
+    parse_resume_json,
+    restore_pruned,
+    serialize_for_prompt,
+)
 from app.prompts.templates import RESUME_SCHEMA
-from app.schemas import ResumeData, ResumeFieldDiff, ResumeDiffSummary
+from app.schemas import (
+    AdditionalInfo,
+    CustomSection,
+    Education,
+    Experience,
+    JobKeywords,
+    Project,
+    ResumeData,
+    ResumeFieldDiff,
+    ResumeDiffSummary,
+)
+from app.token_budget import fit_job_description, output_budget
 
 logger = logging.getLogger(__name__)
 
@@ -68,9 +98,48 @@ def _check_for_truncation(data: dict[str, Any]) -> None:
         )
 
 
+_KEYWORDS_SYSTEM_PROMPT = "You are an expert job description analyzer."
+
+
+async def _extract_job_keywords_single(sanitized_jd: str) -> dict[str, Any]:
+    prompt = EXTRACT_KEYWORDS_PROMPT.format(job_description=sanitized_jd)
+    return await complete_json(
+        prompt=prompt,
+        system_prompt=_KEYWORDS_SYSTEM_PROMPT,
+        response_model=JobKeywords,
+    )
+
+
+def _batch_keywords_prompt(job_descriptions: list[str]) -> tuple[str, str]:
+    items = "\n\n".join(
+        BATCH_ITEM_TEMPLATE.format(index=i, job_description=jd)
+        for i, jd in enumerate(job_descriptions)
+    )
+    return _KEYWORDS_SYSTEM_PROMPT, BATCH_EXTRACT_KEYWORDS_PROMPT.format(job_descriptions=items)
+
+
+def _batch_keywords_result(entry: dict[str, Any]) -> dict[str, Any]:
+    result = {key: value for key, value in entry.items() if key != "index"}
+    JobKeywords.model_validate(result)
+    return result
+
+
+# Keyword extractions for jobs processed concurrently share one LLM call
+_keywords_batcher: MicroBatcher[dict[str, Any]] = MicroBatcher(
+    "extract_job_keywords",
+    build_prompt=_batch_keywords_prompt,
+    parse_result=_batch_keywords_result,
+    single=_extract_job_keywords_single,
+    max_tokens_per_item=1024,
+)
+
+
 async def extract_job_keywords(job_description: str) -> dict[str, Any]:
     """Extract keywords and requirements from job description.
 
+    Extractions requested at about the same time are micro-batched into one
+    prompt (see `app.batching`).
+
     Args:
         job_description: Raw job description text
 
@@ -79,11 +148,30 @@ async def extract_job_keywords(job_description: str) -> dict[str, Any]:
     """
     # LLM-011: Sanitize job description before using in prompt
     sanitized_jd = _sanitize_user_input(job_description)
-    prompt = EXTRACT_KEYWORDS_PROMPT.format(job_description=sanitized_jd)
+    return await _keywords_batcher.submit(sanitized_jd)
 
-    return await complete_json(
-        prompt=prompt,
-        system_prompt="You are an expert job description analyzer.",
+
+def _improve_system_prompt(prompt_id: str | None) -> str:
+    """System prompt for the selected improve prompt.
+
+    Static instructions, rules and schema go in the system prompt so they form
+    a stable, cacheable prefix; the user prompt only carries per-request data.
+    """
+    selected_prompt_id = prompt_id or DEFAULT_IMPROVE_PROMPT_ID
+    prompt_template = IMPROVE_RESUME_PROMPTS.get(
+        selected_prompt_id, IMPROVE_RESUME_PROMPTS[DEFAULT_IMPROVE_PROMPT_ID]
+    )
+    if selected_prompt_id not in CRITICAL_TRUTHFULNESS_RULES:
+        logger.warning(
+            "Missing truthfulness rules for prompt '%s'; using default rules.",
+            selected_prompt_id,
+        )
+    truthfulness_rules = CRITICAL_TRUTHFULNESS_RULES.get(
+        selected_prompt_id, CRITICAL_TRUTHFULNESS_RULES[DEFAULT_IMPROVE_PROMPT_ID]
+    )
+    return "You are an expert resume editor. Output only valid JSON.\n\n" + prompt_template.format(
+        schema=RESUME_SCHEMA,
+        critical_truthfulness_rules=truthfulness_rules,
     )
 
 
@@ -108,48 +196,385 @@ async def improve_resume(
     LLM-006: Validates for truncation before Pydantic validation.
     LLM-011: Sanitizes job description to prevent prompt injection.
     """
-    keywords_str = json.dumps(job_keywords, indent=2)
+    keywords_str = serialize_for_prompt(job_keywords, "job_keywords")
     output_language = get_language_name(language)
 
-    selected_prompt_id = prompt_id or DEFAULT_IMPROVE_PROMPT_ID
-    prompt_template = IMPROVE_RESUME_PROMPTS.get(
-        selected_prompt_id, IMPROVE_RESUME_PROMPTS[DEFAULT_IMPROVE_PROMPT_ID]
-    )
-    if selected_prompt_id not in CRITICAL_TRUTHFULNESS_RULES:
-        logger.warning(
-            "Missing truthfulness rules for prompt '%s'; using default rules.",
-            selected_prompt_id,
-        )
-    truthfulness_rules = CRITICAL_TRUTHFULNESS_RULES.get(
-        selected_prompt_id, CRITICAL_TRUTHFULNESS_RULES[DEFAULT_IMPROVE_PROMPT_ID]
-    )
-
     # LLM-011: Sanitize job description to prevent prompt injection
     sanitized_jd = _sanitize_user_input(job_description)
 
-    prompt = prompt_template.format(
-        job_description=sanitized_jd,
-        job_keywords=keywords_str,
-        original_resume=original_resume,
-        schema=RESUME_SCHEMA,
-        output_language=output_language,
-        critical_truthfulness_rules=truthfulness_rules,
+    system_prompt = _improve_system_prompt(prompt_id)
+    prompt_parts = {
+        "job_keywords": keywords_str,
+        "original_resume": compact_resume_text(original_resume, "improve.original"),
+        "output_language": output_language,
+    }
+
+    # The output is the resume rewritten as JSON (more tokens when translated);
+    # the job description gets whatever context is left.
+    max_tokens = output_budget(
+        "improve_resume",
+        prompt_parts["original_resume"],
+        ratio=None if language == "en" else settings.llm_translated_output_token_ratio,
+    )
+    sanitized_jd, max_tokens, _ = fit_job_description(
+        "improve_resume",
+        sanitized_jd,
+        system_prompt + IMPROVE_RESUME_REQUEST_PROMPT.format(**prompt_parts, job_description=""),
+        max_tokens,
     )
+    prompt = IMPROVE_RESUME_REQUEST_PROMPT.format(**prompt_parts, job_description=sanitized_jd)
 
     result = await complete_json(
         prompt=prompt,
-        system_prompt="You are an expert resume editor. Output only valid JSON.",
-        max_tokens=8192,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+        response_model=ResumeData,
     )
 
     # LLM-006: Pre-validation check for truncation signs
     _check_for_truncation(result)
 
+    # JSON content was sent pruned (no sectionMeta or empty fields); put them back
+    original_data = parse_resume_json(original_resume)
+    if original_data is not None:
+        result = restore_pruned(result, original_data)
+
     # Validate against schema
     validated = ResumeData.model_validate(result)
     return validated.model_dump()
 
 
+# Response models for section-mode calls, keyed by the ResumeData field improved
+_SECTION_MODELS: dict[str, type[BaseModel]] = {
+    "summary": create_model("SummarySection", section=(str, "")),
+    "workExperience": create_model("ExperienceSection", section=(Experience, ...)),
+    "personalProjects": create_model("ProjectSection", section=(Project, ...)),
+    "education": create_model("EducationSection", section=(list[Education], ...)),
+    "additional": create_model("AdditionalSection", section=(AdditionalInfo, ...)),
+    "customSections": create_model("CustomSectionSection", section=(CustomSection, ...)),
+}
+
+
+@dataclass(frozen=True)
+class _ResumeSection:
+    """One independently improved part of a resume."""
+
+    field: str
+    key: int | str | None
+    value: Any
+
+    @property
+    def label(self) -> str:
+        if isinstance(self.key, int):
+            return f"{self.field}[{self.key}]"
+        if self.key is not None:
+            return f"{self.field}.{self.key}"
+        return self.field
+
+
+def _split_sections(resume: dict[str, Any]) -> list[_ResumeSection]:
+    """Split a resume into the sections improved by separate calls.
+
+    Work experience, projects and custom sections are improved entry by entry;
+    education (short, rarely rewritten) is sent as one list. personalInfo and
+    sectionMeta are never sent: they are copied from the original.
+    """
+    sections: list[_ResumeSection] = []
+    if resume.get("summary"):
+        sections.append(_ResumeSection("summary", None, resume["summary"]))
+    for field in ("workExperience", "personalProjects"):
+        sections.extend(
+            _ResumeSection(field, index, entry) for index, entry in enumerate(resume.get(field) or [])
+        )
+    if resume.get("education"):
+        sections.append(_ResumeSection("education", None, resume["education"]))
+    if any((resume.get("additional") or {}).values()):
+        sections.append(_ResumeSection("additional", None, resume["additional"]))
+    for key, custom in (resume.get("customSections") or {}).items():
+        if custom.get("items") or custom.get("strings") or custom.get("text"):
+            sections.append(_ResumeSection("customSections", key, custom))
+    return sections
+
+
+def _restore_ids(section: _ResumeSection, improved: Any) -> Any:
+    """Keep entry ids from the original; the model is not trusted with them."""
+    if section.field in ("workExperience", "personalProjects"):
+        improved["id"] = section.value.get("id", improved.get("id", 0))
+    elif section.field == "education":
+        if len(improved) != len(section.value):
+            raise ValueError("education entries were added or removed")
+        for original, entry in zip(section.value, improved):
+            entry["id"] = original.get("id", entry.get("id", 0))
+    elif section.field == "customSections":
+        items = improved.get("items")
+        original_items = section.value.get("items") or []
+        if items and len(items) == len(original_items):
+            for original, item in zip(original_items, items):
+                item["id"] = original.get("id", item.get("id", 0))
+    return improved
+
+
+async def _improve_sections(
+    sections: list[_ResumeSection],
+    job_description: str,
+    job_keywords: dict[str, Any],
+    language: str,
+    prompt_id: str | None,
+) -> list[Any]:
+    """Improve each section with its own concurrent call.
+
+    Returns one result per section: the improved value, or the exception
+    its call raised.
+    """
+    keywords_str = serialize_for_prompt(job_keywords, "job_keywords")
+    output_language = get_language_name(language)
+    sanitized_jd = _sanitize_user_input(job_description)
+    system_prompt = _improve_system_prompt(prompt_id) + "\n\n" + IMPROVE_SECTION_INSTRUCTIONS
+    ratio = None if language == "en" else settings.llm_translated_output_token_ratio
+
+    section_json = {
+        section.label: serialize_for_prompt({"section": section.value}, "improve.section")
+        for section in sections
+    }
+    max_tokens = {
+        label: output_budget("improve_resume_section", text, ratio=ratio)
+        for label, text in section_json.items()
+    }
+
+    def build_prompt(section: _ResumeSection, jd: str) -> str:
+        return IMPROVE_SECTION_REQUEST_PROMPT.format(
+            output_language=output_language,
+            job_description=jd,
+            job_keywords=keywords_str,
+            section=section.label,
+            section_json=section_json[section.label],
+        )
+
+    # The job description is fitted once, for the largest section, so every
+    # call carries the same job context.
+    largest = max(sections, key=lambda section: max_tokens[section.label])
+    sanitized_jd, max_tokens[largest.label], _ = fit_job_description(
+        "improve_resume_section",
+        sanitized_jd,
+        system_prompt + build_prompt(largest, ""),
+        max_tokens[largest.label],
+    )
+
+    async def improve_section(section: _ResumeSection) -> Any:
+        result = await complete_json(
+            prompt=build_prompt(section, sanitized_jd),
+            system_prompt=system_prompt,
+            max_tokens=max_tokens[section.label],
+            response_model=_SECTION_MODELS[section.field],
+        )
+        improved = _SECTION_MODELS[section.field].model_validate(result).model_dump()["section"]
+        return _restore_ids(section, improved)
+
+    results = await asyncio.gather(
+        *(improve_section(section) for section in sections), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+    return results
+
+
+def _set_section(data: dict[str, Any], section: _ResumeSection, value: Any) -> None:
+    if section.key is not None:
+        data[section.field][section.key] = value
+    else:
+        data[section.field] = value
+
+
+async def improve_resume_by_section(
+    original_data: dict[str, Any],
+    job_description: str,
+    job_keywords: dict[str, Any],
+    language: str = "en",
+    prompt_id: str | None = None,
+) -> tuple[dict[str, Any], list[str]]:
+    """Improve a structured resume with one concurrent call per section.
+
+    A single `improve_resume` call regenerates the whole document (including
+    personalInfo, which is discarded afterwards), so its latency grows with
+    the resume and large resumes can hit the output token limit. Here each
+    summary, experience/project entry, education, skills and custom section is
+    rewritten by its own smaller call; latency tracks the largest section.
+
+    Every call shares the same system prompt and job context so providers can
+    reuse the cached prefix. A section whose call fails keeps its original
+    content and is reported in the returned warnings; if every section fails
+    the first error is raised.
+
+    Returns:
+        `(improved_data, warnings)`, the data matching the ResumeData schema.
+    """
+    original = ResumeData.model_validate(original_data).model_dump()
+    sections = _split_sections(original)
+    if not sections:
+        return original, []
+
+    results = await _improve_sections(
+        sections, job_description, job_keywords, language, prompt_id
+    )
+
+    improved_data = copy.deepcopy(original)
+    failed: list[str] = []
+    errors: list[BaseException] = []
+    for section, result in zip(sections, results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                "Keeping original %s; section improvement failed: %s", section.label, result
+            )
+            failed.append(section.label)
+            errors.append(result)
+        else:
+            _set_section(improved_data, section, result)
+    if len(errors) == len(sections):
+        raise errors[0]
+
+    warnings = (
+        [f"Some sections could not be tailored and were kept as-is: {', '.join(failed)}"]
+        if failed
+        else []
+    )
+
+    return ResumeData.model_validate(improved_data).model_dump(), warnings
+
+
+def _tracked_sections(resume: dict[str, Any]) -> dict[str, _ResumeSection]:
+    """Sections of a resume keyed by a label that survives reordering.
+
+    Experience and project entries are keyed by their id (`workExperience#3`),
+    so inserting or moving an entry does not relabel the ones after it. An
+    entry without an id, or sharing it with another entry of the same field,
+    falls back to its position (`workExperience[2]`).
+    """
+    sections = _split_sections(resume)
+    id_counts = Counter(
+        (section.field, section.value.get("id"))
+        for section in sections
+        if isinstance(section.key, int)
+    )
+    tracked: dict[str, _ResumeSection] = {}
+    for section in sections:
+        label = section.label
+        if isinstance(section.key, int):
+            entry_id = section.value.get("id")
+            if entry_id not in (None, "") and id_counts[(section.field, entry_id)] == 1:
+                label = f"{section.field}#{entry_id}"
+        tracked[label] = section
+    return tracked
+
+
+def section_digests(resume_data: dict[str, Any]) -> dict[str, str]:
+    """Content hash of each section of a resume, keyed by tracked label.
+
+    Stored on a tailored resume for the parent it was tailored from, so a
+    later edit of the parent can be mapped to the sections it touched, and
+    for the tailored content itself, so later edits of the child are not
+    overwritten.
+    """
+    resume = ResumeData.model_validate(resume_data).model_dump()
+    return {
+        label: hashlib.sha256(
+            json.dumps(section.value, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        for label, section in _tracked_sections(resume).items()
+    }
+
+
+async def retailor_changed_sections(
+    tailored_data: dict[str, Any],
+    source_data: dict[str, Any],
+    changed: set[str],
+    job_description: str,
+    job_keywords: dict[str, Any],
+    language: str = "en",
+    prompt_id: str | None = None,
+    edited: set[str] | frozenset[str] = frozenset(),
+) -> tuple[dict[str, Any], list[str]]:
+    """Bring a tailored resume up to date with its edited source resume.
+
+    The result follows the structure of `source_data`: personalInfo,
+    sectionMeta and removed entries come from the source. Sections (tracked
+    labels, see `section_digests`) in `changed` are tailored again from the
+    source, one call each; the others keep their tailored content, matched
+    by label rather than position. A section whose call fails falls back to
+    the untailored source content.
+
+    Sections in `edited` were changed on the tailored resume itself and are
+    never overwritten: they keep their content, even when removed from the
+    source, and are reported in the warnings when the source changed too.
+
+    Returns:
+        `(updated_data, warnings)`, the data matching the ResumeData schema.
+    """
+    source = ResumeData.model_validate(source_data).model_dump()
+    tailored = ResumeData.model_validate(tailored_data).model_dump()
+    sections = _tracked_sections(source)
+    current = _tracked_sections(tailored)
+    stale = [
+        section for label, section in sections.items() if label in changed and label not in edited
+    ]
+    results = (
+        await _improve_sections(stale, job_description, job_keywords, language, prompt_id)
+        if stale
+        else []
+    )
+    retailored = dict(zip((section.label for section in stale), results))
+
+    updated = copy.deepcopy(source)
+    failed: list[str] = []
+    kept: list[str] = []
+    for label, section in sections.items():
+        if section.label in retailored:
+            result = retailored[section.label]
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Using untailored %s; section re-tailoring failed: %s", label, result
+                )
+                failed.append(label)
+                continue
+            _set_section(updated, section, result)
+            continue
+        if label in edited and label in changed:
+            kept.append(label)
+        if label in current and current[label].value:
+            _set_section(updated, section, current[label].value)
+        elif label in edited:
+            # Deleted from the tailored resume; entries are dropped below.
+            _set_section(
+                updated, section, None if section.key is not None else tailored[section.field]
+            )
+    for label in sorted(edited - sections.keys()):
+        if label not in current:
+            continue
+        kept.append(label)
+        section = current[label]
+        if isinstance(section.key, int):
+            updated[section.field].append(section.value)
+        else:
+            _set_section(updated, section, section.value)
+    for field in ("workExperience", "personalProjects"):
+        updated[field] = [entry for entry in updated[field] if entry is not None]
+    updated["customSections"] = {
+        key: custom for key, custom in updated["customSections"].items() if custom is not None
+    }
+
+    warnings = []
+    if failed:
+        warnings.append(
+            f"Some sections could not be re-tailored and use the untailored content: {', '.join(failed)}"
+        )
+    if kept:
+        warnings.append(
+            f"Some sections were edited after tailoring and were not updated: {', '.join(kept)}"
+        )
+
+    return ResumeData.model_validate(updated).model_dump(), warnings
+
+
 def _format_entry_label(parts: list[str], fallback: str) -> str:
     label = " | ".join([part for part in parts if part])
     return label if label else fallback
@@ -4,10 +4,8 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-from markitdown import MarkItDown
-
 from app.llm import complete_json
-from app.prompts import PARSE_RESUME_PROMPT
+from app.prompts import PARSE_RESUME_PROMPT, PARSE_RESUME_SYSTEM_PROMPT
 from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
 from app.schemas import ResumeData
 
@@ -22,6 +20,9 @@ async def parse_document(content: bytes, filename: str) -> str:
     Returns:
         Markdown text content
     """
+    # Imported here: markitdown pulls in heavy converters we only need on upload.
+    from markitdown import MarkItDown
+
     suffix = Path(filename).suffix.lower()
 
     # Write to temp file for markitdown
@@ -46,14 +47,10 @@ async def parse_resume_to_json(markdown_text: str) -> dict[str, Any]:
     Returns:
         Structured resume data matching ResumeData schema
     """
-    prompt = PARSE_RESUME_PROMPT.format(
-        schema=RESUME_SCHEMA_EXAMPLE,
-        resume_text=markdown_text,
-    )
-
     result = await complete_json(
-        prompt=prompt,
-        system_prompt="You are a JSON extraction engine. Output only valid JSON, no explanations.",
+        prompt=PARSE_RESUME_PROMPT.format(resume_text=markdown_text),
+        system_prompt=PARSE_RESUME_SYSTEM_PROMPT.format(schema=RESUME_SCHEMA_EXAMPLE),
+        response_model=ResumeData,
     )
 
     # Validate against schema
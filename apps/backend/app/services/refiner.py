@@ -5,6 +5,12 @@ multiple passes:
 1. Keyword injection - add missing JD keywords where supported by master resume
 2. AI phrase removal - replace AI-generated buzzwords with simpler alternatives
 3. Master alignment validation - ensure no fabricated content was added
+4. Metric verification - check quantitative claims are plausible
+
+A planner uses cheap local signals (keyword gain per pass, which keywords the
+master supports, where new numeric claims appear) to skip LLM passes that
+cannot help or to narrow them to the sections that need them; its decisions
+are recorded in `RefinementResult.plan`.
 """
 
 import copy
@@ -14,28 +20,34 @@ import re
 from functools import lru_cache
 from typing import Any
 
-from app.llm import complete_json
+from app import deadline
+from app.llm import complete_json, llm_call_fits_deadline
+from app.prompts.serialization import (
+    restore_pruned,
+    serialize_reference_resume,
+    serialize_resume,
+)
 from app.prompts.refinement import (
     AI_PHRASE_BLACKLIST,
     AI_PHRASE_REPLACEMENTS,
     KEYWORD_INJECTION_PROMPT,
+    KEYWORD_INJECTION_SYSTEM_PROMPT,
     METRIC_VERIFICATION_PROMPT,
     REDUNDANT_SECTION_BLACKLIST,
 )
+from app.schemas import ResumeData
+from app.token_budget import fit_job_description, output_budget
 from app.schemas.refinement import (
     AlignmentReport,
     AlignmentViolation,
     KeywordGapAnalysis,
     RefinementConfig,
+    RefinementDecision,
     RefinementResult,
 )
 
 logger = logging.getLogger(__name__)
 
-# LLM-012: Job description truncation limits
-MAX_JD_LENGTH = 2000
-MIN_TRUNCATION_WARNING_LENGTH = 1500
-
 
 def _keyword_in_text(keyword: str, text: str) -> bool:
     """Check if keyword exists as a whole word in text.
@@ -113,10 +125,27 @@ async def verify_metrics(
     Returns:
         Resume data with verified/adjusted metrics
     """
-    truncated_jd, _ = _prepare_job_description(job_description)
+    resume_json = serialize_resume(resume, "verify_metrics")
+    system_prompt = (
+        "You are a resume metrics auditor. Verify that all quantitative claims "
+        "are realistic for the role and industry. Adjust implausible numbers. "
+        "Return only valid JSON matching the input schema."
+    )
+    max_tokens = output_budget("verify_metrics", resume_json)
+    truncated_jd, max_tokens, _ = _prepare_job_description(
+        job_description,
+        "verify_metrics",
+        system_prompt
+        + METRIC_VERIFICATION_PROMPT.format(
+            resume=resume_json,
+            job_description="",
+            seniority_level=seniority_level or "mid-level",
+        ),
+        max_tokens,
+    )
 
     prompt = METRIC_VERIFICATION_PROMPT.format(
-        resume=json.dumps(resume, indent=2),
+        resume=resume_json,
         job_description=truncated_jd,
         seniority_level=seniority_level or "mid-level",
     )
@@ -124,12 +153,9 @@ async def verify_metrics(
     try:
         result = await complete_json(
             prompt=prompt,
-            system_prompt=(
-                "You are a resume metrics auditor. Verify that all quantitative claims "
-                "are realistic for the role and industry. Adjust implausible numbers. "
-                "Return only valid JSON matching the input schema."
-            ),
-            max_tokens=8192,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            response_model=ResumeData,
         )
 
         if not isinstance(result, dict):
@@ -140,8 +166,10 @@ async def verify_metrics(
             logger.warning("Metric verification corrupted structure, using original")
             return resume
 
-        return result
+        return _restore_omitted_keys(result, resume)
 
+    except deadline.DeadlineExceededError:
+        raise
     except Exception as e:
         logger.warning("Metric verification failed: %s", e)
         return resume
@@ -168,20 +196,168 @@ def _enforce_certifications(
     return current
 
 
+# Quantitative claims: currency amounts, percentages, multipliers and counts.
+# Bare four-digit years are not claims.
+_NUMERIC_CLAIM = re.compile(
+    r"[$€£]\s?\d[\d,.]*\s?[kmb]?n?\b"
+    r"|\b\d[\d,.]*\s?(?:%|x\b|[kmb]\b|\+)"
+    r"|\b(?!(?:19|20)\d{2}\b)\d[\d,.]*\b",
+    re.IGNORECASE,
+)
+
+# Sections verify_metrics can be narrowed to; numbers elsewhere need a full pass.
+_METRIC_ENTRY_FIELDS = ("workExperience", "personalProjects")
+
+
+def _numeric_claims(value: Any) -> set[str]:
+    """Normalized numeric claims in all strings of `value`."""
+    if isinstance(value, str):
+        return {
+            re.sub(r"\s+", "", match.group(0).lower()).rstrip(".,")
+            for match in _NUMERIC_CLAIM.finditer(value)
+        }
+    if isinstance(value, dict):
+        return set().union(*(_numeric_claims(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_numeric_claims(item) for item in value))
+    return set()
+
+
+def _unverified_metric_sections(
+    tailored: dict[str, Any],
+    master: dict[str, Any],
+) -> list[tuple[str, int | None]] | None:
+    """Sections whose numeric claims do not appear anywhere in the master.
+
+    Claims copied from the master need no plausibility check. Returns
+    `(field, index)` pairs (`index` is None for the summary), or None if new
+    claims appear outside the summary, experience and projects.
+    """
+    known = _numeric_claims(master)
+    sections: list[tuple[str, int | None]] = []
+    if _numeric_claims(tailored.get("summary", "")) - known:
+        sections.append(("summary", None))
+    for field in _METRIC_ENTRY_FIELDS:
+        for index, entry in enumerate(tailored.get(field) or []):
+            if _numeric_claims(entry) - known:
+                sections.append((field, index))
+    rest = {
+        key: value
+        for key, value in tailored.items()
+        if key not in ("summary", "personalInfo", "sectionMeta", *_METRIC_ENTRY_FIELDS)
+    }
+    if _numeric_claims(rest) - known:
+        return None
+    return sections
+
+
+async def _verify_metric_sections(
+    resume: dict[str, Any],
+    sections: list[tuple[str, int | None]],
+    job_description: str,
+    seniority_level: str,
+) -> dict[str, Any]:
+    """Run `verify_metrics` on `sections` only and merge the result back.
+
+    Entries come back in the order they were sent; a field whose entry count
+    changed is left as it was.
+    """
+    indices = {
+        field: [index for name, index in sections if name == field]
+        for field in _METRIC_ENTRY_FIELDS
+    }
+    scoped: dict[str, Any] = {"personalInfo": resume.get("personalInfo", {})}
+    if ("summary", None) in sections:
+        scoped["summary"] = resume.get("summary", "")
+    for field, field_indices in indices.items():
+        if field_indices:
+            scoped[field] = [resume[field][index] for index in field_indices]
+
+    verified = await verify_metrics(scoped, job_description, seniority_level)
+
+    merged = _deep_copy(resume)
+    if "summary" in scoped and isinstance(verified.get("summary"), str):
+        merged["summary"] = verified["summary"]
+    for field, field_indices in indices.items():
+        entries = verified.get(field)
+        if not field_indices or not isinstance(entries, list):
+            continue
+        if len(entries) != len(field_indices):
+            logger.warning("Metric verification changed %s entry count, keeping them", field)
+            continue
+        for index, entry in zip(field_indices, entries):
+            merged[field][index] = entry
+    return merged
+
+
+def _deadline_decision(pass_name: str) -> RefinementDecision:
+    """Skip `pass_name`: the request deadline leaves no time for another LLM call."""
+    deadline.drop(pass_name)
+    return RefinementDecision(
+        pass_name=pass_name,
+        action="skip",
+        reason="Not enough time left before the request deadline",
+        llm_calls_saved=1,
+    )
+
+
+def _plan_keyword_pass(
+    iteration: int,
+    missing: list[str],
+    injectable: list[str],
+    keyword_count: int,
+    last_gain: float | None,
+    min_gain: float,
+) -> RefinementDecision:
+    """Decide whether another keyword injection call is worth making.
+
+    Later passes only restore keywords the previous pass dropped, and only
+    those the master supports. The loop stops once a pass gained less than
+    `min_gain` match points, or when the candidates could not add that many.
+    """
+    if last_gain is not None and last_gain < min_gain:
+        return RefinementDecision(
+            pass_name="keyword_injection",
+            action="skip",
+            reason=f"Previous pass gained {last_gain:.1f} points (< {min_gain:g})",
+            llm_calls_saved=1,
+        )
+    candidates = missing if iteration == 0 else [kw for kw in missing if kw in injectable]
+    potential_gain = len(candidates) / keyword_count * 100
+    if potential_gain < min_gain:
+        return RefinementDecision(
+            pass_name="keyword_injection",
+            action="skip",
+            reason=(
+                f"{len(candidates)} injectable keyword(s) could add at most "
+                f"{potential_gain:.1f} points (< {min_gain:g})"
+            ),
+            llm_calls_saved=1,
+        )
+    return RefinementDecision(
+        pass_name="keyword_injection",
+        action="run" if len(candidates) == len(missing) else "shrink",
+        reason=f"Injecting {len(candidates)} of {len(missing)} missing keyword(s)",
+    )
+
+
 async def refine_resume(
     initial_tailored: dict[str, Any],
     master_resume: dict[str, Any],
     job_description: str,
     job_keywords: dict[str, Any],
     config: RefinementConfig | None = None,
+    master_text: str | None = None,
 ) -> RefinementResult:
     """Multi-pass refinement of an initially tailored resume.
 
     Pipeline:
-    1. Iterative keyword injection loop (up to MAX_MATCH_ITERATIONS until TARGET_MATCH_PERCENTAGE)
+    1. Iterative keyword injection loop (up to MAX_MATCH_ITERATIONS until
+       TARGET_MATCH_PERCENTAGE, or until the planner sees too little gain)
     2. AI phrase removal (local)
     3. Master alignment validation (relaxed: companies/dates/education only)
-    4. Metric verification (LLM)
+    4. Metric verification (LLM; skipped or narrowed when only some sections
+       have numeric claims the master lacks)
     5. Redundant section stripping (local)
     6. Certification enforcement (local)
 
@@ -191,6 +367,8 @@ async def refine_resume(
         job_description: Raw job description text
         job_keywords: Extracted job keywords
         config: Refinement configuration
+        master_text: Precomputed `resume_text(master_resume)`, for callers
+            refining many resumes against the same master
 
     Returns:
         RefinementResult with refined data and analysis
@@ -203,14 +381,17 @@ async def refine_resume(
     ai_phrases_found: list[str] = []
     keyword_analysis: KeywordGapAnalysis | None = None
     alignment: AlignmentReport | None = None
+    plan: list[RefinementDecision] = []
 
     # Pass 1: Iterative keyword injection loop
     if config.enable_keyword_injection:
         addressed_keywords: set[str] = set()
+        keyword_count = len(_jd_keyword_set(job_keywords)) or 1
+        last_gain: float | None = None
 
         for iteration in range(MAX_MATCH_ITERATIONS):
             keyword_analysis = analyze_keyword_gaps(
-                job_keywords, current, master_resume
+                job_keywords, current, master_resume, master_text=master_text
             )
             current_match = keyword_analysis.current_match_percentage
 
@@ -235,6 +416,30 @@ async def refine_resume(
                 logger.info("No new keywords to inject, stopping loop")
                 break
 
+            if not llm_call_fits_deadline():
+                plan.append(_deadline_decision("keyword_injection"))
+                break
+
+            if config.enable_planner:
+                decision = _plan_keyword_pass(
+                    iteration,
+                    new_missing,
+                    keyword_analysis.injectable_keywords,
+                    keyword_count,
+                    last_gain,
+                    config.min_keyword_gain,
+                )
+                plan.append(decision)
+                if decision.action == "skip":
+                    logger.info("Planner skipped keyword injection: %s", decision.reason)
+                    break
+                if iteration > 0:
+                    # Keywords lost by the previous pass are only restored if
+                    # the master resume supports them.
+                    new_missing = [
+                        kw for kw in new_missing if kw in keyword_analysis.injectable_keywords
+                    ]
+
             logger.info(
                 "Injecting %d keywords (iteration %d): %s",
                 len(new_missing),
@@ -251,6 +456,10 @@ async def refine_resume(
                 )
                 addressed_keywords.update(new_missing)
                 passes += 1
+                last_gain = calculate_keyword_match(current, job_keywords) - current_match
+            except deadline.DeadlineExceededError:
+                deadline.drop("keyword_injection")
+                break
             except Exception as e:
                 logger.warning("Keyword injection failed (iteration %d): %s", iteration + 1, e)
                 break
@@ -282,11 +491,45 @@ async def refine_resume(
                 current = fix_alignment_violations(current, company_violations)
                 passes += 1
 
-    # Pass 4: Metric verification (LLM call)
+    # Pass 4: Metric verification (LLM call), limited by the planner to the
+    # sections with numeric claims that the master does not contain
     seniority = job_keywords.get("seniority_level", "mid-level")
+    metric_sections = (
+        _unverified_metric_sections(current, master_resume) if config.enable_planner else None
+    )
     try:
-        current = await verify_metrics(current, job_description, seniority)
-        passes += 1
+        if metric_sections != [] and not llm_call_fits_deadline():
+            plan.append(_deadline_decision("metric_verification"))
+        elif metric_sections is None:
+            current = await verify_metrics(current, job_description, seniority)
+            passes += 1
+        elif not metric_sections:
+            plan.append(
+                RefinementDecision(
+                    pass_name="metric_verification",
+                    action="skip",
+                    reason="No numeric claims beyond those in the master resume",
+                    llm_calls_saved=1,
+                )
+            )
+        else:
+            plan.append(
+                RefinementDecision(
+                    pass_name="metric_verification",
+                    action="shrink",
+                    reason="New numeric claims only in: "
+                    + ", ".join(
+                        field if index is None else f"{field}[{index}]"
+                        for field, index in metric_sections
+                    ),
+                )
+            )
+            current = await _verify_metric_sections(
+                current, metric_sections, job_description, seniority
+            )
+            passes += 1
+    except deadline.DeadlineExceededError:
+        deadline.drop("metric_verification")
     except Exception as e:
         logger.warning("Metric verification pass failed: %s", e)
 
@@ -308,13 +551,24 @@ async def refine_resume(
         alignment_report=alignment,
         ai_phrases_removed=ai_phrases_found,
         final_match_percentage=final_match,
+        plan=plan,
     )
 
 
+def _jd_keyword_set(jd_keywords: dict[str, Any]) -> set[str]:
+    """All keywords matched against: required, preferred and general keywords."""
+    keywords: set[str] = set()
+    keywords.update(jd_keywords.get("required_skills", []))
+    keywords.update(jd_keywords.get("preferred_skills", []))
+    keywords.update(jd_keywords.get("keywords", []))
+    return keywords
+
+
 def analyze_keyword_gaps(
     jd_keywords: dict[str, Any],
     tailored: dict[str, Any],
     master: dict[str, Any],
+    master_text: str | None = None,
 ) -> KeywordGapAnalysis:
     """Analyze which JD keywords are missing from the tailored resume.
 
@@ -322,19 +576,18 @@ def analyze_keyword_gaps(
         jd_keywords: Extracted job keywords with required_skills, preferred_skills, etc.
         tailored: Current tailored resume data
         master: Master resume data (source of truth)
+        master_text: Precomputed `resume_text(master)`, if available
 
     Returns:
         KeywordGapAnalysis with missing, injectable, and non-injectable keywords
     """
     # Extract text content from resumes
-    tailored_text = _extract_all_text(tailored).lower()
-    master_text = _extract_all_text(master).lower()
+    tailored_text = resume_text(tailored)
+    if master_text is None:
+        master_text = resume_text(master)
 
     # Get all keywords from JD
-    all_jd_keywords: set[str] = set()
-    all_jd_keywords.update(jd_keywords.get("required_skills", []))
-    all_jd_keywords.update(jd_keywords.get("preferred_skills", []))
-    all_jd_keywords.update(jd_keywords.get("keywords", []))
+    all_jd_keywords = _jd_keyword_set(jd_keywords)
 
     # Find missing keywords
     missing: list[str] = []
@@ -497,22 +750,38 @@ def validate_master_alignment(
     )
 
 
-def _prepare_job_description(job_description: str) -> tuple[str, bool]:
-    """LLM-012: Prepare job description for prompt, with truncation warning.
+def _prepare_job_description(
+    job_description: str,
+    operation: str,
+    fixed_prompt: str,
+    max_tokens: int,
+) -> tuple[str, int, bool]:
+    """LLM-012: Fit the job description into what's left of the context window.
+
+    Args:
+        job_description: Full job description
+        operation: Prompt name, for logs and token budget metrics
+        fixed_prompt: Rest of the prompt (system + user) without the job description
+        max_tokens: Output tokens reserved for the call
 
     Returns:
-        Tuple of (truncated_text, was_truncated)
+        Tuple of (text, max_tokens, was_truncated); truncation happens only if
+        needed, at paragraph or line boundaries, and never below the first
+        2000 characters (max_tokens is reduced first on small context windows).
     """
-    was_truncated = len(job_description) > MAX_JD_LENGTH
+    return fit_job_description(operation, job_description, fixed_prompt, max_tokens)
 
-    if was_truncated:
-        logger.warning(
-            "Job description truncated from %d to %d characters",
-            len(job_description),
-            MAX_JD_LENGTH,
-        )
 
-    return job_description[:MAX_JD_LENGTH], was_truncated
+def _restore_omitted_keys(
+    result: dict[str, Any],
+    source: dict[str, Any],
+) -> dict[str, Any]:
+    """Copy back keys that were left out of the prompt (e.g. sectionMeta).
+
+    Prompts are serialized without UI-only metadata and empty fields, so the
+    LLM cannot echo them; restore them from the resume that was sent.
+    """
+    return restore_pruned(result, source)
 
 
 def _validate_resume_structure(data: dict[str, Any]) -> bool:
@@ -555,33 +824,35 @@ async def inject_keywords(
     Returns:
         Updated resume data with keywords injected
 
-    LLM-012: Truncates job description with warning.
+    LLM-012: Truncates the job description only if the prompt would not fit.
     LLM-014: Validates result structure before returning.
     """
-    # LLM-012: Prepare job description with truncation handling
-    truncated_jd, was_truncated = _prepare_job_description(job_description)
-    if was_truncated:
-        logger.info(
-            "Job description was truncated for keyword injection (original: %d chars)",
-            len(job_description),
-        )
+    prompt_parts = {
+        "keywords_to_inject": json.dumps(keywords_to_inject, ensure_ascii=False),
+        "current_resume": serialize_resume(tailored, "inject_keywords.current"),
+        "master_resume": serialize_reference_resume(
+            master, tailored, "inject_keywords.master"
+        ),
+    }
+    max_tokens = output_budget("inject_keywords", prompt_parts["current_resume"])
 
-    prompt = KEYWORD_INJECTION_PROMPT.format(
-        keywords_to_inject=json.dumps(keywords_to_inject),
-        current_resume=json.dumps(tailored, indent=2),
-        master_resume=json.dumps(master, indent=2),
-        job_description=truncated_jd,
+    # LLM-012: Prepare job description with truncation handling
+    truncated_jd, max_tokens, _ = _prepare_job_description(
+        job_description,
+        "inject_keywords",
+        KEYWORD_INJECTION_SYSTEM_PROMPT
+        + KEYWORD_INJECTION_PROMPT.format(**prompt_parts, job_description=""),
+        max_tokens,
     )
 
+    prompt = KEYWORD_INJECTION_PROMPT.format(**prompt_parts, job_description=truncated_jd)
+
     try:
         result = await complete_json(
             prompt=prompt,
-            system_prompt=(
-                "You are a resume editor. Inject keywords naturally into the resume. "
-                "You may add new skills and fabricate realistic metrics. "
-                "Return only valid JSON matching the input schema."
-            ),
-            max_tokens=8192,
+            system_prompt=KEYWORD_INJECTION_SYSTEM_PROMPT,
+            max_tokens=max_tokens,
+            response_model=ResumeData,
         )
 
         # LLM-014: Validate the result maintains required structure
@@ -595,8 +866,10 @@ async def inject_keywords(
             )
             return tailored
 
-        return result
+        return _restore_omitted_keys(result, tailored)
 
+    except deadline.DeadlineExceededError:
+        raise
     except Exception as e:
         logger.warning("Keyword injection failed: %s", e)
         return tailored
@@ -667,10 +940,7 @@ def calculate_keyword_match(
     """
     resume_text = _extract_all_text(resume).lower()
 
-    all_keywords: set[str] = set()
-    all_keywords.update(jd_keywords.get("required_skills", []))
-    all_keywords.update(jd_keywords.get("preferred_skills", []))
-    all_keywords.update(jd_keywords.get("keywords", []))
+    all_keywords = _jd_keyword_set(jd_keywords)
 
     # SVC-009: Return 0% if no keywords (not 100% - that's misleading)
     if not all_keywords:
@@ -682,6 +952,11 @@ def calculate_keyword_match(
     return (matched / len(all_keywords)) * 100
 
 
+def resume_text(data: dict[str, Any]) -> str:
+    """Lowercased text of all resume sections, as used for keyword matching."""
+    return _extract_all_text(data).lower()
+
+
 def _extract_all_text(data: dict[str, Any]) -> str:
     """Extract all text content from resume data for keyword matching.
 
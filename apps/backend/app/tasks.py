@@ -0,0 +1,236 @@
+"""Background task queue for long-running pipelines.
+
+Tailoring a resume chains keyword extraction, the improvement call, the
+refinement loop and auxiliary messages, and can take minutes; holding the
+HTTP request open for all of it ties up a connection and fails behind proxies
+with shorter timeouts. Endpoints can instead submit a task and return its id
+immediately:
+
+- A fixed pool of workers (``TASK_WORKERS``) runs queued tasks, so a burst of
+  requests queues here instead of fanning out into concurrent LLM pipelines.
+  Submissions beyond ``TASK_QUEUE_MAX`` waiting tasks are rejected.
+- Status, result and error are persisted in the ``tasks`` table; clients poll
+  ``GET /tasks/{task_id}``, optionally long-polling with ``?wait=``.
+- On startup, tasks left queued by a previous process are resumed and tasks
+  that were running are marked failed.
+
+Task kinds are registered with a handler that takes the task's payload and
+returns a JSON-serializable result, so uploads or PDF renders can be queued
+the same way. Handlers that work through several items can call
+``report_progress()`` so pollers see how far along they are.
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException
+
+from app.circuit_breaker import CircuitOpenError
+from app.config import settings
+from app.deadline import DeadlineExceededError
+from app.database import db
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+_current_task: ContextVar[str | None] = ContextVar("current_task", default=None)
+
+
+class TaskQueueFullError(Exception):
+    """Raised when a task is submitted while the queue is at capacity."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def report_progress(done: int, total: int) -> None:
+    """Record `done` of `total` items on the running task (no-op outside a task)."""
+    task_id = _current_task.get()
+    if task_id is not None:
+        db.update_task(task_id, {"progress": {"done": done, "total": total}})
+
+
+def error_payload(error: Exception) -> dict[str, Any]:
+    """HTTP-style `{status_code, detail}` for a failed task or batch item."""
+    if isinstance(error, HTTPException):
+        return {"status_code": error.status_code, "detail": str(error.detail)}
+    if isinstance(error, CircuitOpenError):
+        return {"status_code": 503, "detail": str(error)}
+    if isinstance(error, DeadlineExceededError):
+        return {"status_code": 504, "detail": str(error)}
+    return {"status_code": 500, "detail": "Task failed. Please try again."}
+
+
+class TaskQueue:
+    """Persistent task queue drained by a bounded pool of asyncio workers."""
+
+    def __init__(self, workers: int | None = None, max_queued: int | None = None):
+        self.workers = workers if workers is not None else settings.task_workers
+        self.max_queued = max_queued if max_queued is not None else settings.task_queue_max
+        self._handlers: dict[str, TaskHandler] = {}
+        self._queue: asyncio.Queue[str] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._finished: dict[str, asyncio.Event] = {}
+        self._waiting: dict[str, int] = {}  # Pending wait() calls per task
+        self._running = 0
+        self._stats = {
+            "submitted": 0,
+            "started": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "rejected": 0,
+            "queue_seconds": 0.0,
+            "run_seconds": 0.0,
+        }
+
+    def register(self, kind: str, handler: TaskHandler) -> None:
+        """Register the coroutine that runs tasks of `kind`."""
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """Start the workers and recover tasks left over by a previous process."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        for task in db.list_tasks(("queued", "running")):
+            if task["status"] == "queued" and task["kind"] in self._handlers:
+                self._queue.put_nowait(task["task_id"])
+                continue
+            db.update_task(
+                task["task_id"],
+                {
+                    "status": "failed",
+                    "finished_at": _now(),
+                    "error": {"status_code": 500, "detail": "Task interrupted by a server restart."},
+                },
+            )
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(max(1, self.workers))
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers; queued tasks are resumed on the next start."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def submit(self, kind: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Persist a task of `kind` and queue it; returns the task record.
+
+        Raises:
+            ValueError: If no handler is registered for `kind`.
+            TaskQueueFullError: If `max_queued` tasks are already waiting.
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown task kind: {kind}")
+        if self._queue is None:
+            self.start()
+        assert self._queue is not None
+        if self._queue.qsize() >= self.max_queued:
+            self._stats["rejected"] += 1
+            raise TaskQueueFullError("Too many tasks are waiting. Please try again shortly.")
+        task = db.create_task(kind, payload)
+        self._queue.put_nowait(task["task_id"])
+        self._stats["submitted"] += 1
+        return task
+
+    async def wait(self, task_id: str, timeout: float) -> dict[str, Any] | None:
+        """Return the task once it has finished or `timeout` seconds have passed."""
+        task = db.get_task(task_id)
+        if task is None or task["status"] in FINISHED_STATUSES or timeout <= 0:
+            return task
+        event = self._finished.setdefault(task_id, asyncio.Event())
+        self._waiting[task_id] = self._waiting.get(task_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiting[task_id] -= 1
+            if not self._waiting[task_id]:
+                # Last waiter gone: don't keep events for abandoned waits.
+                del self._waiting[task_id]
+                if self._finished.get(task_id) is event:
+                    del self._finished[task_id]
+        return db.get_task(task_id)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            task_id = await queue.get()
+            try:
+                await self._execute(task_id)
+            finally:
+                queue.task_done()
+
+    async def _execute(self, task_id: str) -> None:
+        task = db.get_task(task_id)
+        if task is None or task["status"] != "queued":
+            return
+        started_at = _now()
+        db.update_task(task_id, {"status": "running", "started_at": started_at})
+        queued_for = (
+            datetime.fromisoformat(started_at) - datetime.fromisoformat(task["created_at"])
+        ).total_seconds()
+        self._stats["started"] += 1
+        self._stats["queue_seconds"] += max(0.0, queued_for)
+
+        self._running += 1
+        start = time.monotonic()
+        updates: dict[str, Any]
+        token = _current_task.set(task_id)
+        try:
+            result = await self._handlers[task["kind"]](task["payload"])
+            updates = {"status": "succeeded", "result": result}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Task %s (%s) failed: %s", task_id, task["kind"], e)
+            updates = {"status": "failed", "error": error_payload(e)}
+        finally:
+            _current_task.reset(token)
+            self._running -= 1
+            self._stats["run_seconds"] += time.monotonic() - start
+
+        self._stats[updates["status"]] += 1
+        db.update_task(task_id, {**updates, "finished_at": _now()})
+        event = self._finished.pop(task_id, None)
+        if event is not None:
+            event.set()
+
+    def snapshot(self) -> dict[str, Any]:
+        started = self._stats["started"]
+        finished = self._stats["succeeded"] + self._stats["failed"]
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+            "submitted": self._stats["submitted"],
+            "succeeded": self._stats["succeeded"],
+            "failed": self._stats["failed"],
+            "rejected": self._stats["rejected"],
+            "avg_queue_seconds": (
+                round(self._stats["queue_seconds"] / started, 3) if started else 0.0
+            ),
+            "avg_run_seconds": round(self._stats["run_seconds"] / finished, 3) if finished else 0.0,
+        }
+
+
+# Global task queue (workers are started in the app lifespan)
+task_queue = TaskQueue()
+
+
+def get_task_stats() -> dict[str, Any]:
+    """Task workers, queue depth, outcomes and average queue/run time."""
+    return task_queue.snapshot()
@@ -0,0 +1,253 @@
+"""Token budgets sized to each model's context window.
+
+Prompts used to chop job descriptions at a fixed 2000 characters and request
+``max_tokens=8192`` for every JSON call. The first loses information on large
+context models, and the second over-reserves output capacity, which slows
+queueing on providers that reserve output tokens up front. Here:
+
+- Prompt tokens are counted with the model's tokenizer (via LiteLLM, with the
+  character heuristic as a fallback). Mock and Ollama models always use the
+  heuristic, and LiteLLM is never imported on the event loop: until
+  `load_litellm()` has loaded it in the background, estimates are used.
+- ``max_tokens`` is estimated from the size of what the model has to write
+  back (e.g. the resume JSON it rewrites), clamped to the model's output limit.
+- Inputs are truncated only when the prompt would not fit, and then at
+  paragraph (or line) boundaries rather than mid-sentence.
+- A job description always keeps at least the old 2000-character allowance:
+  on small context windows ``max_tokens`` is reduced first, and the prompt is
+  allowed to run over rather than lose the job description.
+"""
+
+import asyncio
+import functools
+import logging
+from types import ModuleType
+from typing import Any
+
+from app import llm
+from app.config import settings
+from app.llm import get_llm_config, get_model_name, load_litellm
+from app.prompts.serialization import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+_budget_stats: dict[str, dict[str, int]] = {}
+_litellm_loading: asyncio.Task | None = None
+
+# Job description characters always sent (the former fixed cut-off)
+MIN_JOB_DESCRIPTION_CHARS = 2000
+
+
+def _current_model() -> str:
+    return get_model_name(get_llm_config())
+
+
+@functools.lru_cache(maxsize=64)
+def _counted_by_litellm(model_name: str) -> bool:
+    if model_name.startswith("ollama/"):
+        return False
+    config = get_llm_config()
+    return not (config.provider == "mock" and model_name == get_model_name(config))
+
+
+def _tokenizer(model_name: str) -> ModuleType | None:
+    """LiteLLM for counting `model_name`'s tokens, or None to use estimates.
+
+    Mock and Ollama calls never go through LiteLLM, so it is not loaded for
+    them. Otherwise it is imported here only outside an event loop; inside
+    one, `load_litellm()` is started in the background instead.
+    """
+    global _litellm_loading
+    if not _counted_by_litellm(model_name):
+        return None
+    if llm._litellm_module is not None:
+        return llm._litellm_module
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return llm._litellm()
+    if _litellm_loading is None or _litellm_loading.done():
+        _litellm_loading = asyncio.create_task(load_litellm())
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _litellm_limits(model_name: str) -> tuple[int, int]:
+    try:
+        info = llm._litellm().get_model_info(model_name)
+    except Exception:
+        info = {}
+    context = info.get("max_input_tokens") or settings.llm_default_context_window
+    output = info.get("max_output_tokens") or info.get("max_tokens") or context
+    return int(context), int(min(output, context))
+
+
+def model_limits(model_name: str) -> tuple[int, int]:
+    """Return `(context_window, max_output_tokens)` for a LiteLLM model name."""
+    if model_name.startswith("ollama/"):
+        # The context window is whatever num_ctx app.ollama asks for.
+        return settings.ollama_num_ctx_max, settings.ollama_num_ctx_max
+    if _tokenizer(model_name) is None:
+        # Not cached: the real limits are used once LiteLLM has loaded.
+        context = settings.llm_default_context_window
+        return context, context
+    return _litellm_limits(model_name)
+
+
+def count_tokens(text: str, model_name: str | None = None) -> int:
+    """Count tokens in `text` with the model's tokenizer."""
+    if not text:
+        return 0
+    model_name = model_name or _current_model()
+    litellm = _tokenizer(model_name)
+    if litellm is None:
+        return estimate_tokens(text)
+    try:
+        return int(litellm.token_counter(model=model_name, text=text))
+    except Exception:
+        return estimate_tokens(text)
+
+
+def _record(operation: str, max_tokens: int, truncated: bool = False) -> None:
+    stats = _budget_stats.setdefault(
+        operation, {"calls": 0, "max_tokens_requested": 0, "inputs_truncated": 0}
+    )
+    if max_tokens:
+        stats["calls"] += 1
+        stats["max_tokens_requested"] += max_tokens
+    if truncated:
+        stats["inputs_truncated"] += 1
+
+
+def output_budget(
+    operation: str,
+    output_source: str,
+    ratio: float | None = None,
+    model_name: str | None = None,
+) -> int:
+    """`max_tokens` for a call whose output is about as large as `output_source`.
+
+    Reserves `ratio` output tokens per token of `output_source` (e.g. the
+    resume the model rewrites), never fewer than `LLM_MIN_OUTPUT_TOKENS` and
+    never more than the model can produce.
+    """
+    model_name = model_name or _current_model()
+    _, max_output = model_limits(model_name)
+    ratio = ratio if ratio is not None else settings.llm_output_token_ratio
+    estimate = int(count_tokens(output_source, model_name) * ratio)
+    estimate += settings.llm_output_token_headroom
+    max_tokens = min(max(estimate, settings.llm_min_output_tokens), max_output)
+    _record(operation, max_tokens)
+    return max_tokens
+
+
+def input_budget(fixed_text: str, max_tokens: int, model_name: str | None = None) -> int:
+    """Tokens left for variable input once the fixed prompt and output are reserved."""
+    model_name = model_name or _current_model()
+    context, _ = model_limits(model_name)
+    used = count_tokens(fixed_text, model_name) + max_tokens
+    return max(0, context - used - settings.llm_context_safety_margin)
+
+
+def _leading_blocks(text: str, separator: str, budget: int, model_name: str) -> str:
+    """Longest run of whole leading `separator`-delimited blocks within `budget`."""
+    kept: list[str] = []
+    used = 0
+    for block in text.split(separator):
+        cost = count_tokens(block + separator, model_name)
+        if used + cost > budget:
+            break
+        kept.append(block)
+        used += cost
+    return separator.join(kept).strip()
+
+
+def fit_text(
+    operation: str,
+    text: str,
+    budget: int,
+    model_name: str | None = None,
+) -> tuple[str, bool]:
+    """Truncate `text` to `budget` tokens at paragraph or line boundaries.
+
+    Returns `(text, was_truncated)`; text that fits is returned unchanged.
+    """
+    model_name = model_name or _current_model()
+    if count_tokens(text, model_name) <= budget:
+        return text, False
+
+    result = (
+        _leading_blocks(text, "\n\n", budget, model_name)
+        or _leading_blocks(text, "\n", budget, model_name)
+        or _leading_blocks(text, " ", budget, model_name)
+    )
+    logger.warning(
+        "%s input truncated from %d to %d tokens to fit the %s context window",
+        operation,
+        count_tokens(text, model_name),
+        count_tokens(result, model_name),
+        model_name,
+    )
+    _record(operation, 0, truncated=True)
+    return result, True
+
+
+def fit_job_description(
+    operation: str,
+    job_description: str,
+    fixed_text: str,
+    max_tokens: int,
+    model_name: str | None = None,
+) -> tuple[str, int, bool]:
+    """Fit a job description into the context left by `fixed_text` and `max_tokens`.
+
+    The job description never gets less room than its first
+    `MIN_JOB_DESCRIPTION_CHARS` characters need. When the context is too
+    small for that, `max_tokens` is reduced (down to `LLM_MIN_OUTPUT_TOKENS`)
+    before the job description is cut further.
+
+    Returns `(job_description, max_tokens, was_truncated)`.
+    """
+    model_name = model_name or _current_model()
+    floor = count_tokens(job_description[:MIN_JOB_DESCRIPTION_CHARS], model_name)
+    budget = input_budget(fixed_text, max_tokens, model_name)
+    if budget < floor:
+        reduced = max(max_tokens - (floor - budget), min(max_tokens, settings.llm_min_output_tokens))
+        if reduced < max_tokens:
+            logger.warning(
+                "%s max_tokens reduced from %d to %d to leave room for the job description "
+                "in the %s context window",
+                operation,
+                max_tokens,
+                reduced,
+                model_name,
+            )
+            max_tokens = reduced
+            budget = input_budget(fixed_text, max_tokens, model_name)
+    if budget < floor:
+        logger.warning(
+            "%s prompt may exceed the %s context window; keeping %d job description tokens",
+            operation,
+            model_name,
+            floor,
+        )
+        budget = floor
+
+    fitted, truncated = fit_text(operation, job_description, budget, model_name)
+    if job_description.strip() and not fitted:
+        logger.error("%s job description did not fit at any boundary; sending its start", operation)
+        fitted = job_description[:MIN_JOB_DESCRIPTION_CHARS]
+    return fitted, max_tokens, truncated
+
+
+def get_token_budget_stats() -> dict[str, dict[str, Any]]:
+    """Per-operation average `max_tokens` requested and inputs truncated."""
+    return {
+        operation: {
+            **stats,
+            "avg_max_tokens": (
+                round(stats["max_tokens_requested"] / stats["calls"]) if stats["calls"] else 0
+            ),
+        }
+        for operation, stats in _budget_stats.items()
+    }
@@ -0,0 +1 @@
+"""Developer benchmarks for the backend (not part of the API)."""
@@ -0,0 +1,134 @@
+"""Load-test the tailoring pipeline against the built-in mock LLM provider.
+
+Usage (from apps/backend):
+    python -m benchmarks.load_test [--requests 50] [--concurrency 10]
+    python -m benchmarks.load_test --endpoint /resumes/improve --latency-ms 800 --error-rate 0.05
+
+Runs the FastAPI app in-process (no server needed) against a throwaway data
+directory configured with ``provider="mock"``, so no tokens are spent. Mock
+latency/token rate/error injection can be set with the flags below or the
+``MOCK_LLM_*`` environment variables. Reports throughput and latency
+percentiles of the backend, plus per-operation LLM latency as the backend saw it.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def _configure(args: argparse.Namespace) -> Path:
+    """Point the app at a temp data dir using the mock provider (before importing it)."""
+    data_dir = Path(tempfile.mkdtemp(prefix="cvfixer-load-"))
+    os.environ["DATA_DIR"] = str(data_dir)
+    os.environ["WARM_IMPORTS"] = "false"
+    os.environ["LLM_HEALTH_PROBE_ENABLED"] = "false"
+    for flag, env in (
+        ("latency_ms", "MOCK_LLM_LATENCY_MS"),
+        ("tokens_per_second", "MOCK_LLM_TOKENS_PER_SECOND"),
+        ("error_rate", "MOCK_LLM_ERROR_RATE"),
+        ("timeout_rate", "MOCK_LLM_TIMEOUT_RATE"),
+    ):
+        value = getattr(args, flag)
+        if value is not None:
+            os.environ[env] = str(value)
+    (data_dir / "config.json").write_text(
+        json.dumps({"provider": "mock", "model": "mock-model", "api_key": ""})
+    )
+    return data_dir
+
+
+async def _run(args: argparse.Namespace) -> int:
+    import httpx
+
+    from app.database import db
+    from app.latency import get_latency_stats
+    from app.main import app
+    from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+
+    resume_data = json.loads(RESUME_SCHEMA_EXAMPLE)
+    resume = db.create_resume(
+        content=json.dumps(resume_data),
+        content_type="json",
+        is_master=True,
+        processed_data=resume_data,
+        processing_status="ready",
+    )
+    jobs = [
+        db.create_job(
+            f"Backend Engineer {i} at Acme. We use Python, FastAPI, PostgreSQL, "
+            f"Kubernetes and AWS. Experience with Kafka and Terraform is a plus."
+        )
+        for i in range(args.requests)
+    ]
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://load-test/api/v1", timeout=None
+    ) as client:
+
+        async def one(job: dict) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post(
+                    args.endpoint,
+                    json={"resume_id": resume["resume_id"], "job_id": job["job_id"]},
+                )
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(job) for job in jobs))
+        wall = time.perf_counter() - started
+
+    print(f"endpoint:     POST /api/v1{args.endpoint}")
+    print(f"requests:     {args.requests} (concurrency {args.concurrency})")
+    print(f"statuses:     {dict(sorted(statuses.items()))}")
+    print(f"throughput:   {args.requests / wall:.2f} req/s over {wall:.2f}s")
+    print(
+        "latency (s):  "
+        f"p50 {_percentile(latencies, 0.5):.3f}  p90 {_percentile(latencies, 0.9):.3f}  "
+        f"p99 {_percentile(latencies, 0.99):.3f}  max {max(latencies):.3f}  "
+        f"mean {statistics.mean(latencies):.3f}"
+    )
+    print()
+    print("LLM calls by operation:")
+    for key, stats in get_latency_stats().items():
+        print(f"  {key:<32} n={stats['count']:<5} p50={stats.get('p50')}  p99={stats.get('p99')}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--endpoint", default="/resumes/improve/preview")
+    parser.add_argument("--latency-ms", type=float, help="Median mock LLM latency")
+    parser.add_argument("--tokens-per-second", type=float, help="Mock output token rate")
+    parser.add_argument("--error-rate", type=float, help="Fraction of mock calls failing")
+    parser.add_argument("--timeout-rate", type=float, help="Fraction of mock calls hanging")
+    args = parser.parse_args()
+
+    _configure(args)
+    # Pipeline warnings (e.g. truncation heuristics) would drown the report.
+    logging.basicConfig(level=logging.ERROR)
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
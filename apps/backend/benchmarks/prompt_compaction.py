@@ -0,0 +1,97 @@
+"""Benchmark prompt token savings from compact resume serialization.
+
+Usage (from apps/backend):
+    python -m benchmarks.prompt_compaction [resume.json | directory ...]
+    python -m benchmarks.prompt_compaction --model gpt-4o-mini data/resumes/
+
+Without arguments the corpus is the bundled example resume plus every
+processed resume in the local database. With ``--model`` token counts come
+from LiteLLM's tokenizer for that model instead of the character estimate.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from app.prompts.serialization import (
+    estimate_tokens,
+    serialize_reference_resume,
+    serialize_resume,
+)
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+
+
+def _load_corpus(paths: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    corpus: list[tuple[str, dict[str, Any]]] = []
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.json")))
+        else:
+            files.append(path)
+    for path in files:
+        data = json.loads(path.read_text())
+        if isinstance(data, dict):
+            corpus.append((path.name, data))
+
+    if not paths:
+        corpus.append(("schema_example", json.loads(RESUME_SCHEMA_EXAMPLE)))
+        from app.database import db
+
+        for resume in db.list_resumes():
+            if isinstance(resume.get("processed_data"), dict):
+                corpus.append((resume["resume_id"][:8], resume["processed_data"]))
+    return corpus
+
+
+def _token_counter(model: str | None) -> Callable[[str], int]:
+    if not model:
+        return estimate_tokens
+    import litellm
+
+    return lambda text: litellm.token_counter(model=model, text=text)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="Resume JSON files or directories")
+    parser.add_argument("--model", help="Count tokens with this model's tokenizer")
+    args = parser.parse_args()
+
+    corpus = _load_corpus(args.paths)
+    if not corpus:
+        print("No resumes found.", file=sys.stderr)
+        return 1
+    count = _token_counter(args.model)
+
+    header = f"{'resume':<20}{'indented':>10}{'compact':>10}{'saved':>8}{'pair':>10}{'pair+dedup':>12}{'saved':>8}"
+    print(header)
+    print("-" * len(header))
+    totals = [0, 0, 0, 0]
+    for name, resume in corpus:
+        indented = count(json.dumps(resume, indent=2))
+        compact = count(serialize_resume(resume))
+        # inject_keywords sends the tailored resume and the master together;
+        # an untouched copy is the upper bound for deduplication savings.
+        pair = indented * 2
+        pair_compact = compact + count(serialize_reference_resume(resume, resume))
+        totals = [t + v for t, v in zip(totals, (indented, compact, pair, pair_compact))]
+        print(
+            f"{name[:19]:<20}{indented:>10}{compact:>10}{1 - compact / indented:>8.0%}"
+            f"{pair:>10}{pair_compact:>12}{1 - pair_compact / pair:>8.0%}"
+        )
+
+    print("-" * len(header))
+    indented, compact, pair, pair_compact = totals
+    print(
+        f"{'total':<20}{indented:>10}{compact:>10}{1 - compact / indented:>8.0%}"
+        f"{pair:>10}{pair_compact:>12}{1 - pair_compact / pair:>8.0%}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Benchmark backend cold-start import time and memory.
+
+Usage (from apps/backend):
+    python -m benchmarks.startup [--runs 5] [--top 15] [--full]
+
+Each run imports ``app.main`` in a fresh interpreter under
+``python -X importtime`` and records wall time of the import plus peak RSS.
+``--full`` also imports the lazily loaded heavy modules (litellm, markitdown,
+playwright), i.e. the state after the background warmup thread finishes.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_CHILD = """
+import resource, sys, time
+start = time.perf_counter()
+import app.main
+if {full}:
+    import importlib
+    from app.llm import _litellm
+    _litellm()
+    for module in app.main.WARM_IMPORTS:
+        importlib.import_module(module)
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is KiB on Linux, bytes on macOS
+print(elapsed, rss / 1024 if sys.platform == "darwin" else rss)
+"""
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, str]]:
+    """Return (cumulative_us, module) pairs from `-X importtime` output."""
+    rows: list[tuple[int, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        rows.append((int(cumulative), name.strip()))
+    return rows
+
+
+def _run_once(full: bool) -> tuple[float, float, list[tuple[int, str]]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD.format(full=full)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, rss_kib = proc.stdout.split()
+    return float(elapsed), float(rss_kib) / 1024, _parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to average")
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level imports to list")
+    parser.add_argument("--full", action="store_true", help="Also import the lazy heavy modules")
+    args = parser.parse_args()
+
+    times: list[float] = []
+    rss: list[float] = []
+    modules: list[tuple[int, str]] = []
+    for _ in range(args.runs):
+        elapsed, rss_mib, modules = _run_once(args.full)
+        times.append(elapsed)
+        rss.append(rss_mib)
+
+    print(f"runs: {args.runs}{' (full)' if args.full else ''}")
+    print(f"import time: median {statistics.median(times) * 1000:.0f} ms, "
+          f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms")
+    print(f"peak RSS:    median {statistics.median(rss):.1f} MiB")
+    print()
+    print("slowest modules (last run, cumulative):")
+    top_level = [row for row in modules if "." not in row[1]]
+    for cumulative, name in sorted(top_level, reverse=True)[: args.top]:
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
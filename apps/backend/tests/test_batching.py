@@ -0,0 +1,113 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app import batching, deadline, mock_llm
+from app.config import settings
+from app.llm import LLMConfig
+from app.services.cover_letter import generate_resume_title
+from app.services.improver import extract_job_keywords
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+
+JOBS = [
+    "Backend Engineer at Acme\nPython, FastAPI and Postgres. Python daily.",
+    "Data Engineer at Globex\nSpark, Airflow and Kafka. Spark daily.",
+    "Frontend Engineer at Initech\nReact, TypeScript and Vite. React daily.",
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_provider():
+    with (
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+        patch("app.llm.get_llm_config", return_value=MOCK),
+        patch.dict(batching._batching_stats, clear=True),
+    ):
+        yield
+
+
+def test_concurrent_small_tasks_share_one_call_and_fan_out() -> None:
+    calls: list[str] = []
+    real = mock_llm.acompletion
+
+    async def counting(**kwargs):
+        calls.append(kwargs["messages"][-1]["content"])
+        return await real(**kwargs)
+
+    async def run() -> tuple[list, list]:
+        keywords = asyncio.gather(*(extract_job_keywords(job) for job in JOBS))
+        titles = asyncio.gather(*(generate_resume_title(job) for job in JOBS))
+        return await keywords, await titles
+
+    with patch.object(mock_llm, "acompletion", counting):
+        keywords, titles = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert [k["keywords"][0] for k in keywords] == ["Python", "Spark", "React"]
+    assert titles == ["Backend Engineer at Acme", "Data Engineer at Globex", "Frontend Engineer at Initech"]
+    stats = batching.get_batching_stats()
+    assert stats["extract_job_keywords"]["avg_batch_size"] == 3.0
+    assert stats["generate_resume_title"]["single_calls"] == 0
+
+
+def test_invalid_batched_items_fall_back_to_individual_calls() -> None:
+    real_respond = mock_llm._respond
+
+    def drop_second(system: str, prompt: str) -> str:
+        content = real_respond(system, prompt)
+        if "for each" in prompt:
+            data = json.loads(content)
+            data["results"] = [r for r in data["results"] if r["index"] != 1]
+            data["results"][0]["keywords"] = "not-a-list"
+            return json.dumps(data)
+        return content
+
+    async def run() -> list:
+        return await asyncio.gather(*(extract_job_keywords(job) for job in JOBS))
+
+    with patch.object(mock_llm, "_respond", drop_second):
+        keywords = asyncio.run(run())
+
+    assert [k["keywords"][0] for k in keywords] == ["Python", "Spark", "React"]
+    stats = batching.get_batching_stats()["extract_job_keywords"]
+    assert stats["fallbacks"] == 2
+    assert stats["single_calls"] == 2
+
+
+def test_each_caller_waits_under_its_own_deadline() -> None:
+    seen_deadlines: list[float | None] = []
+
+    async def slow_complete_json(**kwargs):
+        seen_deadlines.append(deadline.remaining())
+        await asyncio.sleep(0.05)
+        return {"results": [{"index": 0, "value": "a"}, {"index": 1, "value": "b"}]}
+
+    batcher = batching.MicroBatcher(
+        "test",
+        build_prompt=lambda items: ("system", "prompt"),
+        parse_result=lambda entry: entry["value"],
+        single=lambda item: asyncio.sleep(0, result=item),
+        max_tokens_per_item=16,
+        window=0.01,
+        max_size=8,
+    )
+
+    async def hurried() -> str:
+        with deadline.deadline_scope(0.02):
+            return await batcher.submit("a")
+
+    async def run() -> list:
+        return await asyncio.gather(hurried(), batcher.submit("b"), return_exceptions=True)
+
+    with patch.object(batching, "complete_json", side_effect=slow_complete_json):
+        first, second = asyncio.run(run())
+
+    # The first submitter's deadline neither bounds the shared call nor the other caller.
+    assert isinstance(first, deadline.DeadlineExceededError)
+    assert second == "b"
+    assert seen_deadlines == [None]
@@ -0,0 +1,108 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app import circuit_breaker, key_pool, llm
+from app.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    options = dict(window=60, min_calls=4, error_rate=0.5, timeout_rate=0.25, cooldown=0)
+    options.update(overrides)
+    return CircuitBreaker("openai:gpt-4o-mini", **options)
+
+
+def test_breaker_opens_on_error_rate_and_recovers_through_half_open() -> None:
+    breaker = _breaker(cooldown=30)
+    for _ in range(2):
+        breaker.record_success()
+        breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.allow_request() is False
+
+    breaker.cooldown = 0
+    assert breaker.allow_request() is True
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is False  # only one trial call
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_breaker_opens_on_timeout_rate_below_error_rate() -> None:
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_success()
+    breaker.record_failure(timeout=True)
+
+    assert breaker.state == OPEN
+
+
+def test_open_circuit_fails_fast_and_routes_to_fallback() -> None:
+    response = SimpleNamespace(usage=None)
+    acompletion = AsyncMock(return_value=response)
+    open_breaker = _breaker(cooldown=60)
+    open_breaker.state = OPEN
+    open_breaker._opened_at = time.monotonic()
+
+    async def call(fallback: str | None) -> dict:
+        kwargs = {"model": "gpt-4o-mini", "messages": []}
+        with (
+            patch.object(llm, "load_litellm", AsyncMock(return_value=SimpleNamespace(acompletion=acompletion))),
+            patch.object(llm, "_attach_http_client"),
+            patch.object(llm.settings, "llm_fallback_model", fallback),
+        ):
+            await llm._acompletion(kwargs, "openai")
+        return kwargs
+
+    with patch.dict(circuit_breaker._breakers, {"openai:gpt-4o-mini": open_breaker}, clear=True):
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(call(None))
+        acompletion.assert_not_awaited()
+
+        kwargs = asyncio.run(call("gpt-4.1-mini"))
+
+    assert kwargs["model"] == "gpt-4.1-mini"
+    acompletion.assert_awaited_once()
+
+
+def test_cancelled_half_open_trial_frees_the_trial_slot() -> None:
+    breaker = _breaker(cooldown=0)
+    breaker.state = OPEN
+    started = asyncio.Event()
+
+    async def hanging(**kwargs):
+        started.set()
+        await asyncio.sleep(60)
+
+    async def run() -> None:
+        kwargs = {"model": "gpt-4o-mini", "messages": []}
+        with (
+            patch.object(
+                llm, "load_litellm", AsyncMock(return_value=SimpleNamespace(acompletion=hanging))
+            ),
+            patch.object(llm, "_attach_http_client"),
+        ):
+            trial = asyncio.create_task(
+                llm._acompletion(kwargs, "openai", api_keys=["sk-primary-1111", "sk-secondary-2222"])
+            )
+            await started.wait()
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+
+    with (
+        patch.dict(circuit_breaker._breakers, {"openai:gpt-4o-mini": breaker}, clear=True),
+        patch.object(llm.settings, "llm_breaker_enabled", True),
+        patch.dict(key_pool._pools, {}, clear=True),
+    ):
+        asyncio.run(run())
+        keys = key_pool.get_key_pool_stats()["openai"]["keys"]
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is True
+    assert [state["in_flight"] for state in keys.values()] == [0, 0]
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import deadline, pipeline, prefetch
+from app.config import settings
+from app.database import Database
+from app.latency import latency_tracker
+from app.llm import LLMConfig, complete_json
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+from app.routers import resumes as resumes_router
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+
+
+@pytest.fixture(autouse=True)
+def mock_llm():
+    with (
+        patch("app.llm.get_llm_config", return_value=MOCK),
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+    ):
+        yield
+
+
+def test_llm_call_is_cut_off_at_the_request_deadline() -> None:
+    async def call() -> None:
+        with deadline.deadline_scope(0.1):
+            await complete_json("Job description:\nPython", retries=2)
+
+    with (
+        patch.object(settings, "mock_llm_latency_ms", 2000.0),
+        patch.object(settings, "mock_llm_latency_sigma", 0.0),
+    ):
+        start = time.monotonic()
+        with pytest.raises(deadline.DeadlineExceededError):
+            asyncio.run(call())
+
+    assert time.monotonic() - start < 1.0  # no retries after the deadline
+
+
+def test_nested_scope_only_shortens_the_deadline() -> None:
+    with deadline.deadline_scope(0.5):
+        with deadline.deadline_scope(60):
+            assert deadline.remaining() <= 0.5
+        deadline.drop("title")
+        assert deadline.dropped_passes() == ["title"]
+    assert deadline.remaining() is None
+    assert deadline.dropped_passes() == []
+
+
+def test_preview_drops_optional_passes_that_do_not_fit(tmp_path) -> None:
+    database = Database(tmp_path / "database.json")
+    resume = database.create_resume(
+        content=RESUME_SCHEMA_EXAMPLE,
+        content_type="json",
+        is_master=True,
+        processed_data=json.loads(RESUME_SCHEMA_EXAMPLE),
+        processing_status="ready",
+    )
+    job = database.create_job(
+        "Platform Engineer. Kubernetes, Terraform, Golang, Rust, Kafka, Spark and Airflow."
+    )
+    app = FastAPI()
+    app.include_router(resumes_router.router, prefix="/api/v1")
+
+    with (
+        patch.object(resumes_router, "db", database),
+        patch.object(pipeline, "db", database),
+        patch.object(prefetch, "db", database),
+        # Every further LLM call is expected to take longer than the time left.
+        patch.object(settings, "deadline_min_call_seconds", 1000.0),
+        patch.object(latency_tracker, "quantile", return_value=None),
+    ):
+        response = TestClient(app).post(
+            "/api/v1/resumes/improve/preview",
+            json={"resume_id": resume["resume_id"], "job_id": job["job_id"]},
+            headers={"X-Request-Deadline": "30"},
+        )
+    database.close()
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert "Skipped to meet the request deadline: keyword injection" in data["warnings"]
+    assert data["resume_preview"]["personalInfo"]
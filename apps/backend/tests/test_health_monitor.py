@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.health_monitor import LLMHealthMonitor
+from app.routers import health
+
+
+def test_next_delay_backs_off_on_failures_and_caps() -> None:
+    monitor = LLMHealthMonitor(interval=60, jitter=0, max_backoff=300)
+
+    assert monitor.next_delay() == 60
+    monitor.record({"healthy": False})
+    assert monitor.next_delay() == 120
+    for _ in range(5):
+        monitor.record({"healthy": False})
+    assert monitor.next_delay() == 300
+    monitor.record({"healthy": True})
+    assert monitor.next_delay() == 60
+
+
+def test_get_status_probes_once_then_serves_cache() -> None:
+    probe = AsyncMock(return_value={"healthy": True, "provider": "openai"})
+    monitor = LLMHealthMonitor(probe=probe)
+
+    async def run() -> None:
+        await monitor.get_status()
+        await monitor.get_status()
+
+    asyncio.run(run())
+
+    assert probe.await_count == 1
+    assert monitor.snapshot()["healthy"] is True
+
+
+def test_probe_exception_is_recorded_as_unhealthy() -> None:
+    monitor = LLMHealthMonitor(probe=AsyncMock(side_effect=RuntimeError("boom")))
+
+    status = asyncio.run(monitor.refresh())
+
+    assert status["healthy"] is False
+    assert monitor.snapshot()["consecutive_failures"] == 1
+
+
+def test_live_and_ready_endpoints_do_not_probe() -> None:
+    from app.main import app
+
+    probe = AsyncMock(return_value={"healthy": True})
+    monitor = LLMHealthMonitor(probe=probe)
+    client = TestClient(app)
+
+    with patch.object(health, "health_monitor", monitor):
+        assert client.get("/api/v1/health/live").status_code == 200
+        assert client.get("/api/v1/health/ready").status_code == 503
+        monitor.record({"healthy": True})
+        assert client.get("/api/v1/health/ready").status_code == 200
+
+    probe.assert_not_awaited()
@@ -0,0 +1,89 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.circuit_breaker import CircuitOpenError
+from app.config import settings
+from app.database import Database
+from app.routers import resumes as resumes_router
+from app.schemas import ImproveResumeData, ImproveResumeResponse, ResumeData
+
+
+@pytest.fixture
+def client(tmp_path):
+    database = Database(tmp_path / "database.json")
+    app = FastAPI()
+    app.include_router(resumes_router.router, prefix="/api/v1")
+    with patch.object(resumes_router, "db", database):
+        yield TestClient(app), database
+    database.close()
+
+
+def test_batch_streams_results_with_bounded_fan_out(client) -> None:
+    test_client, database = client
+    resume = database.create_resume(content="# Resume", is_master=True)
+    jobs = [database.create_job(f"Job {n}") for n in range(4)]
+    in_flight = 0
+    peak = 0
+    contexts = set()
+
+    async def fake_improve(resume, job, context):
+        nonlocal in_flight, peak
+        contexts.add(id(context))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        if job["content"] == "Job 2":
+            raise CircuitOpenError("openai:gpt", 10)
+        return ImproveResumeResponse(
+            request_id="r",
+            data=ImproveResumeData(
+                request_id="r",
+                resume_id=f"tailored-{job['job_id']}",
+                job_id=job["job_id"],
+                resume_preview=ResumeData(),
+                improvements=[],
+            ),
+        )
+
+    job_ids = [job["job_id"] for job in jobs] + ["missing", jobs[0]["job_id"]]
+    with (
+        patch.object(resumes_router, "_improve_for_job", side_effect=fake_improve),
+        patch.object(settings, "improve_batch_concurrency", 2),
+    ):
+        response = test_client.post(
+            f"/api/v1/resumes/{resume['resume_id']}/improve/batch",
+            json={"job_ids": job_ids},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    results = {line["job_id"]: line for line in lines[:-1]}
+    assert len(results) == 5  # duplicate job id tailored once
+    assert results[jobs[1]["job_id"]]["data"]["resume_id"] == f"tailored-{jobs[1]['job_id']}"
+    assert results[jobs[2]["job_id"]]["error"]["status_code"] == 503
+    assert results["missing"]["error"] == {
+        "status_code": 404,
+        "detail": "Job description not found",
+    }
+    summary = lines[-1]["summary"]
+    assert (summary["total"], summary["succeeded"], summary["failed"]) == (5, 3, 2)
+    assert peak == 2
+    assert len(contexts) == 1
+
+
+def test_batch_rejects_unknown_resume_and_empty_job_list(client) -> None:
+    test_client, database = client
+    assert test_client.post(
+        "/api/v1/resumes/missing/improve/batch", json={"job_ids": ["a"]}
+    ).status_code == 404
+    resume = database.create_resume(content="# Resume")
+    assert test_client.post(
+        f"/api/v1/resumes/{resume['resume_id']}/improve/batch", json={"job_ids": []}
+    ).status_code == 422
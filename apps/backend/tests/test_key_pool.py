@@ -0,0 +1,71 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app import key_pool, llm
+from app.key_pool import KeyPool, get_key_pool
+from app.llm import LLMConfig
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers={"retry-after": "30"})
+
+
+def test_least_loaded_spreads_concurrent_calls_and_round_robin_rotates() -> None:
+    pool = KeyPool("openai", ["sk-a", "sk-b", "sk-c"], strategy="least_loaded")
+    assert sorted(pool.acquire() for _ in range(3)) == ["sk-a", "sk-b", "sk-c"]
+
+    pool.release("sk-b")
+    assert pool.acquire() == "sk-b"
+
+    rr = KeyPool("openai", ["sk-a", "sk-b"], strategy="round_robin")
+    assert [rr.acquire() for _ in range(4)] == ["sk-a", "sk-b", "sk-a", "sk-b"]
+
+
+def test_rate_limited_key_is_cooled_down() -> None:
+    pool = KeyPool("openai", ["sk-test-aaaa", "sk-test-bbbb"], strategy="round_robin")
+    key = pool.acquire()
+    pool.release(key, error=True, cooldown=60)
+
+    assert [pool.acquire() for _ in range(3)] == ["sk-test-bbbb"] * 3
+    assert pool.snapshot()["keys"]["...aaaa"]["rate_limited"] == 1
+
+
+def test_config_key_pool_and_rotation_on_rate_limit() -> None:
+    config = LLMConfig(
+        provider="openai", model="gpt-4o-mini", api_key="sk-primary-1111", api_keys=["sk-second-2222"]
+    )
+    assert config.key_pool == ["sk-primary-1111", "sk-second-2222"]
+    assert get_key_pool("openai", ["sk-primary-1111"]) is None
+
+    used: list[str] = []
+    usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5)
+
+    async def acompletion(**kwargs):
+        used.append(kwargs["api_key"])
+        if kwargs["api_key"] == "sk-primary-1111":
+            raise RateLimitError()
+        return SimpleNamespace(usage=usage)
+
+    async def call() -> None:
+        kwargs = {"model": "gpt-4o-mini", "messages": [], "api_key": config.api_key}
+        await llm._acompletion(kwargs, "openai", api_keys=config.key_pool)
+
+    with (
+        patch.dict(key_pool._pools, {}, clear=True),
+        patch.object(llm, "load_litellm", AsyncMock(return_value=SimpleNamespace(acompletion=acompletion))),
+        patch.object(llm, "_attach_http_client"),
+        patch.object(llm.settings, "llm_breaker_enabled", False),
+    ):
+        asyncio.run(call())
+        asyncio.run(call())
+        stats = key_pool.get_key_pool_stats()["openai"]["keys"]
+
+    assert used == ["sk-primary-1111", "sk-second-2222", "sk-second-2222"]
+    assert stats["...1111"]["rate_limited"] == 1
+    assert stats["...1111"]["cooling_down_for"] > 0
+    assert stats["...2222"]["completion_tokens"] == 10
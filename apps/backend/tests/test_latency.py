@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+from app import llm
+from app.latency import LatencyHistogram, LatencyTracker, latency_operation
+
+
+def test_histogram_quantiles_and_buckets() -> None:
+    histogram = LatencyHistogram(size=100)
+    for seconds in range(1, 101):
+        histogram.record(seconds / 10)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["p50"] == 5.0
+    assert snapshot["p99"] == 9.9
+    assert snapshot["buckets"]["le_0.5"] == 5
+    assert sum(snapshot["buckets"].values()) == 100
+
+
+def test_calculate_timeout_switches_to_observed_latency() -> None:
+    tracker = LatencyTracker()
+
+    with patch.object(llm, "latency_tracker", tracker):
+        assert llm._calculate_timeout("json", 4096, "openai", "gpt-4o-mini") == 180
+
+        for _ in range(30):
+            tracker.record("gpt-4o-mini", latency_operation("json", 4096), 4.0)
+        assert llm._calculate_timeout("json", 4096, "openai", "gpt-4o-mini") == 12
+
+        # p99 x safety factor below the floor is clamped up to it
+        for _ in range(30):
+            tracker.record("gpt-4o-mini", latency_operation("completion", 4096), 0.5)
+        assert llm._calculate_timeout("completion", 4096, "openai", "gpt-4o-mini") == 10
+
+    assert tracker.snapshot()["gpt-4o-mini:json:8192"]["source"] == "adaptive"
+
+
+def test_small_calls_do_not_set_the_deadline_of_large_calls() -> None:
+    tracker = LatencyTracker()
+
+    with patch.object(llm, "latency_tracker", tracker):
+        for _ in range(100):
+            tracker.record("gpt-4o-mini", latency_operation("json", 256), 1.0)
+        assert llm._calculate_timeout("json", 256, "openai", "gpt-4o-mini") == 10
+        # No large calls observed yet: the static timeout still applies.
+        assert llm._calculate_timeout("json", 8192, "openai", "gpt-4o-mini") == 360
+
+        large = latency_operation("json", 8192)
+        for _ in range(30):
+            tracker.record("gpt-4o-mini", large, 20.0)
+        assert llm._calculate_timeout("json", 8192, "openai", "gpt-4o-mini") == 60
+
+        # A timeout under the adaptive deadline suspends it instead of being sampled.
+        tracker.record_timeout("gpt-4o-mini", large)
+        assert llm._calculate_timeout("json", 8192, "openai", "gpt-4o-mini") == 360
+        assert len(tracker._histograms[f"gpt-4o-mini:{large}"]) == 30
+
+    assert tracker.quantile("gpt-4o-mini", "json", 0.5) == 1.0
+
+
+def test_slow_model_timeout_grows_up_to_ceiling() -> None:
+    tracker = LatencyTracker()
+    for _ in range(30):
+        tracker.record("ollama/llama3", "json", 400.0)
+
+    assert tracker.deadline("ollama/llama3", "json") == 600
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def test_app_import_does_not_load_heavy_modules() -> None:
+    code = (
+        "import sys, app.main; "
+        "print(','.join(m for m in ('litellm', 'markitdown', 'playwright') if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+
+    assert proc.stdout.strip() == ""
+
+
+def test_token_budgets_never_import_litellm_on_the_event_loop() -> None:
+    code = """
+import asyncio, sys
+from unittest.mock import patch
+from app import token_budget
+from app.llm import LLMConfig
+
+async def budget(provider):
+    config = LLMConfig(provider=provider, model="gpt-4o-mini", api_key="")
+    with patch("app.token_budget.get_llm_config", return_value=config):
+        token_budget.output_budget("test", "word " * 100)
+        print(provider, "litellm" in sys.modules)
+        if token_budget._litellm_loading is not None:
+            await token_budget._litellm_loading
+            print("loaded", "litellm" in sys.modules)
+
+asyncio.run(budget("mock"))
+token_budget._counted_by_litellm.cache_clear()
+asyncio.run(budget("openai"))
+"""
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+
+    assert proc.stdout.split("\n")[:3] == ["mock False", "openai False", "loaded True"]
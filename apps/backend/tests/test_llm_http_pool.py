@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import litellm
+
+from app import llm
+from app.llm import _attach_http_client, close_http_pool, get_http_client, get_http_pool_stats
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_pooled_client_reuses_connections() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def run() -> None:
+        client = get_http_client("ollama")
+        for _ in range(3):
+            await client.get(url)
+        assert get_http_client("ollama") is client
+        await close_http_pool()
+
+    try:
+        with patch.dict(llm._pool_stats, clear=True):
+            asyncio.run(run())
+            stats = get_http_pool_stats()["ollama"]
+    finally:
+        server.shutdown()
+
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reuse_rate"] == 0.6667
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Answers chat completions with the Authorization header it received."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": self.headers["Authorization"]},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_attach_http_client_routes_providers_to_pool() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    async def run() -> list[str]:
+        anthropic_kwargs: dict = {}
+        _attach_http_client(anthropic_kwargs, "anthropic")
+        assert anthropic_kwargs["client"].client is get_http_client("anthropic")
+
+        # The OpenAI SDK client is passed per call and follows the call's key.
+        answers = []
+        for api_key in ("key-a", "key-b"):
+            openai_kwargs: dict = {
+                "model": "openai/gpt-4o-mini",
+                "messages": [{"role": "user", "content": "Hi"}],
+                "api_key": api_key,
+                "api_base": api_base,
+            }
+            _attach_http_client(openai_kwargs, "openai")
+            response = await litellm.acompletion(**openai_kwargs)
+            answers.append(response.choices[0].message.content)
+        assert litellm.aclient_session is None
+
+        await close_http_pool()
+        return answers
+
+    try:
+        with patch.dict(llm._pool_stats, clear=True):
+            answers = asyncio.run(run())
+            stats = get_http_pool_stats()["openai"]
+    finally:
+        server.shutdown()
+
+    assert answers == ["Bearer key-a", "Bearer key-b"]
+    assert (stats["requests"], stats["new_connections"]) == (2, 1)
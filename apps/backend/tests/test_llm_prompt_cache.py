@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app import llm
+from app.llm import LLMConfig, _build_messages, _record_usage, get_llm_usage_stats
+from app.services import improver
+
+
+def test_anthropic_system_prompt_gets_cache_breakpoint() -> None:
+    config = LLMConfig(provider="anthropic", model="claude-sonnet-4", api_key="k")
+
+    messages = _build_messages(config, "data", "static rules")
+
+    assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[0]["content"][0]["text"] == "static rules"
+    assert messages[1] == {"role": "user", "content": "data"}
+
+
+def test_openai_system_prompt_stays_plain_text() -> None:
+    config = LLMConfig(provider="openai", model="gpt-4o-mini", api_key="k")
+
+    messages = _build_messages(config, "data", "static rules")
+
+    assert messages[0] == {"role": "system", "content": "static rules"}
+
+
+def test_record_usage_tracks_cached_tokens() -> None:
+    usage = SimpleNamespace(
+        prompt_tokens=1000,
+        completion_tokens=50,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=800),
+    )
+
+    with patch.dict(llm._usage_stats, clear=True):
+        _record_usage("gpt-4o-mini", SimpleNamespace(usage=usage))
+        stats = get_llm_usage_stats()["gpt-4o-mini"]
+
+    assert stats["cached_tokens"] == 800
+    assert stats["cache_hit_ratio"] == 0.8
+
+
+def test_improve_prompt_keeps_static_blocks_in_system_prompt() -> None:
+    mock_complete = AsyncMock(return_value={"personalInfo": {"name": "Ada"}})
+
+    async def run(job_description: str) -> None:
+        await improver.improve_resume(
+            original_resume=f"Resume for {job_description}",
+            job_description=job_description,
+            job_keywords={"keywords": [job_description]},
+            prompt_id="full",
+        )
+
+    with patch.object(improver, "complete_json", mock_complete):
+        asyncio.run(run("Backend role"))
+        asyncio.run(run("Frontend role"))
+
+    first, second = mock_complete.await_args_list
+    assert first.kwargs["system_prompt"] == second.kwargs["system_prompt"]
+    assert "Backend role" not in first.kwargs["system_prompt"]
+    assert "Backend role" in first.kwargs["prompt"]
@@ -0,0 +1,63 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app import mock_llm
+from app.config import settings
+from app.llm import LLMConfig, check_llm_health, complete, complete_json
+from app.prompts.serialization import serialize_resume
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+from app.schemas import ResumeData
+from app.services.improver import extract_job_keywords, improve_resume
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+
+
+@pytest.fixture(autouse=True)
+def instant_mock():
+    with (
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+        patch.object(settings, "llm_retry_base_delay", 0.0),
+        patch("app.llm.get_llm_config", return_value=MOCK),
+    ):
+        yield
+
+
+def test_mock_pipeline_returns_schema_valid_deterministic_output() -> None:
+    job = "Backend Engineer at Acme. Python, FastAPI and Kubernetes. Python and FastAPI daily."
+    resume = json.loads(RESUME_SCHEMA_EXAMPLE)
+
+    async def run() -> tuple[dict, dict]:
+        keywords = await extract_job_keywords(job)
+        improved = await improve_resume(serialize_resume(resume), job, keywords)
+        return keywords, improved
+
+    keywords, improved = asyncio.run(run())
+
+    assert keywords["keywords"][:2] == ["Python", "FastAPI"]
+    ResumeData.model_validate(improved)
+    assert "FastAPI" in improved["additional"]["technicalSkills"]
+    assert asyncio.run(run()) == (keywords, improved)
+
+
+def test_mock_health_and_text_completion() -> None:
+    health = asyncio.run(check_llm_health(MOCK))
+    title = asyncio.run(
+        complete("Extract the job title and company name from this job description.\n\n"
+                 "Job Description:\nStaff Engineer @ Acme\n\nRules:\n- short")
+    )
+
+    assert health["healthy"] is True
+    assert title == "Staff Engineer @ Acme"
+
+
+def test_mock_error_injection_surfaces_as_llm_failure() -> None:
+    with patch.object(settings, "mock_llm_error_rate", 1.0):
+        with pytest.raises(mock_llm.MockLLMError):
+            asyncio.run(complete_json("Resume to parse:\nAda", retries=0))
+
+    mock_llm.reset()
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from app import ollama
+from app.llm import LLMConfig, close_http_pool, complete_json
+
+
+class _FakeOllama(BaseHTTPRequestHandler):
+    """Ollama-compatible stand-in recording requests and peak concurrency."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, dict]] = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append((self.path, payload))
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.active -= 1
+        body = {
+            "model": payload["model"],
+            "message": {"role": "assistant", "content": '{"ok": true}'},
+            "done": True,
+            "load_duration": 2_000_000_000 if self.path == "/api/generate" else 1_000_000,
+            "prompt_eval_count": 40,
+            "prompt_eval_duration": 100_000_000,
+            "eval_count": 20,
+            "eval_duration": 400_000_000,
+        }
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_ollama_preload_keep_alive_num_ctx_and_serialized_calls() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = LLMConfig(
+        provider="ollama",
+        model="llama3.1",
+        api_key="",
+        api_base=f"http://127.0.0.1:{server.server_address[1]}",
+    )
+    long_prompt = "Resume line with plenty of detail. " * 2000  # ~17.5k tokens
+
+    async def run() -> list[dict]:
+        await ollama.preload_model(config)
+        results = await asyncio.gather(
+            complete_json("Short prompt", config=config, max_tokens=1024),
+            complete_json(long_prompt, config=config, max_tokens=1024),
+            complete_json("Short prompt", config=config, max_tokens=1024),
+        )
+        await close_http_pool()
+        return results
+
+    try:
+        with (
+            patch.dict(ollama._num_ctx, clear=True),
+            patch.dict(ollama._timings, clear=True),
+            patch.dict(ollama._semaphores, clear=True),
+            patch.object(ollama.settings, "ollama_keep_alive", "-1"),
+        ):
+            results = asyncio.run(run())
+            stats = ollama.get_ollama_stats()["llama3.1"]
+    finally:
+        server.shutdown()
+
+    assert results == [{"ok": True}] * 3
+    preload, *chats = _FakeOllama.requests
+    assert preload[0] == "/api/generate"
+    assert preload[1]["keep_alive"] == -1
+    assert all(path == "/api/chat" and body["keep_alive"] == -1 for path, body in chats)
+    assert all(body["format"] == "json" for _, body in chats)
+
+    # The preload used the largest num_ctx, so no call asks for another one.
+    assert preload[1]["options"]["num_ctx"] == 32768
+    assert all(body["options"]["num_ctx"] == 32768 for _, body in chats)
+    assert _FakeOllama.peak == 1
+
+    # The model was loaded by the preload, so no chat call paid for a cold load.
+    assert stats["calls"] == 3
+    assert stats["cold_loads"] == 0
+    assert stats["eval_tokens_per_second"] == 50.0
+
+
+def test_num_ctx_grows_with_the_prompt_and_never_shrinks() -> None:
+    short = [{"role": "user", "content": "Short prompt"}]
+    long = [{"role": "user", "content": "Resume line with plenty of detail. " * 2000}]
+
+    with patch.dict(ollama._num_ctx, clear=True):
+        sizes = [
+            ollama.context_size("llama3.1", messages, 1024) for messages in (short, long, short)
+        ]
+
+    assert sizes == [4096, 20480, 20480]
@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app import pipeline
+from app.database import Database
+from app.pipeline import Stage, StageError, checkpoint_scope, run_stages
+
+
+def test_independent_stages_overlap_and_dependencies_are_respected() -> None:
+    order: list[str] = []
+
+    async def step(name: str, delay: float, *deps: str) -> str:
+        await asyncio.sleep(delay)
+        order.append(name)
+        return name + "".join(f"<{dep}" for dep in deps)
+
+    stages = [
+        Stage("keywords", lambda: step("keywords", 0.05)),
+        Stage("title", lambda: step("title", 0.05)),
+        Stage("improve", lambda kw: step("improve", 0.05, kw), deps=("keywords",)),
+        Stage("diff", lambda improved: f"diff<{improved}", deps=("improve",)),
+    ]
+
+    results, timings = asyncio.run(run_stages("test", stages))
+
+    assert results["diff"] == "diff<improve<keywords"
+    assert order.index("keywords") < order.index("improve")
+    # keywords and title run together: the total is the critical path, not the sum.
+    assert timings["total"] < 0.14
+    assert set(timings) == {"keywords", "title", "improve", "diff", "total"}
+
+
+def test_failing_stage_cancels_the_rest() -> None:
+    cancelled = False
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def slow() -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    stages = [
+        Stage("fail", fail),
+        Stage("slow", slow),
+        Stage("after", lambda _: None, deps=("fail",)),
+    ]
+
+    with pytest.raises(StageError) as error:
+        asyncio.run(run_stages("test", stages))
+
+    assert error.value.stage == "fail"
+    assert isinstance(error.value.error, RuntimeError)
+    assert cancelled
+
+    with pytest.raises(ValueError, match="undefined"):
+        asyncio.run(run_stages("test", [Stage("a", lambda b: b, deps=("b",))]))
+
+
+def test_failed_run_resumes_from_checkpoints(tmp_path) -> None:
+    database = Database(tmp_path / "database.json")
+    calls: list[str] = []
+    fail_refine = True
+
+    def keywords() -> dict:
+        calls.append("keywords")
+        return {"keywords": ["Python"]}
+
+    def improve(job_keywords: dict) -> tuple:
+        calls.append("improve")
+        return {"skills": job_keywords["keywords"]}, []
+
+    def refine(improved: tuple) -> tuple:
+        calls.append("refine")
+        if fail_refine:
+            raise TimeoutError("provider timed out")
+        return improved[0], ["refined"]
+
+    stages = [
+        Stage("keywords", keywords, checkpoint=True),
+        Stage("improve", improve, deps=("keywords",), checkpoint=True),
+        Stage("refine", refine, deps=("improve",), checkpoint=True),
+    ]
+    scope = checkpoint_scope(resume="r1", job="j1", prompt_id="keywords")
+
+    with patch.object(pipeline, "db", database):
+        with pytest.raises(StageError):
+            asyncio.run(run_stages("checkpointed", stages, scope=scope))
+        fail_refine = False
+        results, timings = asyncio.run(run_stages("checkpointed", stages, scope=scope))
+        leftover = len(database.checkpoints)
+        asyncio.run(run_stages("checkpointed", stages, scope=checkpoint_scope(job="j2")))
+    database.close()
+
+    assert calls == ["keywords", "improve", "refine", "refine", "keywords", "improve", "refine"]
+    assert results["improve"] == [{"skills": ["Python"]}, []]  # restored in JSON form
+    assert results["refine"] == ({"skills": ["Python"]}, ["refined"])
+    assert timings["keywords"] == timings["improve"] == 0.0
+    assert leftover == 0  # a completed run clears its checkpoints
+    assert pipeline.get_pipeline_stats()["checkpointed"]["stages_restored"] == 2
@@ -0,0 +1,89 @@
+import asyncio
+from unittest.mock import patch
+
+from app import deadline, prefetch
+from app.database import Database
+from app.routers import resumes as resumes_router
+
+KEYWORDS = {"keywords": ["Python", "Kafka"]}
+
+
+def test_improve_awaits_the_inflight_prefetch_instead_of_repeating_it(tmp_path) -> None:
+    database = Database(tmp_path / "database.json")
+    job = database.create_job("Data Engineer. Python and Kafka.")
+    calls: list[str] = []
+
+    async def slow_extract(content):
+        calls.append("keywords")
+        await asyncio.sleep(0.05)
+        return KEYWORDS
+
+    async def slow_title(content, language):
+        calls.append("title")
+        await asyncio.sleep(0.05)
+        return "Data Engineer"
+
+    async def upload_then_tailor():
+        prefetch.prefetch_job(job, "en")
+        # The improve endpoints load the job before the prefetch has stored anything.
+        return await asyncio.gather(prefetch.job_keywords(job), prefetch.job_title(job, "en"))
+
+    with (
+        patch.object(prefetch, "db", database),
+        patch.object(prefetch, "extract_job_keywords", side_effect=slow_extract),
+        patch.object(prefetch, "generate_resume_title", side_effect=slow_title),
+    ):
+        assert asyncio.run(upload_then_tailor()) == [KEYWORDS, "Data Engineer"]
+        assert sorted(calls) == ["keywords", "title"]
+
+        stored = database.get_job(job["job_id"])
+        assert stored["job_keywords"] == KEYWORDS and stored["job_keywords_hash"]
+        assert asyncio.run(prefetch.job_keywords(job)) == KEYWORDS
+        # A different language invalidates the stored title.
+        assert asyncio.run(prefetch.job_title(job, "de")) == "Data Engineer"
+    database.close()
+
+    assert sorted(calls) == ["keywords", "title", "title"]
+
+
+def test_prefetched_title_survives_a_tight_deadline(tmp_path) -> None:
+    database = Database(tmp_path / "database.json")
+    job = database.create_job("Data Engineer. Python and Kafka.")
+    seen_deadlines: list[float | None] = []
+
+    async def slow_title(content, language):
+        seen_deadlines.append(deadline.remaining())
+        await asyncio.sleep(0.05)
+        return "Data Engineer"
+
+    async def tailor_with_tight_deadline():
+        with deadline.deadline_scope(0.01):
+            # The shared call must not inherit the first caller's deadline.
+            prefetch.prefetch_job(job, "en")
+            first = await resumes_router._generate_optional(
+                "title",
+                prefetch.job_title(job, "en"),
+                prefetch.job_title_prefetched(job, "en"),
+            )
+            assert deadline.dropped_passes() == ["title"]
+        await asyncio.sleep(0.1)
+        with deadline.deadline_scope(0.01):
+            second = await resumes_router._generate_optional(
+                "title",
+                prefetch.job_title(job, "en"),
+                prefetch.job_title_prefetched(job, "en"),
+            )
+        return first, second
+
+    with (
+        patch.object(prefetch, "db", database),
+        patch.object(prefetch, "extract_job_keywords", return_value=KEYWORDS),
+        patch.object(prefetch, "generate_resume_title", side_effect=slow_title),
+        patch.object(resumes_router, "llm_call_fits_deadline", return_value=False),
+    ):
+        first, second = asyncio.run(tailor_with_tight_deadline())
+
+    database.close()
+    assert first == (None, [])
+    assert second == ("Data Engineer", [])
+    assert seen_deadlines == [None]
@@ -0,0 +1,125 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app import pipeline, prefetch
+from app.config import settings
+from app.database import Database
+from app.llm import LLMConfig
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+from app.routers import resumes as resumes_router
+from app.schemas import ImproveResumeConfirmRequest, ImproveResumeRequest, ResumeData
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+
+
+@pytest.fixture
+def preview_db(tmp_path):
+    database = Database(tmp_path / "database.json")
+    with (
+        patch.object(resumes_router, "db", database),
+        patch.object(pipeline, "db", database),
+        patch.object(prefetch, "db", database),
+        patch("app.llm.get_llm_config", return_value=MOCK),
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+    ):
+        yield database
+    database.close()
+
+
+def _preview(database: Database) -> tuple[dict, dict, object]:
+    resume = database.create_resume(
+        content=RESUME_SCHEMA_EXAMPLE,
+        content_type="json",
+        is_master=True,
+        processed_data=json.loads(RESUME_SCHEMA_EXAMPLE),
+        processing_status="ready",
+    )
+    job = database.create_job("Backend Engineer at Acme. Python, FastAPI and Kubernetes.")
+    preview = asyncio.run(
+        resumes_router.improve_resume_preview_endpoint(
+            ImproveResumeRequest(resume_id=resume["resume_id"], job_id=job["job_id"])
+        )
+    )
+    return resume, job, preview
+
+
+def test_confirm_saves_the_stored_preview_by_id(preview_db) -> None:
+    resume, job, preview = _preview(preview_db)
+    preview_id = preview.data.preview_id
+    stored = preview_db.get_preview(preview_id)["improved_data"]
+    assert ResumeData.model_validate(stored) == preview.data.resume_preview
+
+    confirmed = asyncio.run(
+        resumes_router.improve_resume_confirm_endpoint(
+            ImproveResumeConfirmRequest(
+                resume_id=resume["resume_id"], job_id=job["job_id"], preview_id=preview_id
+            )
+        )
+    )
+
+    saved = preview_db.get_resume(confirmed.data.resume_id)
+    assert saved["processed_data"] == stored
+    assert confirmed.data.diff_summary == preview.data.diff_summary
+    assert confirmed.data.improvements == preview.data.improvements
+    # Previews are single use.
+    assert preview_db.get_preview(preview_id) is None
+
+
+def test_confirm_rejects_expired_previews_and_checks_edits(preview_db) -> None:
+    resume, job, preview = _preview(preview_db)
+
+    def confirm(**kwargs):
+        return asyncio.run(
+            resumes_router.improve_resume_confirm_endpoint(
+                ImproveResumeConfirmRequest(
+                    resume_id=resume["resume_id"], job_id=job["job_id"], **kwargs
+                )
+            )
+        )
+
+    edited = preview.data.resume_preview.model_copy(deep=True)
+    edited.personalInfo.name = "Someone Else"
+    with pytest.raises(HTTPException, match="Invalid improved resume data"):
+        confirm(preview_id=preview.data.preview_id, improved_data=edited)
+
+    edited = preview.data.resume_preview.model_copy(deep=True)
+    edited.summary = "Edited summary."
+    confirmed = confirm(preview_id=preview.data.preview_id, improved_data=edited)
+    assert confirmed.data.resume_preview.summary == "Edited summary."
+
+    with patch.object(settings, "preview_ttl_seconds", -1):
+        expired = preview_db.create_preview({"resume_id": resume["resume_id"], "job_id": job["job_id"]})
+    with pytest.raises(HTTPException, match="Preview expired or not found"):
+        confirm(preview_id=expired["preview_id"])
+
+
+def test_repeat_preview_is_served_from_cache_until_master_changes(preview_db) -> None:
+    resume, job, first = _preview(preview_db)
+    request = ImproveResumeRequest(resume_id=resume["resume_id"], job_id=job["job_id"])
+
+    def preview(**kwargs):
+        return asyncio.run(
+            resumes_router.improve_resume_preview_endpoint(
+                request.model_copy(update=kwargs)
+            )
+        )
+
+    with patch.object(resumes_router, "run_stages", side_effect=AssertionError("not cached")):
+        cached = preview()
+    assert cached.data.cached and not first.data.cached
+    assert cached.data.preview_id != first.data.preview_id
+    assert cached.data.resume_preview == first.data.resume_preview
+    assert cached.data.diff_summary == first.data.diff_summary
+    assert cached.data.refinement_stats == first.data.refinement_stats
+    assert preview_db.get_preview(cached.data.preview_id)["improved_data"]
+
+    assert not preview(force=True).data.cached
+
+    preview_db.update_resume(resume["resume_id"], {"processed_data": json.loads(RESUME_SCHEMA_EXAMPLE)})
+    assert not preview().data.cached
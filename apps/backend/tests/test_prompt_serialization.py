@@ -0,0 +1,86 @@
+import json
+
+from app.prompts.serialization import (
+    compact_resume_text,
+    prune_empty,
+    restore_pruned,
+    serialize_reference_resume,
+    serialize_resume,
+)
+
+
+def test_serialize_resume_is_minified_and_drops_empty_fields() -> None:
+    resume = {
+        "personalInfo": {"name": "Ada", "website": None, "github": ""},
+        "summary": "",
+        "workExperience": [{"title": "Engineer", "description": []}],
+        "sectionMeta": [{"id": "summary", "key": "summary"}],
+        "customSections": {},
+    }
+
+    serialized = serialize_resume(resume)
+
+    assert "\n" not in serialized
+    assert json.loads(serialized) == {
+        "personalInfo": {"name": "Ada"},
+        "workExperience": [{"title": "Engineer"}],
+    }
+
+
+def test_prune_empty_keeps_list_positions() -> None:
+    data = {"workExperience": [{"title": ""}, {"title": "Engineer"}]}
+
+    assert prune_empty(data) == {"workExperience": [{}, {"title": "Engineer"}]}
+
+
+def test_restore_pruned_round_trips_llm_output() -> None:
+    resume = {
+        "personalInfo": {"name": "Ada", "website": None, "github": ""},
+        "summary": "",
+        "workExperience": [
+            {"title": "Engineer", "description": [], "location": None},
+            {"title": "", "description": ["Built APIs"]},
+        ],
+        "additional": {"technicalSkills": ["Python"], "languages": []},
+        "sectionMeta": [{"id": "summary", "key": "summary"}],
+        "customSections": {},
+    }
+    # The model echoes what it was sent, with its edits, but nothing pruned.
+    response = json.loads(serialize_resume(resume))
+    response["workExperience"][1]["description"] = ["Built payment APIs"]
+
+    restored = restore_pruned(response, resume)
+
+    expected = json.loads(json.dumps(resume))
+    expected["workExperience"][1]["description"] = ["Built payment APIs"]
+    assert restored == expected
+
+
+def test_reference_resume_omits_content_shared_with_current() -> None:
+    master = {
+        "summary": "Backend engineer",
+        "education": [{"institution": "MIT", "degree": "BSc"}],
+        "workExperience": [{"title": "Engineer", "description": ["Built APIs"]}],
+        "additional": {"technicalSkills": ["Python", "Go"]},
+    }
+    current = {
+        "summary": "Backend engineer focused on payments",
+        "education": [{"institution": "MIT", "degree": "BSc"}],
+        "workExperience": [{"title": "Engineer", "description": ["Built payment APIs"]}],
+        "additional": {"technicalSkills": ["python", "Kafka"]},
+    }
+
+    reference = json.loads(serialize_reference_resume(master, current))
+
+    assert reference == {
+        "summary": "Backend engineer",
+        "workExperience": [{"title": "Engineer", "description": ["Built APIs"]}],
+        "additional": {"technicalSkills": ["Go"]},
+    }
+
+
+def test_compact_resume_text_leaves_markdown_untouched() -> None:
+    markdown = "# Ada Lovelace\n\n- Built the analytical engine"
+
+    assert compact_resume_text(markdown) == markdown
+    assert compact_resume_text('{\n  "summary": "Hi",\n  "skills": []\n}') == '{"summary":"Hi"}'
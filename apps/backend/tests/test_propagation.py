@@ -0,0 +1,126 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app import pipeline, prefetch
+from app.config import settings
+from app.database import Database
+from app.llm import LLMConfig
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+from app.routers import resumes as resumes_router
+from app.schemas import ImproveResumeConfirmRequest, ImproveResumeRequest, ResumeData
+from app.services import improver
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+
+
+@pytest.fixture
+def tailored(tmp_path):
+    database = Database(tmp_path / "database.json")
+    with (
+        patch.object(resumes_router, "db", database),
+        patch.object(pipeline, "db", database),
+        patch.object(prefetch, "db", database),
+        patch("app.llm.get_llm_config", return_value=MOCK),
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+    ):
+        master = database.create_resume(
+            content=RESUME_SCHEMA_EXAMPLE,
+            content_type="json",
+            is_master=True,
+            processed_data=json.loads(RESUME_SCHEMA_EXAMPLE),
+            processing_status="ready",
+        )
+        job = database.create_job("Backend Engineer at Acme. Python, FastAPI and Kubernetes.")
+        request = {"resume_id": master["resume_id"], "job_id": job["job_id"]}
+        preview = asyncio.run(
+            resumes_router.improve_resume_preview_endpoint(ImproveResumeRequest(**request))
+        )
+        child = asyncio.run(
+            resumes_router.improve_resume_confirm_endpoint(
+                ImproveResumeConfirmRequest(**request, preview_id=preview.data.preview_id)
+            )
+        )
+        yield database, master, database.get_resume(child.data.resume_id)
+    database.close()
+
+
+def test_only_changed_master_sections_are_retailored(tailored) -> None:
+    database, master, child = tailored
+    edited = json.loads(RESUME_SCHEMA_EXAMPLE)
+    edited["summary"] = "Backend engineer focused on distributed systems."
+    edited["workExperience"] = edited["workExperience"][:1]
+    database.update_resume(master["resume_id"], {"processed_data": edited})
+
+    prompts: list[str] = []
+    complete_json = improver.complete_json
+
+    async def recording_complete_json(prompt, **kwargs):
+        prompts.append(prompt)
+        return await complete_json(prompt, **kwargs)
+
+    with patch.object(improver, "complete_json", side_effect=recording_complete_json):
+        result = asyncio.run(resumes_router._run_propagate_task({"resume_id": master["resume_id"]}))
+
+    outcome = result["children"][0]
+    assert (outcome["status"], outcome["sections"]) == ("updated", ["summary"])
+    assert len(prompts) == 1 and "Resume section (summary)" in prompts[0]
+
+    before = ResumeData.model_validate(child["processed_data"]).model_dump()
+    updated = database.get_resume(child["resume_id"])["processed_data"]
+    assert len(updated["workExperience"]) == 1
+    assert updated["workExperience"][0] == before["workExperience"][0]
+    assert updated["additional"] == before["additional"]
+
+    again = asyncio.run(resumes_router._run_propagate_task({"resume_id": master["resume_id"]}))
+    assert again["children"][0]["status"] == "skipped"
+    assert again["sections_retailored"] == 0
+
+
+def test_inserted_entry_is_the_only_one_retailored(tailored) -> None:
+    database, master, child = tailored
+    edited = json.loads(RESUME_SCHEMA_EXAMPLE)
+    new_entry = {**edited["workExperience"][0], "id": 7, "company": "Initech"}
+    edited["workExperience"].insert(0, new_entry)
+    database.update_resume(master["resume_id"], {"processed_data": edited})
+
+    prompts: list[str] = []
+    complete_json = improver.complete_json
+
+    async def recording_complete_json(prompt, **kwargs):
+        prompts.append(prompt)
+        return await complete_json(prompt, **kwargs)
+
+    with patch.object(improver, "complete_json", side_effect=recording_complete_json):
+        result = asyncio.run(resumes_router._run_propagate_task({"resume_id": master["resume_id"]}))
+
+    outcome = result["children"][0]
+    assert (outcome["status"], outcome["sections"]) == ("updated", ["workExperience#7"])
+    assert len(prompts) == 1 and "Initech" in prompts[0]
+
+    before = ResumeData.model_validate(child["processed_data"]).model_dump()
+    updated = database.get_resume(child["resume_id"])["processed_data"]
+    assert [entry["id"] for entry in updated["workExperience"]] == [7, 1]
+    assert updated["workExperience"][1] == before["workExperience"][0]
+
+
+def test_sections_edited_on_the_tailored_resume_are_kept(tailored) -> None:
+    database, master, child = tailored
+    child_data = dict(child["processed_data"], summary="My own words.")
+    database.update_resume(child["resume_id"], {"processed_data": child_data})
+    edited = json.loads(RESUME_SCHEMA_EXAMPLE)
+    edited["summary"] = "Backend engineer focused on distributed systems."
+    database.update_resume(master["resume_id"], {"processed_data": edited})
+
+    with patch.object(improver, "complete_json") as complete_json:
+        result = asyncio.run(resumes_router._run_propagate_task({"resume_id": master["resume_id"]}))
+
+    complete_json.assert_not_called()
+    outcome = result["children"][0]
+    assert outcome["sections"] == []
+    assert "summary" in outcome["warnings"][0]
+    assert database.get_resume(child["resume_id"])["processed_data"]["summary"] == "My own words."
@@ -0,0 +1,93 @@
+import asyncio
+import copy
+from unittest.mock import AsyncMock, patch
+
+from app.schemas.refinement import RefinementConfig
+from app.services import refiner
+from app.services.refiner import refine_resume
+
+MASTER = {
+    "personalInfo": {"name": "Ada"},
+    "summary": "Backend engineer.",
+    "workExperience": [
+        {"id": 1, "title": "Engineer", "company": "Acme", "description": ["Cut costs by 30%"]},
+        {"id": 2, "title": "Engineer", "company": "Initech", "description": ["Built APIs"]},
+    ],
+    "additional": {"technicalSkills": ["Python", "Docker"]},
+}
+KEYWORDS = {"keywords": ["Python", "Docker", "Kubernetes"], "seniority_level": "mid"}
+
+
+def _tailored() -> dict:
+    tailored = copy.deepcopy(MASTER)
+    tailored["additional"]["technicalSkills"].append("Kubernetes")
+    return tailored
+
+
+def test_metric_verification_skipped_without_new_numeric_claims() -> None:
+    verify = AsyncMock()
+    with patch.object(refiner, "verify_metrics", verify):
+        result = asyncio.run(refine_resume(_tailored(), MASTER, "Job", KEYWORDS))
+
+    verify.assert_not_called()
+    assert [(d.pass_name, d.action) for d in result.plan] == [("metric_verification", "skip")]
+    assert result.llm_calls_saved == 1
+    assert result.to_stats().llm_calls_saved == 1
+
+
+def test_metric_verification_narrowed_to_sections_with_new_claims() -> None:
+    tailored = _tailored()
+    tailored["workExperience"][1]["description"] = ["Built 40 APIs serving 2M users"]
+
+    async def fake_verify(resume, job_description, seniority):
+        assert [e["company"] for e in resume["workExperience"]] == ["Initech"]
+        assert "summary" not in resume
+        verified = copy.deepcopy(resume)
+        verified["workExperience"][0]["description"] = ["Built 12 APIs serving 200k users"]
+        return verified
+
+    with patch.object(refiner, "verify_metrics", side_effect=fake_verify):
+        result = asyncio.run(refine_resume(tailored, MASTER, "Job", KEYWORDS))
+
+    decision = result.plan[-1]
+    assert (decision.action, decision.reason) == (
+        "shrink",
+        "New numeric claims only in: workExperience[1]",
+    )
+    experience = result.refined_data["workExperience"]
+    assert experience[0]["description"] == ["Cut costs by 30%"]
+    assert experience[1]["description"] == ["Built 12 APIs serving 200k users"]
+
+
+def test_keyword_loop_stops_when_a_pass_loses_ground() -> None:
+    tailored = copy.deepcopy(MASTER)  # missing Kubernetes
+
+    async def lossy_inject(current, keywords, master, job_description):
+        injected = copy.deepcopy(current)
+        injected["additional"]["technicalSkills"] = ["Python"]  # dropped Docker
+        return injected
+
+    inject = AsyncMock(side_effect=lossy_inject)
+    with (
+        patch.object(refiner, "inject_keywords", inject),
+        patch.object(refiner, "verify_metrics", AsyncMock()),
+    ):
+        result = asyncio.run(refine_resume(tailored, MASTER, "Job", KEYWORDS))
+
+    assert inject.await_count == 1
+    keyword_plan = [d for d in result.plan if d.pass_name == "keyword_injection"]
+    assert [d.action for d in keyword_plan] == ["run", "skip"]
+    assert "gained -33.3 points" in keyword_plan[1].reason
+
+
+def test_planner_disabled_runs_every_pass() -> None:
+    verify = AsyncMock(side_effect=lambda resume, *args: resume)
+    with patch.object(refiner, "verify_metrics", verify):
+        result = asyncio.run(
+            refine_resume(
+                _tailored(), MASTER, "Job", KEYWORDS, config=RefinementConfig(enable_planner=False)
+            )
+        )
+
+    verify.assert_awaited_once()
+    assert result.plan == []
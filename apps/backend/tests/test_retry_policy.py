@@ -0,0 +1,88 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app import llm, retry_policy
+from app.llm import LLMConfig, complete_json
+from app.retry_policy import (
+    NON_RETRYABLE,
+    RATE_LIMITED,
+    TRANSIENT,
+    RetryBudget,
+    backoff_delay,
+    classify_error,
+    retry_after,
+)
+
+OPENAI = LLMConfig(provider="openai", model="gpt-4o-mini", api_key="sk-test")
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class ContextWindowExceededError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (asyncio.TimeoutError(), TRANSIENT),
+        (httpx.ConnectError("refused"), TRANSIENT),
+        (ProviderError(503), TRANSIENT),
+        (ProviderError(429), RATE_LIMITED),
+        (ProviderError(401), NON_RETRYABLE),
+        (ProviderError(400), NON_RETRYABLE),
+        (ContextWindowExceededError("too long"), NON_RETRYABLE),
+    ],
+)
+def test_classify_error(error: Exception, expected: str) -> None:
+    assert classify_error(error) == expected
+
+
+def test_rate_limited_backoff_honours_retry_after() -> None:
+    error = ProviderError(429, {"retry-after": "7"})
+
+    assert retry_after(error) == 7.0
+    assert backoff_delay(0, RATE_LIMITED, retry_after(error)) >= 7.0
+    assert 0 <= backoff_delay(3, TRANSIENT) <= retry_policy.settings.llm_retry_base_delay * 8
+
+
+def test_retry_budget_caps_retries_to_fraction_of_calls() -> None:
+    budget = RetryBudget(ratio=0.1, min_retries=1, window=60)
+    for _ in range(20):
+        budget.record_call()
+
+    granted = sum(budget.try_acquire() for _ in range(10))
+
+    assert granted == 3  # 1 + 0.1 * 20
+    assert budget.snapshot()["rejected"] == 7
+
+
+def test_complete_json_fails_fast_on_non_retryable_and_backs_off_on_transient() -> None:
+    ok = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"a": 1}'))])
+    sleep = AsyncMock()
+
+    with (
+        patch.object(retry_policy, "retry_budget", RetryBudget(ratio=1, min_retries=10)),
+        patch.object(retry_policy.asyncio, "sleep", sleep),
+    ):
+        failing = AsyncMock(side_effect=ProviderError(401))
+        with patch.object(llm, "_acompletion", failing):
+            with pytest.raises(ProviderError):
+                asyncio.run(complete_json("Hi", config=OPENAI))
+        assert failing.await_count == 1
+        sleep.assert_not_awaited()
+
+        flaky = AsyncMock(side_effect=[ProviderError(503), ProviderError(503), ok])
+        with patch.object(llm, "_acompletion", flaky):
+            assert asyncio.run(complete_json("Hi", config=OPENAI)) == {"a": 1}
+        assert flaky.await_count == 3
+        assert sleep.await_count == 2
@@ -0,0 +1,110 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.config import settings
+from app.llm import LLMConfig
+from app.mock_llm import _example_resume
+from app.prompts.serialization import prune_empty
+from app.schemas import ResumeData
+from app.schemas.models import DEFAULT_SECTION_META
+from app.services import improver
+from app.services.improver import improve_resume_by_section
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+JOB = "Senior Backend Engineer\nWe use Kubernetes, Terraform and Python daily."
+KEYWORDS = {"keywords": ["Kubernetes", "Terraform", "Python"]}
+
+
+@pytest.fixture(autouse=True)
+def instant_mock():
+    with (
+        patch("app.llm.get_llm_config", return_value=MOCK),
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+    ):
+        yield
+
+
+def test_sections_are_improved_concurrently_and_merged() -> None:
+    original = _example_resume()
+    prompts: list[tuple[str, str]] = []
+    complete_json = improver.complete_json
+
+    async def recording_complete_json(prompt, system_prompt=None, **kwargs):
+        prompts.append((system_prompt, prompt))
+        return await complete_json(prompt, system_prompt=system_prompt, **kwargs)
+
+    with patch.object(improver, "complete_json", side_effect=recording_complete_json):
+        improved, warnings = asyncio.run(
+            improve_resume_by_section(original, JOB, KEYWORDS, prompt_id="keywords")
+        )
+
+    assert warnings == []
+    sections = [prompt.split("Resume section (", 1)[1].split(")", 1)[0] for _, prompt in prompts]
+    assert "summary" in sections
+    assert "workExperience[0]" in sections
+    assert "additional" in sections
+    assert not any("personalInfo" in prompt for _, prompt in prompts)
+    assert len({system for system, _ in prompts}) == 1  # shared, cacheable prefix
+
+    assert improved["personalInfo"]["name"] == original["personalInfo"]["name"]
+    assert improved["workExperience"][0]["company"] == original["workExperience"][0]["company"]
+    assert {"Kubernetes", "Terraform"} <= set(improved["additional"]["technicalSkills"])
+
+
+def test_failed_section_keeps_original_content() -> None:
+    original = _example_resume()
+    original["workExperience"][0]["id"] = 7
+    complete_json = improver.complete_json
+
+    async def flaky_complete_json(prompt, system_prompt=None, **kwargs):
+        if "Resume section (summary)" in prompt:
+            raise ValueError("malformed JSON")
+        result = await complete_json(prompt, system_prompt=system_prompt, **kwargs)
+        if "Resume section (workExperience[0])" in prompt:
+            result["section"]["id"] = 99
+        return result
+
+    with patch.object(improver, "complete_json", side_effect=flaky_complete_json):
+        improved, warnings = asyncio.run(improve_resume_by_section(original, JOB, KEYWORDS))
+
+    assert improved["summary"] == original["summary"]
+    assert improved["workExperience"][0]["id"] == 7
+    assert len(warnings) == 1 and "summary" in warnings[0]
+
+
+def test_all_sections_failing_raises() -> None:
+    async def failing_complete_json(*args, **kwargs):
+        raise ValueError("provider down")
+
+    with patch.object(improver, "complete_json", side_effect=failing_complete_json):
+        with pytest.raises(ValueError, match="provider down"):
+            asyncio.run(improve_resume_by_section(_example_resume(), JOB, KEYWORDS))
+
+
+
+def test_whole_resume_improvement_keeps_section_meta_of_json_content() -> None:
+    original = ResumeData.model_validate(_example_resume()).model_dump(mode="json")
+    # Reordered, with education hidden
+    original["sectionMeta"] = [
+        {**meta, "isVisible": meta["key"] != "education", "order": 10 - meta["order"]}
+        for meta in ResumeData.model_validate(
+            {"sectionMeta": DEFAULT_SECTION_META}
+        ).model_dump(mode="json")["sectionMeta"]
+    ]
+    prompts: list[str] = []
+
+    async def echo(prompt, **kwargs):
+        # The model only sees the pruned resume, so that is all it can return.
+        prompts.append(prompt)
+        return prune_empty(original)
+
+    with patch.object(improver, "complete_json", side_effect=echo):
+        improved = asyncio.run(improver.improve_resume(json.dumps(original), JOB, KEYWORDS))
+
+    assert "sectionMeta" not in prompts[0]
+    assert ResumeData.model_validate(improved).model_dump(mode="json") == original
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app import llm
+from app.llm import LLMConfig, complete_json
+from app.schemas import JobKeywords, ResumeData
+
+OPENAI = LLMConfig(provider="openai", model="gpt-4o-mini", api_key="sk-test")
+
+KEYWORDS = {
+    "required_skills": ["Python"],
+    "preferred_skills": [],
+    "experience_requirements": [],
+    "education_requirements": [],
+    "key_responsibilities": [],
+    "keywords": ["Python"],
+    "experience_years": 3,
+    "seniority_level": "mid",
+}
+
+
+class RequestError(Exception):
+    status_code = 400
+
+
+def _response(content: str) -> SimpleNamespace:
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    with (
+        patch.object(llm, "_json_schema_unsupported", set()),
+        patch.object(llm, "_structured_output_stats", {}),
+        patch.object(llm, "load_litellm", AsyncMock()),
+        patch.object(llm, "_supports_json_schema", side_effect=lambda p, m: m not in llm._json_schema_unsupported),
+    ):
+        yield
+
+
+def test_schema_format_is_strict_unless_schema_has_free_form_maps() -> None:
+    keywords = llm._json_schema_format(JobKeywords)["json_schema"]
+    assert keywords["strict"] is True
+    assert keywords["schema"]["additionalProperties"] is False
+    assert set(keywords["schema"]["required"]) == set(JobKeywords.model_fields)
+
+    # customSections is a dict[str, CustomSection]: sent as a non-strict schema.
+    assert llm._json_schema_format(ResumeData)["json_schema"]["strict"] is False
+
+
+def test_rejected_schema_format_falls_back_to_json_mode() -> None:
+    formats: list[str] = []
+
+    async def acompletion(kwargs, provider=None, operation="completion", api_keys=None):
+        formats.append(kwargs["response_format"]["type"])
+        if kwargs["response_format"]["type"] == "json_schema":
+            raise RequestError("response_format json_schema is not supported")
+        return _response(json.dumps(KEYWORDS))
+
+    async def run() -> None:
+        for _ in range(2):
+            await complete_json("Extract", config=OPENAI, response_model=JobKeywords)
+
+    with patch.object(llm, "_acompletion", side_effect=acompletion):
+        asyncio.run(run())
+
+    assert formats == ["json_schema", "json_object", "json_object"]
+    stats = llm.get_structured_output_stats()["gpt-4o-mini"]
+    assert stats["schema_fallbacks"] == 1
+    assert stats["succeeded"] == 2
+
+
+def test_other_request_errors_do_not_disable_schema_format() -> None:
+    acompletion = AsyncMock(
+        side_effect=RequestError("This model's maximum context length is 128000 tokens")
+    )
+
+    with patch.object(llm, "_acompletion", acompletion):
+        with pytest.raises(Exception):
+            asyncio.run(complete_json("Extract", config=OPENAI, response_model=JobKeywords))
+
+    assert "gpt-4o-mini" not in llm._json_schema_unsupported
+    assert {call.args[0]["response_format"]["type"] for call in acompletion.await_args_list} == {
+        "json_schema"
+    }
+
+
+def test_invalid_result_is_retried_then_reported() -> None:
+    responses = [_response(json.dumps({"keywords": "Python"})), _response(json.dumps(KEYWORDS))]
+
+    with patch.object(llm, "_acompletion", AsyncMock(side_effect=responses)):
+        result = asyncio.run(complete_json("Extract", config=OPENAI, response_model=JobKeywords))
+
+    assert result == KEYWORDS
+    stats = llm.get_structured_output_stats()["gpt-4o-mini"]
+    assert stats["validation_failures"] == 1
+    assert stats["retry_rate"] == 1.0
+
+    with patch.object(llm, "_acompletion", AsyncMock(return_value=_response("{\"keywords\": 1}"))):
+        with pytest.raises(ValueError, match="schema validation"):
+            asyncio.run(complete_json("Extract", config=OPENAI, response_model=JobKeywords, retries=1))
@@ -0,0 +1,144 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app import pipeline, prefetch, tasks
+from app.config import settings
+from app.database import Database
+from app.llm import LLMConfig
+from app.prompts.templates import RESUME_SCHEMA_EXAMPLE
+from app.routers import resumes as resumes_router
+from app.routers.tasks import get_task
+from app.schemas import ImproveResumeRequest
+from app.tasks import TaskQueue, TaskQueueFullError
+
+MOCK = LLMConfig(provider="mock", model="mock-model", api_key="")
+
+
+@pytest.fixture
+def task_db(tmp_path):
+    database = Database(tmp_path / "database.json")
+    with (
+        patch.object(tasks, "db", database),
+        patch.object(resumes_router, "db", database),
+        patch.object(pipeline, "db", database),
+        patch.object(prefetch, "db", database),
+    ):
+        yield database
+    database.close()
+
+
+def test_workers_bound_concurrency_and_persist_outcomes(task_db) -> None:
+    queue = TaskQueue(workers=2, max_queued=10)
+    running = 0
+    peak = 0
+
+    async def handler(payload: dict) -> dict:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if payload["n"] == 3:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        return {"n": payload["n"] * 2}
+
+    queue.register("double", handler)
+
+    async def run() -> list[dict]:
+        submitted = [queue.submit("double", {"n": n}) for n in range(5)]
+        assert all(task["status"] == "queued" for task in submitted)
+        finished = [await queue.wait(task["task_id"], timeout=5) for task in submitted]
+        await queue.stop()
+        return finished
+
+    finished = asyncio.run(run())
+
+    assert peak == 2
+    assert [task["status"] for task in finished] == ["succeeded"] * 3 + ["failed", "succeeded"]
+    assert finished[4]["result"] == {"n": 8}
+    assert finished[3]["error"] == {"status_code": 404, "detail": "Resume not found"}
+    assert task_db.get_task(finished[0]["task_id"])["finished_at"]
+    stats = queue.snapshot()
+    assert (stats["submitted"], stats["succeeded"], stats["failed"]) == (5, 4, 1)
+
+
+def test_full_queue_rejects_and_restart_recovers_tasks(task_db) -> None:
+    queue = TaskQueue(workers=1, max_queued=1)
+
+    async def handler(payload: dict) -> dict:
+        return payload
+
+    queue.register("echo", handler)
+    interrupted = task_db.create_task("echo", {"n": 0})
+    task_db.update_task(interrupted["task_id"], {"status": "running"})
+    leftover = task_db.create_task("echo", {"n": 1})
+
+    async def run() -> dict:
+        queue.start()
+        with pytest.raises(TaskQueueFullError):
+            queue.submit("echo", {"n": 2})
+        result = await queue.wait(leftover["task_id"], timeout=5)
+        await queue.stop()
+        return result
+
+    assert asyncio.run(run())["result"] == {"n": 1}
+    assert task_db.get_task(interrupted["task_id"])["status"] == "failed"
+
+
+def test_finished_tasks_expire_and_abandoned_waits_are_dropped(task_db) -> None:
+    old = task_db.create_task("echo", {"n": 0})
+    task_db.update_task(old["task_id"], {"status": "succeeded", "finished_at": "2000-01-01T00:00:00+00:00"})
+    running = task_db.create_task("echo", {"n": 1})
+    assert task_db.get_task(old["task_id"]) is None
+    assert task_db.get_task(running["task_id"])["status"] == "queued"
+
+    queue = TaskQueue(workers=1)
+    assert asyncio.run(queue.wait(running["task_id"], timeout=0.01))["status"] == "queued"
+    assert queue._finished == {} and queue._waiting == {}
+
+
+def test_async_improve_preview_runs_the_pipeline_in_the_background(task_db) -> None:
+    resume = task_db.create_resume(
+        content=RESUME_SCHEMA_EXAMPLE,
+        content_type="json",
+        is_master=True,
+        processed_data=json.loads(RESUME_SCHEMA_EXAMPLE),
+        processing_status="ready",
+    )
+    job = task_db.create_job("Backend Engineer at Acme. Python, FastAPI and Kubernetes.")
+    request = ImproveResumeRequest(resume_id=resume["resume_id"], job_id=job["job_id"])
+    queue = TaskQueue(workers=1)
+    queue.register("improve_resume_preview", resumes_router._run_improve_preview_task)
+
+    async def run():
+        accepted = await resumes_router.improve_resume_preview_async_endpoint(request)
+        finished = await get_task(accepted.task_id, wait=30)
+        await queue.stop()
+        return accepted, finished
+
+    with (
+        patch.object(resumes_router, "task_queue", queue),
+        patch("app.routers.tasks.task_queue", queue),
+        patch("app.llm.get_llm_config", return_value=MOCK),
+        patch.object(settings, "mock_llm_latency_ms", 0.0),
+        patch.object(settings, "mock_llm_tokens_per_second", 0.0),
+        patch.object(settings, "llm_breaker_enabled", False),
+    ):
+        accepted, finished = asyncio.run(run())
+
+    assert accepted.status == "queued"
+    assert finished.status == "succeeded", finished.error
+    assert finished.result["data"]["job_id"] == job["job_id"]
+    assert finished.result["data"]["resume_preview"]["personalInfo"]
+
+    with pytest.raises(HTTPException) as missing:
+        asyncio.run(
+            resumes_router.improve_resume_preview_async_endpoint(
+                ImproveResumeRequest(resume_id="missing", job_id=job["job_id"])
+            )
+        )
+    assert missing.value.status_code == 404
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from app import token_budget
+from app.services import refiner
+from app.token_budget import count_tokens, fit_text, input_budget, model_limits, output_budget
+
+MODEL = "gpt-4o-mini"
+
+
+def test_model_limits_and_output_budget_scale_with_input() -> None:
+    context, max_output = model_limits(MODEL)
+    assert context == 128000 and max_output == 16384
+
+    small = output_budget("test", "word " * 100, model_name=MODEL)
+    large = output_budget("test", "word " * 6000, model_name=MODEL)
+    huge = output_budget("test", "word " * 60000, model_name=MODEL)
+
+    assert small == token_budget.settings.llm_min_output_tokens
+    assert small < large < huge == max_output
+    assert input_budget("x" * 100, 4000, MODEL) < context - 4000
+
+
+def test_fit_text_keeps_whole_paragraphs_and_only_truncates_when_needed() -> None:
+    text = "\n\n".join(f"Section {i}: " + "responsibility " * 50 for i in range(10))
+
+    assert fit_text("test", text, 10_000, MODEL) == (text, False)
+
+    fitted, truncated = fit_text("test", text, 200, MODEL)
+    assert truncated
+    assert count_tokens(fitted, MODEL) <= 200
+    # Leading whole sections only: nothing is cut mid-paragraph.
+    assert text.startswith(fitted)
+    assert fitted.endswith("responsibility")
+
+
+def test_job_description_is_no_longer_cut_at_fixed_length() -> None:
+    job_description = "Backend engineer. " * 400  # ~7200 characters
+    captured: dict = {}
+
+    async def fake_complete_json(prompt, system_prompt=None, max_tokens=4096, **kwargs):
+        captured.update(prompt=prompt, max_tokens=max_tokens)
+        return {"personalInfo": {}}
+
+    with (
+        patch.object(refiner, "complete_json", AsyncMock(side_effect=fake_complete_json)),
+        patch.object(token_budget, "_current_model", return_value=MODEL),
+    ):
+        asyncio.run(refiner.verify_metrics({"personalInfo": {"name": "A"}}, job_description, "mid"))
+
+    assert job_description in captured["prompt"]
+    assert captured["max_tokens"] < 8192
+
+
+def test_job_description_survives_on_unknown_model_with_small_context() -> None:
+    from app.mock_llm import _example_resume
+    from app.services import improver
+
+    resume = _example_resume()
+    entry = resume["workExperience"][0]
+    resume["workExperience"] = [
+        {
+            **entry,
+            "id": i,
+            "description": [
+                f"Led migration {i} of the billing platform to event-driven services, "
+                "cutting p99 latency and on-call load across three product teams."
+            ]
+            * 8,
+        }
+        for i in range(10)
+    ]
+    job_description = "\n\n".join(
+        f"Requirement {i}: experience operating Kafka, Kubernetes and Terraform at scale."
+        for i in range(60)
+    )
+    captured: dict = {}
+
+    async def fake_complete_json(prompt, system_prompt=None, max_tokens=4096, **kwargs):
+        captured.update(prompt=prompt, max_tokens=max_tokens)
+        return resume
+
+    model = "custom-proxy/unknown-model"
+    assert model_limits(model)[0] == token_budget.settings.llm_default_context_window
+    with (
+        patch.object(improver, "complete_json", AsyncMock(side_effect=fake_complete_json)),
+        patch.object(token_budget, "_current_model", return_value=model),
+    ):
+        asyncio.run(
+            improver.improve_resume(json.dumps(resume), job_description, {"keywords": ["Kafka"]})
+        )
+
+    assert count_tokens(json.dumps(resume), model) > 2500
+    # At least the old 2000-character allowance is always sent.
+    kept = job_description[: token_budget.MIN_JOB_DESCRIPTION_CHARS].rsplit("\n\n", 1)[0]
+    assert kept in captured["prompt"]
+    assert captured["max_tokens"] >= token_budget.settings.llm_min_output_tokens
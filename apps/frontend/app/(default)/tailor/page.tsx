@@ -7,7 +7,6 @@ import { Button } from '@/components/ui/button';
 import { Textarea } from '@/components/ui/textarea';
 import { useResumePreview } from '@/components/common/resume_previewer_context';
 import type { ImprovedResult } from '@/components/common/resume_previewer_context';
-import type { ResumeData } from '@/components/dashboard/resume-component';
 import {
   uploadJobDescriptions,
   previewImproveResume,
@@ -100,27 +99,14 @@ export default function TailorPage() {
     if (!masterResumeId) {
       throw new Error('Master resume ID is missing.');
     }
-    const resumePreview = result.data.resume_preview;
-    if (!resumePreview || typeof resumePreview !== 'object' || Array.isArray(resumePreview)) {
-      throw new Error('Resume preview data is invalid.');
-    }
-    const previewRecord = resumePreview as unknown as Record<string, unknown>;
-    if (
-      !previewRecord.personalInfo ||
-      typeof previewRecord.personalInfo !== 'object' ||
-      Array.isArray(previewRecord.personalInfo)
-    ) {
-      throw new Error('Resume preview data is invalid.');
+    const previewId = result.data.preview_id;
+    if (!previewId) {
+      throw new Error('Preview ID is missing.');
     }
     return {
       resume_id: masterResumeId,
       job_id: result.data.job_id,
-      improved_data: resumePreview as ResumeData,
-      improvements:
-        result.data.improvements?.map((item) => ({
-          suggestion: item.suggestion,
-          lineNumber: typeof item.lineNumber === 'number' ? item.lineNumber : null,
-        })) ?? [],
+      preview_id: previewId,
     };
   };
 
@@ -83,6 +83,7 @@ export interface Data {
   request_id: string;
   resume_id: string | null;
   job_id: string;
+  preview_id?: string | null;
   resume_preview: ResumePreview;
   details?: string;
   commentary?: string;
@@ -80,8 +80,11 @@ export interface ResumeUploadResponse {
 interface ImproveResumeConfirmRequest {
   resume_id: string;
   job_id: string;
-  improved_data: ResumeData;
-  improvements: Array<{
+  // Preview stored server-side by /improve/preview
+  preview_id: string;
+  // Only needed when the preview was edited before confirming
+  improved_data?: ResumeData;
+  improvements?: Array<{
     suggestion: string;
     lineNumber?: number | null;
   }>;
@@ -120,7 +120,7 @@ BACKEND_PID=$!
 # Wait for backend to be ready
 info "Waiting for backend to be ready..."
 for i in {1..30}; do
-    if curl -s "http://localhost:${BACKEND_PORT}/api/v1/health" > /dev/null 2>&1; then
+    if curl -s "http://localhost:${BACKEND_PORT}/api/v1/health/live" > /dev/null 2>&1; then
         status "Backend is ready (PID: $BACKEND_PID)"
         break
     fi